@@ -1,21 +1,95 @@
-from flask import Flask, request, jsonify, render_template, session, redirect, url_for
+from flask import Flask, Response, g, request, jsonify, render_template, send_file, send_from_directory, session, redirect, url_for
 from flask_cors import CORS
+import click
+from jinja2 import FileSystemBytecodeCache
 # Removed email sending to simplify deployment on Render
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 from functools import wraps
+from contextlib import contextmanager
 from werkzeug.utils import secure_filename
 import time
+import threading
+import json
+import zlib
+import base64
+import re
+import html
+import hashlib
+import hmac
+import bisect
+import tempfile
+import mimetypes
+import random
+import struct
+import mmap
+from urllib.parse import quote
+from concurrent.futures import Future
+from collections import OrderedDict, deque, namedtuple
 
-app = Flask(__name__)
-app.config['UPLOAD_FOLDER'] = 'uploads'
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: rate limits are then per process
+    fcntl = None
+
+# Serverless instances (Vercel sets VERCEL=1) pay for import and first render on every cold
+# start, so they skip work done ahead of requests such as warming the page cache
+FAST_START = os.environ.get('FAST_START', '1' if os.environ.get('VERCEL') else '0') not in ('0', 'false', 'False')
+# Compiled templates; `flask --app app compile-templates` fills it at build time. Serverless
+# instances can only write to the temp dir, so they fall back on JINJA_PRECOMPILED_DIR, which is
+# committed (`flask --app app compile-templates --precompiled` after editing a template)
+JINJA_CACHE_DIR = os.environ.get('JINJA_CACHE_DIR') or (
+    os.path.join(tempfile.gettempdir(), 'jinja-cache') if os.environ.get('VERCEL')
+    else os.path.join(os.path.dirname(os.path.abspath(__file__)), '.jinja-cache'))
+JINJA_PRECOMPILED_DIR = os.environ.get('JINJA_PRECOMPILED_DIR',
+                                       os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jinja-precompiled'))
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Jinja bytecode on disk, shared by workers and kept across restarts.
+
+    Entries are checked against the template source's checksum, so an
+    edited template is recompiled. Misses fall back to the read-only
+    `precompiled` directory; failing to store a new entry is not an error.
+    """
+
+    def __init__(self, directory, precompiled=None):
+        super().__init__(directory)
+        self.precompiled = FileSystemBytecodeCache(precompiled) if precompiled else None
+
+    def get_cache_key(self, name, filename=None):
+        # By name only: the default key includes the absolute path, which differs between checkouts
+        return super().get_cache_key(name)
+
+    def load_bytecode(self, bucket):
+        super().load_bytecode(bucket)
+        if bucket.code is None and self.precompiled is not None:
+            self.precompiled.load_bytecode(bucket)
+
+    def dump_bytecode(self, bucket):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+app = Flask(__name__, static_folder=None)  # /static is served by serve_static below
+app.config['UPLOAD_FOLDER'] = 'uploads'  # Created on first upload
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.jinja_options = {**app.jinja_options, 'bytecode_cache': TemplateBytecodeCache(JINJA_CACHE_DIR,
+                                                                                      JINJA_PRECOMPILED_DIR)}
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx'}
 
-# Create uploads directory if it doesn't exist
-if not os.path.exists(app.config['UPLOAD_FOLDER']):
-    os.makedirs(app.config['UPLOAD_FOLDER'])
 CORS(app)
 app.secret_key = os.environ.get('SECRET_KEY', 'necsprint-admin-secret-key-2024-change-in-production')
 
@@ -25,15 +99,397 @@ app.secret_key = os.environ.get('SECRET_KEY', 'necsprint-admin-secret-key-2024-c
 # Database configuration
 DB_PATH = os.environ.get('DATABASE_PATH', 'registrations.db')
 
-def get_conn():
-    # Use a connection timeout and allow cross-thread access in Gunicorn workers
-    conn = sqlite3.connect(DB_PATH, timeout=10, check_same_thread=False)
+# Tables whose version counters drive conditional GET responses
+VERSIONED_TABLES = ('registrations', 'submissions', 'announcements', 'notices', 'documents')
+
+# Live updates (/api/events)
+CHANGE_LOG_RETENTION = 1000  # change_log rows kept for Last-Event-ID resume
+CHANGE_POLL_INTERVAL = float(os.environ.get('CHANGE_POLL_INTERVAL', '0.5'))
+# The deploys run cooperative.CooperativeWorker, where streams are capped by SSE_MAX_GREENLET_CLIENTS.
+# Under gthread each stream would pin one of a few threads, so there the default 0 makes pages poll
+SSE_MAX_CLIENTS = int(os.environ.get('SSE_MAX_CLIENTS', '0'))
+SSE_MAX_DEV_CLIENTS = 50  # `python app.py`: the dev server starts a thread per connection
+SSE_MAX_GREENLET_CLIENTS = int(os.environ.get('SSE_MAX_GREENLET_CLIENTS', '1000'))  # under cooperative.CooperativeWorker
+SSE_MAX_DURATION = int(os.environ.get('SSE_MAX_DURATION', '300'))
+SSE_HEARTBEAT = 15
+SSE_RETRY_MS = 5000
+
+# In-process cache for the public read endpoints (0 disables the TTL)
+RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', '256'))
+RESPONSE_CACHE_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', '0'))
+
+# Response compression (pages, JSON, streamed exports); higher levels trade CPU for bytes
+GZIP_LEVEL = int(os.environ.get('GZIP_LEVEL', '6'))
+BROTLI_QUALITY = int(os.environ.get('BROTLI_QUALITY', '5'))
+ZSTD_LEVEL = int(os.environ.get('ZSTD_LEVEL', '3'))
+COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', '512'))
+COMPRESSIBLE_TYPES = ('text/html', 'text/plain', 'text/csv', 'text/css', 'application/json',
+                      'application/x-ndjson', 'application/javascript', 'image/svg+xml')
+
+# Group commit for registrations/submissions: wait this long for more inserts (0 = one transaction per request)
+WRITE_BATCH_WINDOW = float(os.environ.get('WRITE_BATCH_WINDOW_MS', '2')) / 1000
+WRITE_BATCH_MAX = int(os.environ.get('WRITE_BATCH_MAX', '64'))
+WRITE_BATCH_TIMEOUT = 30
+
+# Admission control for the public POST endpoints: token buckets per client and overall,
+# shared by all workers, then a bounded per-process queue in front of the write path
+ADMISSION_ENABLED = os.environ.get('ADMISSION_ENABLED', '1') not in ('0', 'false', 'False')
+# Keep concurrency + queue below the worker's thread count (16 in the Procfile) so reads and fast
+# rejections always find a thread; concurrency also bounds how many rows one group commit can carry
+ADMISSION_CONCURRENCY = int(os.environ.get('ADMISSION_CONCURRENCY', '8'))  # writes handled at once per process
+ADMISSION_QUEUE = int(os.environ.get('ADMISSION_QUEUE', '4'))  # writes allowed to wait for a slot
+ADMISSION_MAX_WAIT = float(os.environ.get('ADMISSION_MAX_WAIT', '1'))
+TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', '0'))  # X-Forwarded-For hops added by our own proxies
+RATE_LIMIT_SLOTS = 4096
+
+# Online backups (see Backups); BACKUP_INTERVAL_HOURS=0 leaves only admin-triggered snapshots
+BACKUP_DIR = os.environ.get('BACKUP_DIR') or os.path.join(os.path.dirname(os.path.abspath(DB_PATH)), 'backups')
+BACKUP_KEEP = int(os.environ.get('BACKUP_KEEP', '14'))
+BACKUP_INTERVAL = float(os.environ.get('BACKUP_INTERVAL_HOURS', '0')) * 3600
+BACKUP_CHECK_INTERVAL = 60
+BACKUP_PAGES_PER_STEP = int(os.environ.get('BACKUP_PAGES_PER_STEP', '64'))
+BACKUP_DUTY = float(os.environ.get('BACKUP_DUTY', '0.2'))  # share of wall time a backup may spend working
+# name -> (per-client rate/s, per-client burst, global rate/s, global burst); RATE_LIMIT_<NAME>=a,b,c,d overrides.
+# Per-client limits are loose because a whole venue or campus can share one address.
+RATE_LIMITS = {
+    'register': (1, 20, 100, 200),
+    'submit': (1, 20, 50, 100),
+    'login': (0.2, 10, 10, 20),
+}
+for _name in RATE_LIMITS:
+    if os.environ.get(f'RATE_LIMIT_{_name.upper()}'):
+        RATE_LIMITS[_name] = tuple(float(v) for v in os.environ[f'RATE_LIMIT_{_name.upper()}'].split(','))
+
+# PRAGMAs applied once when a connection is opened
+DB_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA cache_size=-8000',  # 8 MB page cache per connection
+)
+
+# Metrics: each process snapshots to METRICS_DIR/<pid>.json, /admin/metrics sums them
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1') not in ('0', 'false', 'False')
+METRICS_DIR = os.environ.get('METRICS_DIR') or os.path.join(
+    tempfile.gettempdir(), f"necsprint-metrics-{zlib.crc32(os.path.abspath(DB_PATH).encode()):08x}")
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', '5'))
+RATE_LIMIT_FILE = os.environ.get('RATE_LIMIT_FILE') or os.path.join(METRICS_DIR, 'rate-limits.bin')
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')  # lets a scraper use "Authorization: Bearer <token>"
+
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+# name -> (type, help, histogram buckets)
+METRIC_TYPES = {
+    'http_requests_total': ('counter', 'Requests by endpoint, method and status.', None),
+    'http_request_duration_seconds': ('histogram', 'Time to produce a response (not to finish streaming it).', HTTP_BUCKETS),
+    'http_requests_in_flight': ('gauge', 'Requests currently being handled (compare with the thread count).', None),
+    'http_upload_bytes_total': ('counter', 'Request body bytes received.', None),
+    'db_query_duration_seconds': ('histogram', 'SQLite statement execution time by leading keyword.', DB_BUCKETS),
+    'db_fetch_seconds_total': ('counter', 'Time spent fetching result rows.', None),
+    'db_commit_duration_seconds': ('histogram', 'SQLite commit time.', DB_BUCKETS),
+    'db_lock_wait_seconds': ('histogram', 'Time BEGIN IMMEDIATE waited for the write lock (busy_timeout).', DB_BUCKETS),
+    'db_locked_errors_total': ('counter', '"database is locked" errors after busy_timeout ran out.', None),
+    'db_lock_retries_total': ('counter', 'Statements retried by execute_with_retry.', None),
+    'admission_rejected_total': ('counter', 'Writes turned away: 429 by rate limit, 503 by a full or slow admission queue.', None),
+    'admission_wait_seconds': ('histogram', 'Time admitted writes waited in the admission queue.', HTTP_BUCKETS),
+}
+
+class Metrics:
+    """Counters, gauges and histograms for one process.
+
+    Every METRICS_FLUSH_INTERVAL seconds a snapshot is written to
+    METRICS_DIR/<pid>.json; collect() sums the snapshots of every worker
+    (gauges only from live ones) into the Prometheus text format.
+    """
+
+    def __init__(self, directory, flush_interval, enabled=True):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._values = {}  # (name, labels) -> number, or [count per bucket..., +Inf count, sum] for histograms
+        self._dirty = False
+        self._pid = None
+
+    def _check_process(self):
+        # Called under the lock: start afresh in a new (forked) process
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._values.clear()
+            threading.Thread(target=self._run, name='metrics-flush', daemon=True).start()
+
+    def inc(self, name, labels=(), value=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._check_process()
+            key = (name, labels)
+            self._values[key] = self._values.get(key, 0) + value
+            self._dirty = True
+
+    def observe(self, name, labels, value):
+        if not self.enabled:
+            return
+        buckets = METRIC_TYPES[name][2]
+        with self._lock:
+            self._check_process()
+            histogram = self._values.get((name, labels))
+            if histogram is None:
+                histogram = self._values[(name, labels)] = [0] * (len(buckets) + 1) + [0.0]
+            histogram[bisect.bisect_left(buckets, value)] += 1
+            histogram[-1] += value
+            self._dirty = True
+
+    def record_request(self, endpoint, method, status, upload_bytes, elapsed):
+        # All per-request updates under a single lock acquisition
+        buckets = METRIC_TYPES['http_request_duration_seconds'][2]
+        labels = (('endpoint', endpoint),)
+        total_key = ('http_requests_total', labels + (('method', method), ('status', status)))
+        with self._lock:
+            self._check_process()
+            self._values[('http_requests_in_flight', ())] = self._values.get(('http_requests_in_flight', ()), 0) - 1
+            self._values[total_key] = self._values.get(total_key, 0) + 1
+            if upload_bytes:
+                upload_key = ('http_upload_bytes_total', labels)
+                self._values[upload_key] = self._values.get(upload_key, 0) + upload_bytes
+            histogram = self._values.get(('http_request_duration_seconds', labels))
+            if histogram is None:
+                histogram = self._values[('http_request_duration_seconds', labels)] = [0] * (len(buckets) + 1) + [0.0]
+            histogram[bisect.bisect_left(buckets, elapsed)] += 1
+            histogram[-1] += elapsed
+            self._dirty = True
+
+    def flush(self):
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            snapshot = [[name, list(labels), value] for (name, labels), value in self._values.items()]
+            self._dirty = False
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f'{os.getpid()}.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(path + '.tmp', path)
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            if self._dirty:
+                try:
+                    self.flush()
+                except OSError as e:
+                    print(f"Metrics flush error: {e}")
+
+    def collect(self):
+        self.flush()
+        totals = {}
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                pid = int(filename[:-5])
+                with open(os.path.join(self.directory, filename)) as f:
+                    snapshot = json.load(f)
+            except (ValueError, OSError):
+                continue
+            alive = _process_alive(pid)
+            for name, labels, value in snapshot:
+                if name not in METRIC_TYPES or (METRIC_TYPES[name][0] == 'gauge' and not alive):
+                    continue
+                key = (name, tuple(tuple(label) for label in labels))
+                if isinstance(value, list):
+                    total = totals.setdefault(key, [0] * len(value))
+                    totals[key] = [a + b for a, b in zip(total, value)]
+                else:
+                    totals[key] = totals.get(key, 0) + value
+        lines = []
+        for name, (kind, help_text, buckets) in METRIC_TYPES.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for (metric, labels), value in sorted(totals.items()):
+                if metric != name:
+                    continue
+                if kind != 'histogram':
+                    lines.append(f'{name}{_format_labels(labels)} {value}')
+                    continue
+                cumulative = 0
+                for bound, count in zip(buckets + ('+Inf',), value[:-1]):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{_format_labels(labels + (("le", str(bound)),))} {cumulative}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {value[-1]}')
+                lines.append(f'{name}_count{_format_labels(labels)} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+def _process_alive(pid):
     try:
-        conn.execute('PRAGMA busy_timeout=5000')
-    except Exception:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
         pass
+    return True
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels) + '}'
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+metrics = Metrics(METRICS_DIR, METRICS_FLUSH_INTERVAL, METRICS_ENABLED)
+
+_statement_metrics = {}  # SQL text -> (histogram, labels); statements are mostly constant strings
+
+def _statement_metric(sql):
+    metric = _statement_metrics.get(sql)
+    if metric is None:
+        words = sql.split(None, 2)
+        keyword = words[0].upper() if words else ''
+        if keyword == 'BEGIN' and len(words) > 1 and words[1].upper() == 'IMMEDIATE':
+            metric = ('db_lock_wait_seconds', ())
+        else:
+            metric = ('db_query_duration_seconds', (('statement', keyword),))
+        if len(_statement_metrics) < 1024:
+            _statement_metrics[sql] = metric
+    return metric
+
+def _timed_statement(sql, run, *args):
+    start = time.perf_counter()
+    try:
+        return run(*args)
+    except sqlite3.OperationalError as e:
+        if 'database is locked' in str(e).lower():
+            metrics.inc('db_locked_errors_total')
+        raise
+    finally:
+        metrics.observe(*_statement_metric(sql), time.perf_counter() - start)
+
+class MeteredCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        return _timed_statement(sql, super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return _timed_statement(sql, super().executemany, sql, seq_of_parameters)
+
+    def _timed_fetch(self, fetch, *args):
+        start = time.perf_counter()
+        try:
+            return fetch(*args)
+        finally:
+            metrics.inc('db_fetch_seconds_total', (), time.perf_counter() - start)
+
+    def fetchone(self):
+        return self._timed_fetch(super().fetchone)
+
+    def fetchmany(self, size=None):
+        return self._timed_fetch(super().fetchmany, size if size is not None else self.arraysize)
+
+    def fetchall(self):
+        return self._timed_fetch(super().fetchall)
+
+class MeteredConnection(sqlite3.Connection):
+    """Connection whose cursors record statement, fetch, commit and lock-wait times."""
+
+    def cursor(self, factory=MeteredCursor):
+        return super().cursor(factory)
+
+    # Connection.execute* create their cursor internally, bypassing cursor()
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self):
+        start = time.perf_counter()
+        try:
+            return super().commit()
+        finally:
+            metrics.observe('db_commit_duration_seconds', (), time.perf_counter() - start)
+
+# One long-lived connection per worker thread
+_db_local = threading.local()
+
+def _connect():
+    # Use a connection timeout and allow cross-thread access in Gunicorn workers
+    conn = sqlite3.connect(DB_PATH, timeout=10, check_same_thread=False, cached_statements=256,
+                           factory=MeteredConnection if metrics.enabled else sqlite3.Connection)
+    for pragma in DB_PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError:
+            pass
+    return conn
+
+def get_conn():
+    # Reuse this thread's connection; reopen after a fork (Gunicorn workers) or a discard
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None or _db_local.pid != os.getpid():
+        conn = _connect()
+        ensure_schema(conn)
+        _db_local.conn = conn
+        _db_local.pid = os.getpid()
     return conn
 
+def discard_conn():
+    conn = getattr(_db_local, 'conn', None)
+    _db_local.conn = None
+    # A connection inherited across fork belongs to the parent, so just drop it
+    if conn is not None and _db_local.pid == os.getpid():
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+@app.teardown_request
+def release_conn(exc):
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None or _db_local.pid != os.getpid():
+        return
+    # Never leave a transaction (and the write lock) open between requests
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error:
+        discard_conn()
+        return
+    if isinstance(exc, sqlite3.DatabaseError) and not isinstance(exc, sqlite3.IntegrityError):
+        discard_conn()
+
+class RequestMetrics:
+    """WSGI middleware recording per-endpoint latency and status counts, in-flight requests and upload bytes.
+
+    Wrapping wsgi_app avoids request/g proxy lookups, which cost more than the bookkeeping.
+    """
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        if not metrics.enabled:
+            return self.wsgi_app(environ, start_response)
+        seen = ['unmatched', '500']  # endpoint, status
+
+        def capture_status(status_line, headers, exc_info=None):
+            # Flask clears environ['werkzeug.request'] once the request context is popped
+            rule = getattr(environ.get('werkzeug.request'), 'url_rule', None)
+            if rule is not None:
+                seen[0] = rule.endpoint
+            seen[1] = status_line.split(None, 1)[0]
+            return start_response(status_line, headers, exc_info)
+
+        start = time.perf_counter()
+        metrics.inc('http_requests_in_flight')
+        try:
+            return self.wsgi_app(environ, capture_status)
+        finally:
+            metrics.record_request(seen[0], environ.get('REQUEST_METHOD', ''), seen[1],
+                                   int(environ.get('CONTENT_LENGTH') or 0), time.perf_counter() - start)
+
+app.wsgi_app = RequestMetrics(app.wsgi_app)
+
 def execute_with_retry(cursor, query, params=(), retries=5, delay=0.2):
     for attempt in range(retries):
         try:
@@ -41,6 +497,7 @@ def execute_with_retry(cursor, query, params=(), retries=5, delay=0.2):
             return True
         except sqlite3.OperationalError as e:
             if 'database is locked' in str(e).lower() and attempt < retries - 1:
+                metrics.inc('db_lock_retries_total')
                 time.sleep(delay)
                 continue
             raise
@@ -57,24 +514,438 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
-def init_db():
-    # Ensure directory exists for DB_PATH if a nested path is provided
-    try:
-        db_dir = os.path.dirname(DB_PATH)
-        if db_dir and not os.path.exists(db_dir):
-            os.makedirs(db_dir, exist_ok=True)
-    except Exception:
-        pass
+class TokenBuckets:
+    """Token buckets shared by every worker process through an mmap'd file.
+
+    The file is a fixed table of (key hash, tokens, last refill) records. A
+    key lives in one of PROBE slots after its hash and, when all of them are
+    taken, replaces the one refilled longest ago. flock serialises updates
+    across processes, a thread lock within one.
+    """
+
+    RECORD = struct.Struct('<Qdd')
+    PROBE = 8
+
+    def __init__(self, path, slots):
+        self.path = path
+        self.slots = slots
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def _open(self):
+        # Called under the lock; a forked worker maps the file afresh
+        if self._pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            size = self.RECORD.size * self.slots
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._fd = fd
+            self._map = mmap.mmap(fd, size)
+            self._pid = os.getpid()
+
+    def _slot(self, key, now):
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little') or 1
+        start = digest % self.slots
+        victim = None
+        for i in range(self.PROBE):
+            offset = (start + i) % self.slots * self.RECORD.size
+            stored, tokens, updated = self.RECORD.unpack_from(self._map, offset)
+            if stored == digest:
+                return offset, digest, tokens, updated
+            if victim is None or updated < victim[1]:
+                victim = (offset, updated)
+        return victim[0], digest, None, now
+
+    def take(self, buckets):
+        """Take a token from every (key, rate, burst) bucket, or from none.
+
+        Returns 0 when admitted, otherwise the seconds until a retry can succeed.
+        """
+        now = time.time()
+        with self._lock:
+            self._open()
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                states = []
+                wait = 0
+                for key, rate, burst in buckets:
+                    offset, digest, tokens, updated = self._slot(key, now)
+                    tokens = burst if tokens is None else min(burst, tokens + (now - updated) * rate)
+                    if tokens < 1:
+                        wait = max(wait, (1 - tokens) / rate)
+                    states.append((offset, digest, tokens))
+                for offset, digest, tokens in states:
+                    self.RECORD.pack_into(self._map, offset, digest, tokens if wait else tokens - 1, now)
+                return wait
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def refund(self, buckets):
+        """Give back the token take() took from every (key, rate, burst) bucket."""
+        now = time.time()
+        with self._lock:
+            self._open()
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                for key, rate, burst in buckets:
+                    offset, digest, tokens, updated = self._slot(key, now)
+                    if tokens is not None:
+                        tokens = min(burst, tokens + (now - updated) * rate + 1)
+                        self.RECORD.pack_into(self._map, offset, digest, tokens, now)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+class AdmissionQueue:
+    """Per-process bound on concurrent writes.
+
+    Up to `concurrency` requests run at once and up to `queue` more wait (at
+    most max_wait seconds) for a slot; anything beyond that is turned away
+    at once instead of piling onto the SQLite writer.
+    """
+
+    def __init__(self, concurrency, queue, max_wait):
+        self.concurrency = concurrency
+        self.queue = queue
+        self.max_wait = max_wait
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting = 0
+
+    def acquire(self):
+        with self._cond:
+            if self._active < self.concurrency:
+                self._active += 1
+                return True
+            if self._waiting >= self.queue:
+                return False
+            self._waiting += 1
+            try:
+                if not self._cond.wait_for(lambda: self._active < self.concurrency, self.max_wait):
+                    return False
+                self._active += 1
+                return True
+            finally:
+                self._waiting -= 1
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+rate_limits = TokenBuckets(RATE_LIMIT_FILE, RATE_LIMIT_SLOTS)
+write_admission = AdmissionQueue(ADMISSION_CONCURRENCY, ADMISSION_QUEUE, ADMISSION_MAX_WAIT)
 
+def client_address():
+    route = request.access_route
+    if TRUSTED_PROXIES and len(route) >= TRUSTED_PROXIES:
+        return route[-TRUSTED_PROXIES]
+    return request.remote_addr or ''
+
+def too_busy(status, retry_after, message):
+    metrics.inc('admission_rejected_total', (('endpoint', request.endpoint), ('status', str(status))))
+    response = jsonify({'success': False, 'message': message})
+    response.headers['Retry-After'] = str(max(1, int(retry_after + 0.999)))
+    return response, status
+
+def admitted(name):
+    """Rate-limit a POST endpoint with RATE_LIMITS[name], then run it through write_admission.
+
+    Runs before the request body is parsed, so a rejected upload costs nothing.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if request.method != 'POST' or not ADMISSION_ENABLED:
+                return f(*args, **kwargs)
+            client_rate, client_burst, global_rate, global_burst = RATE_LIMITS[name]
+            buckets = [(f'{name}:{client_address()}', client_rate, client_burst),
+                       (f'{name}:*', global_rate, global_burst)]
+            wait = rate_limits.take(buckets)
+            if wait:
+                return too_busy(429, wait, f'Too many requests, please try again in {max(1, round(wait))} seconds.')
+            start = time.perf_counter()
+            if not write_admission.acquire():
+                # Nothing was done, so the turned-away request doesn't count against the client
+                rate_limits.refund(buckets)
+                # Jittered so turned-away clients don't all come back in the same second
+                return too_busy(503, random.uniform(1, 3), 'The server is busy, please try again in a few seconds.')
+            metrics.observe('admission_wait_seconds', (('endpoint', request.endpoint),), time.perf_counter() - start)
+            try:
+                return f(*args, **kwargs)
+            finally:
+                write_admission.release()
+        return decorated_function
+    return decorator
+
+def read_table_versions(tables):
+    """Return (version tag, last modified) for the given tables from table_versions."""
+    # Memoized per request so conditional() and cached() share one lookup
+    memo = g.setdefault('table_versions', {})
+    if tables not in memo:
+        memo[tables] = _read_table_versions(tables)
+    return memo[tables]
+
+def _read_table_versions(tables):
     conn = get_conn()
     cursor = conn.cursor()
-    # Enable WAL for better concurrency on Render
+    placeholders = ', '.join('?' for _ in tables)
+    cursor.execute(f'SELECT name, version, updated_at FROM table_versions WHERE name IN ({placeholders})', tables)
+    rows = {name: (version, updated_at) for name, version, updated_at in cursor.fetchall()}
+    tag = '.'.join(f"{table}-{rows.get(table, (0, None))[0]}" for table in tables)
+    stamps = [updated_at for _, updated_at in rows.values() if updated_at]
+    last_modified = datetime.strptime(max(stamps), '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc) if stamps else None
+    return tag, last_modified
+
+def conditional(*tables, private=False):
+    """Serve 304 Not Modified from the table version counters without running the view.
+
+    Every write bumps table_versions by trigger, so the ETag changes exactly
+    when the rows behind the response do.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            tag, last_modified = read_table_versions(tables)
+            if request.query_string:
+                tag += f"-{zlib.crc32(request.query_string):08x}"
+
+            if request.if_none_match:
+                # compress_response appends -<encoding> to the tag of compressed bodies
+                not_modified = any(etag in request.if_none_match
+                                   for etag in [tag] + [f'{tag}-{encoding}' for encoding in ENCODERS])
+            else:
+                not_modified = bool(last_modified and request.if_modified_since
+                                    and last_modified <= request.if_modified_since)
+
+            response = Response(status=304) if not_modified else app.make_response(f(*args, **kwargs))
+            if response.status_code in (200, 304):
+                # Bodies cached compressed by cached() carry their encoding in the tag, as compress_response does
+                encoding = response.headers.get('Content-Encoding')
+                response.set_etag(f'{tag}-{encoding}' if encoding else tag)
+                if last_modified:
+                    response.last_modified = last_modified
+                response.headers['Cache-Control'] = 'private, no-cache' if private else 'no-cache'
+            return response
+        return decorated_function
+    return decorator
+
+class ResponseCache:
+    """Bounded LRU of rendered responses shared by the threads of a worker.
+
+    Entries are stamped with the table version tag they were built from,
+    so a write in another worker makes them stale on the next lookup.
+    Concurrent misses for one key wait for a single leader to build it.
+    """
+
+    def __init__(self, max_entries, ttl=None):
+        self.max_entries = max_entries
+        self.ttl = ttl or None
+        self._entries = OrderedDict()  # key -> (tables, tag, expires, status, headers, body)
+        self._inflight = {}  # key -> threading.Event set when the leader finishes
+        self._lock = threading.Lock()
+
+    def _lookup(self, key, tag):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] != tag or (entry[2] is not None and entry[2] <= time.monotonic()):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_or_build(self, key, tables, tag, build):
+        while True:
+            with self._lock:
+                entry = self._lookup(key, tag)
+                if entry is not None:
+                    return Response(entry[5], status=entry[3], headers=entry[4])
+                event = self._inflight.get(key)
+                leader = event is None
+                if leader:
+                    event = self._inflight[key] = threading.Event()
+            if leader:
+                break
+            event.wait()
+
+        try:
+            response = build()
+            if response.status_code == 200 and not response.is_streamed:
+                expires = time.monotonic() + self.ttl if self.ttl else None
+                entry = (tables, tag, expires, response.status_code, list(response.headers), response.get_data())
+                with self._lock:
+                    self._entries[key] = entry
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return response
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+
+    def invalidate(self, *tables):
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if set(entry[0]) & set(tables)]:
+                del self._entries[key]
+
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+def cached(*tables):
+    """Serve the view from response_cache, rebuilding it when the tables change.
+
+    Bodies are cached compressed, one entry per negotiated encoding.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            tag, _ = read_table_versions(tables)
+            encoding = negotiate_encoding(ENCODERS)
+            key = (request.endpoint, tuple(sorted(kwargs.items())), request.query_string, encoding)
+            return response_cache.get_or_build(
+                key, tables, tag, lambda: finish_cached(app.make_response(f(*args, **kwargs)), encoding))
+        return decorated_function
+    return decorator
+
+def _gzip_compressor():
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits=31 writes a gzip container
+    return lambda data: compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+def _brotli_compressor():
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    return lambda data: compressor.process(data) + compressor.flush(), compressor.finish
+
+def _zstd_compressor():
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+    return (lambda data: compressor.compress(data) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK),
+            compressor.flush)
+
+# Content-Encoding -> (one-shot compress, streaming compressor factory), in order of preference
+ENCODERS = {}
+if brotli is not None:
+    ENCODERS['br'] = (lambda body: brotli.compress(body, quality=BROTLI_QUALITY), _brotli_compressor)
+if zstandard is not None:
+    ENCODERS['zstd'] = (lambda body: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body), _zstd_compressor)
+ENCODERS['gzip'] = (lambda body: zlib.compress(body, GZIP_LEVEL, wbits=31), _gzip_compressor)
+
+# Rendered HTML pages are cached already compressed
+PAGE_ENCODINGS = tuple(ENCODERS)
+
+def compress_body(body, encoding):
+    return ENCODERS[encoding][0](body)
+
+def negotiate_encoding(encodings):
+    for encoding in encodings:
+        if request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+def finish_page(response, encoding):
+    if response.status_code != 200 or response.is_streamed:
+        return response
+    body = response.get_data()
+    etag = hashlib.sha256(body).hexdigest()[:20]
+    if encoding and len(body) >= COMPRESS_MIN_SIZE:
+        response.set_data(compress_body(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+        etag += f'-{encoding}'
+    response.set_etag(etag)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.no_cache = True
+    return response
+
+def finish_cached(response, encoding):
+    if not compressible(response) or response.is_streamed:
+        return response
+    body = response.get_data()
+    if len(body) >= COMPRESS_MIN_SIZE:
+        response.vary.add('Accept-Encoding')
+        if encoding:
+            response.set_data(compress_body(body, encoding))
+            response.headers['Content-Encoding'] = encoding
+    return response
+
+def page(*tables):
+    """Serve a GET-rendered HTML page from response_cache, compressed and with a content ETag.
+
+    Pages without tables only change on deploy and are rendered once per
+    process; the rest are rebuilt when one of their tables is written.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if request.method != 'GET':
+                return f(*args, **kwargs)
+            tag = read_table_versions(tables)[0] if tables else ''
+            encoding = negotiate_encoding(PAGE_ENCODINGS)
+            key = (request.endpoint, tuple(sorted(kwargs.items())), request.query_string, encoding)
+            response = response_cache.get_or_build(
+                key, tables, tag, lambda: finish_page(app.make_response(f(*args, **kwargs)), encoding))
+            return response.make_conditional(request)
+        return decorated_function
+    return decorator
+
+def _compressed_stream(body, encoding):
+    compress, finish = ENCODERS[encoding][1]()
     try:
-        cursor.execute('PRAGMA journal_mode=WAL')
-    except Exception:
-        pass
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS registrations (
+        for chunk in body:
+            data = compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+            if data:
+                yield data
+        yield finish()
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+
+def compressible(response):
+    return (response.status_code == 200 and not response.direct_passthrough
+            and 'Content-Encoding' not in response.headers
+            and response.mimetype in COMPRESSIBLE_TYPES
+            and 'no-transform' not in response.headers.get('Cache-Control', ''))
+
+@app.after_request
+def compress_response(response):
+    """Compress JSON, HTML and text bodies the view didn't already encode.
+
+    Streamed bodies (exports) are compressed chunk by chunk with a flush
+    after each, so nothing is buffered. Files from send_file, SSE and
+    responses that already carry a Content-Encoding (pages, /static/dist)
+    pass through untouched.
+    """
+    if not compressible(response):
+        return response
+    streamed = response.is_streamed
+    if not streamed and len(response.get_data()) < COMPRESS_MIN_SIZE:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding(ENCODERS)
+    if encoding is None:
+        return response
+    if streamed:
+        response.response = _compressed_stream(response.response, encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        response.set_data(compress_body(response.get_data(), encoding))
+    response.headers['Content-Encoding'] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f'{etag}-{encoding}', weak)
+    return response
+
+def _add_missing_columns(cursor, table, columns):
+    cursor.execute(f'PRAGMA table_info({table})')
+    existing = {row[1] for row in cursor.fetchall()}
+    for name, decl in columns:
+        if name not in existing:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {name} {decl}')
+
+def _migration_base_schema(cursor):
+    registrations_columns = '''
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             team_name TEXT NOT NULL,
             leader_name TEXT NOT NULL,
@@ -86,70 +957,29 @@ def init_db():
             github_link TEXT,
             proposal_file TEXT,
             registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    '''
+    cursor.execute(f'CREATE TABLE IF NOT EXISTS registrations ({registrations_columns})')
+
+    # Old schema: drop experience_level if still present
+    cursor.execute('PRAGMA table_info(registrations)')
+    existing = [row[1] for row in cursor.fetchall()]
+    if 'experience_level' in existing:
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            cursor.execute('ALTER TABLE registrations DROP COLUMN experience_level')
+        else:
+            # No DROP COLUMN before SQLite 3.35: rebuild the table without it, keeping every other column
+            cursor.execute(f'CREATE TABLE registrations_new ({registrations_columns})')
+            cursor.execute('PRAGMA table_info(registrations_new)')
+            kept = ', '.join(row[1] for row in cursor.fetchall() if row[1] in existing)
+            cursor.execute(f'INSERT INTO registrations_new ({kept}) SELECT {kept} FROM registrations')
+            cursor.execute('DROP TABLE registrations')
+            cursor.execute('ALTER TABLE registrations_new RENAME TO registrations')
+
+    # Columns added after the first release
+    _add_missing_columns(cursor, 'registrations', [
+        ('team_members', 'TEXT'), ('github_link', 'TEXT'), ('proposal_file', 'TEXT'), ('phone', 'TEXT')
+    ])
 
-    # Migrate old schema: drop experience_level if still present
-    try:
-        cursor.execute("PRAGMA table_info(registrations)")
-        cols = [row[1] for row in cursor.fetchall()]
-        if 'experience_level' in cols:
-            # Attempt direct drop (SQLite >= 3.35 supports DROP COLUMN)
-            try:
-                cursor.execute('ALTER TABLE registrations DROP COLUMN experience_level')
-                conn.commit()
-            except sqlite3.OperationalError:
-                # Fallback: recreate table without experience_level
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS registrations_new (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        team_name TEXT NOT NULL,
-                        leader_name TEXT NOT NULL,
-                        email TEXT NOT NULL UNIQUE,
-                        university TEXT NOT NULL,
-                        theme TEXT NOT NULL,
-                        team_members TEXT,
-                        github_link TEXT,
-                        proposal_file TEXT,
-                        registration_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                cursor.execute('''
-                    INSERT INTO registrations_new (id, team_name, leader_name, email, university, theme, team_members, github_link, proposal_file, registration_date)
-                    SELECT id, team_name, leader_name, email, university, theme, team_members, github_link, proposal_file, registration_date FROM registrations
-                ''')
-                cursor.execute('DROP TABLE registrations')
-                cursor.execute('ALTER TABLE registrations_new RENAME TO registrations')
-                conn.commit()
-    except Exception:
-        pass
-    
-    # Add team_members column if it doesn't exist
-    try:
-        cursor.execute('ALTER TABLE registrations ADD COLUMN team_members TEXT')
-        conn.commit()
-    except sqlite3.OperationalError:
-        # Column already exists
-        pass
-    # Add github_link column if it doesn't exist
-    try:
-        cursor.execute('ALTER TABLE registrations ADD COLUMN github_link TEXT')
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass
-    # Add proposal_file column if it doesn't exist
-    try:
-        cursor.execute('ALTER TABLE registrations ADD COLUMN proposal_file TEXT')
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass
-    # Add phone column if it doesn't exist
-    try:
-        cursor.execute('ALTER TABLE registrations ADD COLUMN phone TEXT')
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass
-    
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS submissions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -183,19 +1013,7 @@ def init_db():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
-    
-    # Add new columns to existing notices table if they don't exist
-    try:
-        cursor.execute('ALTER TABLE notices ADD COLUMN file_path TEXT')
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass
-    
-    try:
-        cursor.execute('ALTER TABLE notices ADD COLUMN original_filename TEXT')
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass
+    _add_missing_columns(cursor, 'notices', [('file_path', 'TEXT'), ('original_filename', 'TEXT')])
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS documents (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -207,11 +1025,461 @@ def init_db():
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     ''')
-    conn.commit()
-    conn.close()
 
+def _migration_live_stats(cursor):
+    # Aggregate counters for /api/live-stats, kept current by triggers
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS live_stats (
+            name TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0,
+            last_at TIMESTAMP
+        )
+    ''')
+    # One-time scan of existing rows; triggers keep the counters current from here on
+    cursor.execute('DELETE FROM live_stats')
+    cursor.execute('''
+        INSERT INTO live_stats (name, count, last_at)
+        SELECT 'registrations', COUNT(*), MAX(registration_date) FROM registrations
+    ''')
+    cursor.execute('''
+        INSERT INTO live_stats (name, count, last_at)
+        SELECT 'theme:' || theme, COUNT(*), MAX(registration_date) FROM registrations GROUP BY theme
+    ''')
+    cursor.execute('''
+        INSERT INTO live_stats (name, count, last_at)
+        SELECT 'submissions', COUNT(*), MAX(submission_date) FROM submissions
+    ''')
+    cursor.execute('''
+        INSERT INTO live_stats (name, count, last_at)
+        SELECT 'submission_theme:' || theme, COUNT(*), MAX(submission_date) FROM submissions GROUP BY theme
+    ''')
+    for table, prefix in (('registrations', 'theme:'), ('submissions', 'submission_theme:')):
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS live_stats_{table}_insert AFTER INSERT ON {table}
+            BEGIN
+                INSERT INTO live_stats (name, count, last_at) VALUES ('{table}', 1, CURRENT_TIMESTAMP)
+                    ON CONFLICT(name) DO UPDATE SET count = count + 1, last_at = excluded.last_at;
+                INSERT INTO live_stats (name, count, last_at) VALUES ('{prefix}' || NEW.theme, 1, CURRENT_TIMESTAMP)
+                    ON CONFLICT(name) DO UPDATE SET count = count + 1, last_at = excluded.last_at;
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS live_stats_{table}_delete AFTER DELETE ON {table}
+            BEGIN
+                UPDATE live_stats SET count = count - 1 WHERE name IN ('{table}', '{prefix}' || OLD.theme);
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS live_stats_{table}_theme_update AFTER UPDATE OF theme ON {table}
+            WHEN OLD.theme IS NOT NEW.theme
+            BEGIN
+                UPDATE live_stats SET count = count - 1 WHERE name = '{prefix}' || OLD.theme;
+                INSERT INTO live_stats (name, count) VALUES ('{prefix}' || NEW.theme, 1)
+                    ON CONFLICT(name) DO UPDATE SET count = count + 1;
+            END
+        ''')
+
+def _migration_change_log(cursor):
+    # Change log read by the /api/events feed; ids double as SSE event ids
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS change_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            action TEXT NOT NULL,
+            ref_id INTEGER,
+            payload TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS change_log_prune AFTER INSERT ON change_log
+        BEGIN
+            DELETE FROM change_log WHERE id <= NEW.id - {CHANGE_LOG_RETENTION};
+        END
+    ''')
+    announcement_json = "json_object('id', {0}.id, 'title', {0}.title, 'content', {0}.content, 'created_at', {0}.created_at)"
+    notice_json = "json_object('id', {0}.id, 'content', {0}.content, 'file_path', {0}.file_path, 'original_filename', {0}.original_filename, 'created_at', {0}.created_at)"
+    change_triggers = {
+        'change_log_announcement_insert': f'''
+            AFTER INSERT ON announcements BEGIN
+                INSERT INTO change_log (kind, action, ref_id, payload)
+                VALUES ('announcement', 'created', NEW.id, {announcement_json.format('NEW')});
+            END''',
+        'change_log_announcement_delete': '''
+            AFTER DELETE ON announcements BEGIN
+                INSERT INTO change_log (kind, action, ref_id, payload)
+                VALUES ('announcement', 'deleted', OLD.id, json_object('id', OLD.id));
+            END''',
+        'change_log_notice_insert': f'''
+            AFTER INSERT ON notices WHEN NEW.is_active = 1 BEGIN
+                INSERT INTO change_log (kind, action, ref_id, payload)
+                VALUES ('notice', 'created', NEW.id, {notice_json.format('NEW')});
+            END''',
+        'change_log_notice_delete': '''
+            AFTER DELETE ON notices WHEN OLD.is_active = 1 BEGIN
+                INSERT INTO change_log (kind, action, ref_id, payload)
+                VALUES ('notice', 'deleted', OLD.id, json_object('id', OLD.id));
+            END''',
+        'change_log_notice_active_update': f'''
+            AFTER UPDATE OF is_active ON notices WHEN OLD.is_active IS NOT NEW.is_active BEGIN
+                INSERT INTO change_log (kind, action, ref_id, payload)
+                VALUES ('notice', CASE WHEN NEW.is_active = 1 THEN 'created' ELSE 'deleted' END, NEW.id,
+                        CASE WHEN NEW.is_active = 1 THEN {notice_json.format('NEW')} ELSE json_object('id', NEW.id) END);
+            END''',
+    }
+    for table in ('registrations', 'submissions'):
+        change_triggers[f'change_log_{table}_insert'] = f'''
+            AFTER INSERT ON {table} BEGIN
+                INSERT INTO change_log (kind, action, ref_id) VALUES ('stats', 'created', NEW.id);
+            END'''
+        change_triggers[f'change_log_{table}_delete'] = f'''
+            AFTER DELETE ON {table} BEGIN
+                INSERT INTO change_log (kind, action, ref_id) VALUES ('stats', 'deleted', OLD.id);
+            END'''
+    for name, body in change_triggers.items():
+        cursor.execute(f'CREATE TRIGGER IF NOT EXISTS {name} {body}')
+
+def _migration_table_versions(cursor):
+    # Per-table version counters behind the ETag / Last-Modified headers
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    for table in VERSIONED_TABLES:
+        cursor.execute('INSERT OR IGNORE INTO table_versions (name) VALUES (?)', (table,))
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS table_versions_{table}_{event.lower()} AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+                    WHERE name = '{table}';
+                END
+            ''')
+
+def _migration_indexes(cursor):
+    # Serve every ORDER BY / keyset page and theme filter from an index instead of scan + sort
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_registrations_date ON registrations (registration_date)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_registrations_theme ON registrations (theme)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_notices_active_created ON notices (is_active, created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_submissions_date ON submissions (submission_date)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_documents_created ON documents (created_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_announcements_created ON announcements (created_at)')
+
+# Full-text search sources: kind -> (table, code packed into the rowid, title, body, condition),
+# with {row} standing for the table (rebuild) or NEW (triggers).
+# search_index.rowid = source id * 4 + code, so triggers touch single rows by rowid.
+SEARCH_SOURCES = {
+    'notice': ('notices', 0, "''", '{row}.content', '{row}.is_active = 1'),
+    'document': ('documents', 1, '{row}.title', "COALESCE({row}.description, '')", None),
+    'announcement': ('announcements', 2, '{row}.title', '{row}.content', None),
+    'submission': ('submissions', 3, '{row}.project_title', '{row}.description', None),
+}
+PUBLIC_SEARCH_KINDS = ('notice', 'document', 'announcement')
+
+def rebuild_search_index(cursor):
+    cursor.execute('DELETE FROM search_index')
+    for kind, (table, code, title, body, condition) in SEARCH_SOURCES.items():
+        where = f" WHERE {condition.format(row=table)}" if condition else ''
+        cursor.execute(f"""
+            INSERT INTO search_index (rowid, kind, title, body)
+            SELECT id * 4 + {code}, '{kind}', {title.format(row=table)}, {body.format(row=table)} FROM {table}{where}
+        """)
+    cursor.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
+
+def _migration_search_index(cursor):
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(
+            kind UNINDEXED, title, body, tokenize = 'porter unicode61 remove_diacritics 2'
+        )
+    """)
+    for kind, (table, code, title, body, condition) in SEARCH_SOURCES.items():
+        values = f"NEW.id * 4 + {code}, '{kind}', {title.format(row='NEW')}, {body.format(row='NEW')}"
+        condition = condition.format(row='NEW') if condition else None
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS search_index_{table}_insert AFTER INSERT ON {table}
+            {f'WHEN {condition}' if condition else ''}
+            BEGIN
+                INSERT INTO search_index (rowid, kind, title, body) VALUES ({values});
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS search_index_{table}_delete AFTER DELETE ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = OLD.id * 4 + {code};
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS search_index_{table}_update AFTER UPDATE ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = OLD.id * 4 + {code};
+                INSERT INTO search_index (rowid, kind, title, body)
+                SELECT {values} {f'WHERE {condition}' if condition else ''};
+            END
+        """)
+    rebuild_search_index(cursor)
+
+# Columns that may point at a blob, per owning table
+BLOB_COLUMNS = {
+    'notices': 'file_path',
+    'documents': 'filename',
+    'registrations': 'proposal_file',
+    'submissions': 'presentation_file',
+}
+
+def _migration_blobs(cursor):
+    # Content-addressed upload store; ref_count is maintained by triggers on the owning rows
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS blobs (
+            digest TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_blobs_unreferenced ON blobs (digest) WHERE ref_count <= 0')
+    prefix_length = len(BLOB_PREFIX)
+    for table, column in BLOB_COLUMNS.items():
+        is_blob = "{row}.%s LIKE '%s%%'" % (column, BLOB_PREFIX)
+        digest = f'substr({{row}}.{column}, {prefix_length + 1})'
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS blobs_{table}_insert AFTER INSERT ON {table}
+            WHEN {is_blob.format(row='NEW')}
+            BEGIN
+                UPDATE blobs SET ref_count = ref_count + 1 WHERE digest = {digest.format(row='NEW')};
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS blobs_{table}_delete AFTER DELETE ON {table}
+            WHEN {is_blob.format(row='OLD')}
+            BEGIN
+                UPDATE blobs SET ref_count = ref_count - 1 WHERE digest = {digest.format(row='OLD')};
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS blobs_{table}_update AFTER UPDATE OF {column} ON {table}
+            WHEN OLD.{column} IS NOT NEW.{column}
+            BEGIN
+                UPDATE blobs SET ref_count = ref_count - 1
+                WHERE {is_blob.format(row='OLD')} AND digest = {digest.format(row='OLD')};
+                UPDATE blobs SET ref_count = ref_count + 1
+                WHERE {is_blob.format(row='NEW')} AND digest = {digest.format(row='NEW')};
+            END
+        """)
+
+def _migration_upload_names(cursor):
+    # Original filenames for proposals and presentations, which are stored under their digest
+    _add_missing_columns(cursor, 'registrations', [('proposal_filename', 'TEXT')])
+    _add_missing_columns(cursor, 'submissions', [('presentation_filename', 'TEXT')])
+
+def _migration_outbox(cursor):
+    # Notification jobs and one outbox row per recipient, drained by the mail workers
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS notification_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            subject TEXT NOT NULL,
+            message TEXT NOT NULL,
+            recipients TEXT NOT NULL,
+            total INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id INTEGER NOT NULL REFERENCES notification_jobs (id) ON DELETE CASCADE,
+            email TEXT NOT NULL,
+            name TEXT,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL DEFAULT 0,
+            claimed_at REAL,
+            last_error TEXT,
+            sent_at TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_outbox_job ON outbox (job_id, status)')
+
+# Schema migrations, applied in order; PRAGMA user_version records how many have run.
+# Only ever append to this list.
+MIGRATIONS = [
+    _migration_base_schema,
+    _migration_live_stats,
+    _migration_change_log,
+    _migration_table_versions,
+    _migration_indexes,
+    _migration_search_index,
+    _migration_blobs,
+    _migration_upload_names,
+    _migration_outbox,
+]
+
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+def init_db(conn=None):
+    """Bring the database up to the latest schema version.
+
+    A warm start costs a single PRAGMA read. Otherwise BEGIN IMMEDIATE
+    serializes concurrent workers, and whoever gets the lock second sees the
+    bumped user_version and has nothing left to do. A connection passed in
+    (the first one a process opens) is used and left open.
+    """
+    global _schema_ready
+    # Ensure directory exists for DB_PATH if a nested path is provided
+    db_dir = os.path.dirname(DB_PATH)
+    if db_dir and not os.path.exists(db_dir):
+        os.makedirs(db_dir, exist_ok=True)
+
+    own_conn = conn is None
+    if own_conn:
+        conn = _connect()
+    cursor = conn.cursor()
+    try:
+        cursor.execute('PRAGMA user_version')
+        if cursor.fetchone()[0] >= len(MIGRATIONS):
+            _schema_ready = True
+            return
+        # Large tables can take a while to index; wait for another worker's migration
+        cursor.execute('PRAGMA busy_timeout')
+        busy_timeout = cursor.fetchone()[0]
+        cursor.execute('PRAGMA busy_timeout=60000')
+        cursor.execute('BEGIN IMMEDIATE')
+        cursor.execute('PRAGMA user_version')
+        version = cursor.fetchone()[0]
+        for step, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+            migration(cursor)
+            cursor.execute(f'PRAGMA user_version = {step}')
+        conn.commit()
+        cursor.execute(f'PRAGMA busy_timeout={busy_timeout}')
+        _schema_ready = True
+    finally:
+        if own_conn:
+            conn.close()
+        elif conn.in_transaction:
+            conn.rollback()
+
+@app.cli.command('rebuild-search')
+def rebuild_search_command():
+    """Rebuild the full-text search index from the source tables."""
+    ensure_schema()
+    conn = _connect()
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        rebuild_search_index(conn.cursor())
+        conn.commit()
+    finally:
+        conn.close()
+    print('Search index rebuilt')
+
+@app.cli.command('compile-templates')
+@click.option('--precompiled', is_flag=True, help='Write the committed JINJA_PRECOMPILED_DIR instead.')
+@click.option('--check', is_flag=True, help='Exit with status 1 if JINJA_PRECOMPILED_DIR is out of date.')
+def compile_templates_command(precompiled, check):
+    """Compile every template into JINJA_CACHE_DIR so first renders skip the Jinja compiler."""
+    names = app.jinja_env.list_templates()
+    if not (precompiled or check):
+        os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+        for name in names:
+            app.jinja_env.get_template(name)
+        print(f'Compiled {len(names)} templates into {JINJA_CACHE_DIR}')
+        return
+    cache = TemplateBytecodeCache(JINJA_PRECOMPILED_DIR)
+    stale = []
+    for name in names:
+        source, filename, _ = app.jinja_env.loader.get_source(app.jinja_env, name)
+        if cache.get_bucket(app.jinja_env, name, filename, source).code is None:
+            stale.append(name)
+    if check:
+        if stale:
+            print(f"{JINJA_PRECOMPILED_DIR} is out of date: {', '.join(stale)} "
+                  '(run flask --app app compile-templates --precompiled)')
+            raise SystemExit(1)
+        print(f'{JINJA_PRECOMPILED_DIR} is up to date')
+        return
+    os.makedirs(JINJA_PRECOMPILED_DIR, exist_ok=True)
+    keep = {cache.pattern % cache.get_cache_key(name) for name in names}
+    for entry in set(os.listdir(JINJA_PRECOMPILED_DIR)) - keep:
+        os.remove(os.path.join(JINJA_PRECOMPILED_DIR, entry))  # Deleted templates
+    env = app.jinja_env.overlay(bytecode_cache=cache)
+    for name in names:
+        env.get_template(name)
+    print(f'Compiled {len(names)} templates into {JINJA_PRECOMPILED_DIR} ({len(stale)} changed)')
+
+def ensure_schema(conn=None):
+    # Run pending migrations once per process, on first database use
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if not _schema_ready:
+            init_db(conn)
+
+
+# Static assets: build_assets.py writes fingerprinted, precompressed copies to static/dist
+STATIC_FOLDER = os.path.join(app.root_path, 'static')
+STATIC_MAX_AGE = 365 * 24 * 3600
+ENCODING_SUFFIXES = (('br', '.br'), ('gzip', '.gz'))
+
+def load_static_manifest():
+    """Manifest entries for static/dist, minus any whose source changed since the build."""
+    try:
+        with open(os.path.join(STATIC_FOLDER, 'dist', 'manifest.json')) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    fresh = {}
+    for name, entry in manifest.items():
+        try:
+            with open(os.path.join(STATIC_FOLDER, name), 'rb') as f:
+                source_digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            continue
+        # A stale build would pin pages to old assets for a year, so fall back to the source file
+        if source_digest == entry['source']:
+            fresh[name] = entry
+    return fresh
+
+STATIC_MANIFEST = load_static_manifest()
+STATIC_BUILT = {entry['path']: entry for entry in STATIC_MANIFEST.values()}
+
+@app.url_defaults
+def fingerprint_static(endpoint, values):
+    # url_for('static', filename='styles.css') -> /static/dist/styles.<hash>.css
+    if endpoint == 'static':
+        entry = STATIC_MANIFEST.get(values.get('filename'))
+        if entry:
+            values['filename'] = entry['path']
+
+@app.route('/static/<path:filename>', endpoint='static')
+def serve_static(filename):
+    entry = STATIC_BUILT.get(filename)
+    if entry is None:
+        # Unbuilt assets keep Flask's default (revalidated) caching
+        return send_from_directory(STATIC_FOLDER, filename)
+    path = os.path.join(STATIC_FOLDER, filename)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    encoding = None
+    for name, suffix in ENCODING_SUFFIXES:
+        if name in entry['encodings'] and request.accept_encodings[name]:
+            encoding, path = name, path + suffix
+            break
+    response = send_file(path, mimetype=mimetype, conditional=True,
+                         etag=entry['path'] + (f'-{encoding}' if encoding else ''))
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if entry['encodings']:
+        response.vary.add('Accept-Encoding')
+    response.cache_control.no_cache = None
+    response.cache_control.public = True
+    response.cache_control.max_age = STATIC_MAX_AGE
+    response.cache_control.immutable = True
+    return response
 
 @app.route('/')
+@page()
 def index():
     return render_template('index.html')
 
@@ -226,6 +1494,7 @@ def admin_login():
     return render_template('login.html')
 
 @app.route('/admin/login', methods=['POST'])
+@admitted('login')
 def admin_login_post():
     data = request.get_json()
     
@@ -246,22 +1515,27 @@ def admin_logout():
     return redirect(url_for('admin_login'))
 
 @app.route('/submit')
+@page()
 def submit_page():
     return render_template('submit.html')
 
 @app.route('/live')
+@page()
 def live_updates():
     return render_template('live.html')
 
 @app.route('/stream')
+@page()
 def live_stream():
     return render_template('stream.html')
 
 @app.route('/notices')
+@page()
 def notices_page():
     return render_template('notices.html')
 
 @app.route('/documents')
+@page()
 def documents_page():
     return render_template('documents.html')
 
@@ -269,25 +1543,20 @@ def documents_page():
 @login_required
 def add_notice():
     content = request.form.get('content')
-    file_path = None
-    original_filename = None
+    staged = None
     
     if 'file' in request.files:
         file = request.files['file']
         if file.filename != '' and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            unique_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-            file.save(file_path)
-            original_filename = filename
-            file_path = unique_filename
+            staged = stage_upload(file)
     
     conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute('INSERT INTO notices (content, file_path, original_filename) VALUES (?, ?, ?)', 
-                   (content, file_path, original_filename))
-    conn.commit()
-    conn.close()
+    with blob_transaction(conn, staged) as file_path:
+        cursor.execute('INSERT INTO notices (content, file_path, original_filename) VALUES (?, ?, ?)', 
+                       (content, file_path, staged.filename if staged else None))
+    response_cache.invalidate('notices')
+    change_feed.poke()
     return jsonify({'success': True})
 
 @app.route('/admin/delete-notice/<int:notice_id>', methods=['DELETE'])
@@ -297,27 +1566,420 @@ def delete_notice(notice_id):
     cursor = conn.cursor()
     cursor.execute('DELETE FROM notices WHERE id = ?', (notice_id,))
     conn.commit()
-    conn.close()
+    file_cache.invalidate('notices')
+    collect_blobs()
+    response_cache.invalidate('notices')
+    change_feed.poke()
     return jsonify({'success': True})
 
 @app.route('/admin/delete-submission/<int:submission_id>', methods=['DELETE'])
 @login_required
 def delete_submission(submission_id):
-    conn = sqlite3.connect('registrations.db')
+    conn = get_conn()
     cursor = conn.cursor()
     cursor.execute('DELETE FROM submissions WHERE id = ?', (submission_id,))
     conn.commit()
-    conn.close()
+    file_cache.invalidate('submissions')
+    collect_blobs()
+    change_feed.poke()
     return jsonify({'success': True})
 
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-@app.route('/admin/upload-document', methods=['POST'])
-@login_required
-def upload_document():
-    if 'file' not in request.files:
-        return jsonify({'success': False, 'message': 'No file selected'})
+# Uploads are stored once under their SHA-256 digest: <UPLOAD_FOLDER>/blobs/<digest>
+BLOB_PREFIX = 'blobs/'
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+class StagedUpload:
+    """An upload streamed to a temp file and hashed, waiting to be placed as a blob."""
+
+    def __init__(self, temp_path, digest, size, filename):
+        self.temp_path = temp_path
+        self.digest = digest
+        self.size = size
+        self.filename = filename
+
+    @property
+    def path(self):
+        # Value stored in the owning row, relative to UPLOAD_FOLDER
+        return BLOB_PREFIX + self.digest
+
+# Where blob bytes live: 'local' (under UPLOAD_FOLDER) or 's3' (AWS S3 or any S3 API such as MinIO)
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'local')
+S3_BUCKET = os.environ.get('S3_BUCKET', '')
+S3_PREFIX = os.environ.get('S3_PREFIX', '')
+S3_ENDPOINT_URL = os.environ.get('S3_ENDPOINT_URL') or None  # e.g. http://localhost:9000 for MinIO
+S3_REGION = os.environ.get('S3_REGION') or None
+S3_PART_SIZE = int(os.environ.get('S3_PART_SIZE', str(8 * 1024 * 1024)))
+S3_CONCURRENCY = int(os.environ.get('S3_CONCURRENCY', '4'))
+# Downloads redirect to a pre-signed URL valid this many seconds; 0 streams them through the worker
+S3_PRESIGN_EXPIRES = int(os.environ.get('S3_PRESIGN_EXPIRES', '300'))
+
+BlobStat = namedtuple('BlobStat', 'size mtime')
+
+class LocalStorage:
+    """Stored files under a local directory, keyed by their path relative to it."""
+
+    def __init__(self, root):
+        self.root = root
+
+    def local_path(self, key):
+        return os.path.abspath(os.path.join(self.root, key))
+
+    def prepare(self, key, source_path):
+        # Placing is a rename, cheap enough to do under the write lock
+        pass
+
+    def place(self, key, source_path, created):
+        path = self.local_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Identical content either way, so replacing an existing blob is harmless
+        os.replace(source_path, path)
+
+    def stat(self, key):
+        try:
+            stat = os.stat(self.local_path(key))
+        except OSError:
+            return None
+        return BlobStat(stat.st_size, stat.st_mtime)
+
+    def delete(self, key):
+        try:
+            os.remove(self.local_path(key))
+        except FileNotFoundError:
+            pass
+
+    def presigned_url(self, key, download_name, mimetype, inline):
+        return None
+
+class S3Storage:
+    """Stored files as objects in an S3 API bucket.
+
+    Uploads are sent from the staged temp file before the write transaction
+    starts (multipart, S3_PART_SIZE parts), so the write lock is never held
+    across the network. Downloads are pre-signed redirects or ranged GETs.
+    """
+
+    def __init__(self, bucket, prefix='', endpoint_url=None, region=None):
+        # Imported here so the local backend doesn't need (or pay for) boto3
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+        from botocore.exceptions import ClientError
+        if not bucket:
+            raise ValueError('STORAGE_BACKEND=s3 needs S3_BUCKET')
+        self.bucket = bucket
+        self.prefix = prefix
+        self._boto3 = boto3
+        self._client_error = ClientError
+        self._client_args = {'endpoint_url': endpoint_url, 'region_name': region,
+                             'config': Config(signature_version='s3v4')}
+        self.transfer = TransferConfig(multipart_threshold=S3_PART_SIZE, multipart_chunksize=S3_PART_SIZE,
+                                       max_concurrency=S3_CONCURRENCY)
+        self._client = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        # Clients are thread-safe but must not be shared across a fork
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._client = self._boto3.session.Session().client('s3', **self._client_args)
+                    self._pid = os.getpid()
+        return self._client
+
+    def local_path(self, key):
+        return None
+
+    def _upload(self, key, source_path):
+        self.client.upload_file(source_path, self.bucket, self.prefix + key, Config=self.transfer)
+
+    def prepare(self, key, source_path):
+        # Keys are content hashes: an existing object already has these bytes
+        if self.stat(key) is None:
+            self._upload(key, source_path)
+
+    def place(self, key, source_path, created):
+        # collect_blobs() may have removed the object between prepare() and now
+        if created and self.stat(key) is None:
+            self._upload(key, source_path)
+
+    def stat(self, key):
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except self._client_error as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+        return BlobStat(head['ContentLength'], head['LastModified'].timestamp())
+
+    def read(self, key, start, stop):
+        """Yield bytes [start, stop) of an object."""
+        body = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key,
+                                      Range=f'bytes={start}-{stop - 1}')['Body']
+        try:
+            yield from body.iter_chunks(UPLOAD_CHUNK_SIZE)
+        finally:
+            body.close()
+
+    def delete(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+    def presigned_url(self, key, download_name, mimetype, inline):
+        if S3_PRESIGN_EXPIRES <= 0:
+            return None
+        disposition = 'inline' if inline else 'attachment'
+        return self.client.generate_presigned_url('get_object', ExpiresIn=S3_PRESIGN_EXPIRES, Params={
+            'Bucket': self.bucket, 'Key': self.prefix + key, 'ResponseContentType': mimetype,
+            'ResponseContentDisposition': f"{disposition}; filename*=UTF-8''{quote(download_name)}"})
+
+def open_storage():
+    if STORAGE_BACKEND == 's3':
+        return S3Storage(S3_BUCKET, S3_PREFIX, S3_ENDPOINT_URL, S3_REGION)
+    if STORAGE_BACKEND == 'local':
+        return LocalStorage(app.config['UPLOAD_FOLDER'])
+    raise ValueError(f'Unknown STORAGE_BACKEND {STORAGE_BACKEND!r}')
+
+blob_storage = open_storage()
+# Files uploaded before blobs existed stay on local disk whatever the backend
+legacy_storage = LocalStorage(app.config['UPLOAD_FOLDER'])
+
+def storage_for(stored):
+    return blob_storage if stored.startswith(BLOB_PREFIX) else legacy_storage
+
+def upload_local_blobs():
+    """Copy blobs kept under UPLOAD_FOLDER into blob_storage after switching STORAGE_BACKEND."""
+    if isinstance(blob_storage, LocalStorage):
+        return 0
+    cursor = get_conn().cursor()
+    cursor.execute('SELECT digest FROM blobs')
+    copied = 0
+    for (digest,) in cursor.fetchall():
+        key = BLOB_PREFIX + digest
+        path = legacy_storage.local_path(key)
+        if os.path.exists(path) and blob_storage.stat(key) is None:
+            blob_storage.prepare(key, path)
+            copied += 1
+    return copied
+
+def stage_upload(file):
+    """Stream an uploaded file to disk, hashing it on the way, and hand it to the blob storage."""
+    staging_dir = os.path.join(app.config['UPLOAD_FOLDER'], 'tmp')
+    os.makedirs(staging_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=staging_dir)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = file.stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        staged = StagedUpload(temp_path, digest.hexdigest(), size, secure_filename(file.filename))
+        blob_storage.prepare(staged.path, temp_path)
+    except Exception:
+        os.remove(temp_path)
+        raise
+    return staged
+
+def place_blob(cursor, staged):
+    """Move a staged upload into the blob store and register it.
+
+    Must run inside a write transaction (BEGIN IMMEDIATE): holding the write
+    lock keeps collect_blobs() from removing the same digest meanwhile. The
+    owner row's insert trigger takes the reference.
+    """
+    cursor.execute('INSERT INTO blobs (digest, size) VALUES (?, ?) ON CONFLICT(digest) DO NOTHING',
+                   (staged.digest, staged.size))
+    blob_storage.place(staged.path, staged.temp_path, created=cursor.rowcount == 1)
+    return staged.path
+
+def discard_staged(staged):
+    if staged and os.path.exists(staged.temp_path):
+        os.remove(staged.temp_path)
+
+@contextmanager
+def blob_transaction(conn, staged):
+    """Write transaction that places a staged upload (if any) and yields its stored path.
+
+    If the owning insert fails, the transaction is rolled back and a newly
+    placed blob is removed again.
+    """
+    cursor = conn.cursor()
+    path = None
+    try:
+        execute_with_retry(cursor, 'BEGIN IMMEDIATE')
+        if staged:
+            path = place_blob(cursor, staged)
+        yield path
+        conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        if path:
+            discard_blob(staged.digest)
+        raise
+    finally:
+        discard_staged(staged)
+
+def collect_blobs():
+    """Delete blobs that no row references any more."""
+    conn = get_conn()
+    cursor = conn.cursor()
+    # Cheap check on the partial index before taking the write lock
+    cursor.execute('SELECT 1 FROM blobs WHERE ref_count <= 0 LIMIT 1')
+    if cursor.fetchone() is None:
+        return
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        cursor.execute('SELECT digest FROM blobs WHERE ref_count <= 0')
+        for (digest,) in cursor.fetchall():
+            blob_storage.delete(BLOB_PREFIX + digest)
+            cursor.execute('DELETE FROM blobs WHERE digest = ? AND ref_count <= 0', (digest,))
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"Blob cleanup error: {e}")
+
+def discard_blob(digest):
+    """Remove a placed blob whose owning insert was rolled back, unless someone else uses it."""
+    conn = get_conn()
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        cursor = conn.cursor()
+        cursor.execute('SELECT 1 FROM blobs WHERE digest = ?', (digest,))
+        if cursor.fetchone() is None:
+            blob_storage.delete(BLOB_PREFIX + digest)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"Blob cleanup error: {e}")
+
+class WriteBatcher:
+    """Per-process group commit for request inserts.
+
+    Request threads queue a write and block on a Future; one writer thread
+    runs everything queued within WRITE_BATCH_WINDOW in a single
+    transaction. Each write gets its own savepoint, so a failing row (say a
+    duplicate email) is rolled back alone and its exception is raised in
+    the request that queued it.
+    """
+
+    def __init__(self, window, max_batch):
+        self.window = window
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._pending = deque()  # (write, staged, future)
+        self._pid = None
+
+    def submit(self, write, staged=None):
+        """Run write(cursor, stored_path) in the next batch and return its result.
+
+        stored_path is where the staged upload (if any) was placed, as in
+        blob_transaction(). Without a batch window the write runs directly.
+        """
+        if self.window <= 0:
+            conn = get_conn()
+            with blob_transaction(conn, staged) as path:
+                return write(conn.cursor(), path)
+        future = Future()
+        entry = (write, staged, future)
+        with self._cond:
+            if self._pid != os.getpid():
+                # First use in this process (or first use after a fork)
+                self._pid = os.getpid()
+                self._pending.clear()
+                threading.Thread(target=self._run, name='write-batcher', daemon=True).start()
+            self._pending.append(entry)
+            self._cond.notify()
+        try:
+            try:
+                return future.result(timeout=WRITE_BATCH_TIMEOUT)
+            except TimeoutError:
+                with self._cond:
+                    queued = any(pending is entry for pending in self._pending)
+                    if queued:
+                        self._pending.remove(entry)
+                if queued:
+                    raise  # Never started, so it will not commit
+                # Already in a batch: report what that batch does, not a failure it may contradict
+                return future.result()
+        finally:
+            discard_staged(staged)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                deadline = time.monotonic() + self.window
+                while len(self._pending) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = [self._pending.popleft() for _ in range(min(len(self._pending), self.max_batch))]
+            try:
+                self._commit(batch)
+            except Exception as e:
+                print(f"Write batch error: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _commit(self, batch):
+        conn = get_conn()
+        cursor = conn.cursor()
+        results = []   # (future, result, error)
+        placed = []    # blobs placed in this transaction
+        orphaned = []  # blobs whose owning write was rolled back
+        try:
+            execute_with_retry(cursor, 'BEGIN IMMEDIATE')
+            for write, staged, future in batch:
+                path = None
+                cursor.execute('SAVEPOINT batched_write')
+                try:
+                    if staged:
+                        path = place_blob(cursor, staged)
+                        placed.append(staged.digest)
+                    result = write(cursor, path)
+                except Exception as e:
+                    cursor.execute('ROLLBACK TO batched_write')
+                    cursor.execute('RELEASE batched_write')
+                    results.append((future, None, e))
+                    if path:
+                        orphaned.append(staged.digest)
+                    continue
+                cursor.execute('RELEASE batched_write')
+                results.append((future, result, None))
+            conn.commit()
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            for digest in placed:
+                discard_blob(digest)
+            raise
+        for digest in orphaned:
+            discard_blob(digest)
+        for future, result, error in results:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+write_batcher = WriteBatcher(WRITE_BATCH_WINDOW, WRITE_BATCH_MAX)
+
+@app.route('/admin/upload-document', methods=['POST'])
+@login_required
+def upload_document():
+    if 'file' not in request.files:
+        return jsonify({'success': False, 'message': 'No file selected'})
     
     file = request.files['file']
     title = request.form.get('title')
@@ -327,36 +1989,228 @@ def upload_document():
         return jsonify({'success': False, 'message': 'No file selected'})
     
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        unique_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-        file.save(file_path)
+        staged = stage_upload(file)
+        filename = staged.filename
         
         conn = get_conn()
         cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO documents (title, description, filename, original_filename, file_type)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (title, description, unique_filename, filename, filename.rsplit('.', 1)[1].lower()))
-        conn.commit()
-        conn.close()
+        with blob_transaction(conn, staged) as stored_filename:
+            cursor.execute('''
+                INSERT INTO documents (title, description, filename, original_filename, file_type)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (title, description, stored_filename, filename, filename.rsplit('.', 1)[1].lower()))
+        response_cache.invalidate('documents')
         
         return jsonify({'success': True, 'message': 'Document uploaded successfully'})
     
     return jsonify({'success': False, 'message': 'Invalid file type. Only PDF, DOC, DOCX allowed'})
 
+# List and export schema per resource: (column, JSON key, CSV header) per field
+LISTINGS = {
+    'registrations': {
+        'columns': [('id', 'id', 'ID'), ('team_name', 'team_name', 'Team Name'),
+                    ('leader_name', 'leader_name', 'Leader Name'), ('email', 'email', 'Email'),
+                    ('phone', 'phone', 'Phone'), ('university', 'university', 'University'),
+                    ('theme', 'theme', 'Theme'), ('team_members', 'team_members', 'Team Members'),
+                    ('registration_date', 'registration_date', 'Registration Date')],
+        'order': 'registration_date',
+        'filters': ('theme', 'university'),
+        'search': ('team_name', 'leader_name', 'email'),
+        'stat': 'registrations',
+        'export': True
+    },
+    'submissions': {
+        'columns': [('id', 'id', 'ID'), ('team_name', 'team_name', 'Team Name'), ('email', 'email', 'Email'),
+                    ('project_title', 'project_title', 'Project Title'),
+                    ('description', 'description', 'Description'), ('github_url', 'github_url', 'GitHub URL'),
+                    ('demo_url', 'demo_url', 'Demo URL'), ('video_url', 'video_url', 'Video URL'),
+                    ('theme', 'theme', 'Theme'), ('presentation_file', 'presentation_file', 'Presentation File'),
+                    ('submission_date', 'submission_date', 'Submission Date')],
+        'order': 'submission_date',
+        'filters': ('theme',),
+        'search': ('team_name', 'project_title', 'email'),
+        'stat': 'submissions',
+        'export': True
+    },
+    'documents': {
+        'columns': [('id', 'id', 'ID'), ('title', 'title', 'Title'), ('description', 'description', 'Description'),
+                    ('original_filename', 'filename', 'Filename'), ('file_type', 'file_type', 'File Type'),
+                    ('created_at', 'created_at', 'Created At')],
+        'order': 'created_at',
+        'filters': ('file_type',),
+        'search': ('title',),
+        'export': True
+    },
+    'notices': {
+        'columns': [('id', 'id', 'ID'), ('content', 'content', 'Content'), ('file_path', 'file_path', 'File'),
+                    ('original_filename', 'original_filename', 'Filename'), ('created_at', 'created_at', 'Created At')],
+        'order': 'created_at',
+        'where': 'is_active = 1',
+        'filters': (),
+        'search': ('content',)
+    },
+    'announcements': {
+        'columns': [('id', 'id', 'ID'), ('title', 'title', 'Title'), ('content', 'content', 'Content'),
+                    ('created_at', 'created_at', 'Created At')],
+        'order': 'created_at',
+        'filters': (),
+        'search': ('title',)
+    }
+}
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+STREAM_BATCH_SIZE = 500
+
+# Rows hold only str/int/float/None, so skip the Flask provider's key sorting and default hook
+encode_json = json.JSONEncoder(separators=(',', ':'), check_circular=False).encode
+
+def json_response(payload, status=200):
+    return Response(encode_json(payload), status=status, mimetype='application/json')
+
+def select_fields(resource):
+    return ', '.join(column for column, _, _ in LISTINGS[resource]['columns'])
+
+def field_keys(resource):
+    return tuple(key for _, key, _ in LISTINGS[resource]['columns'])
+
+def field_headers(resource):
+    return [header for _, _, header in LISTINGS[resource]['columns']]
+
+def row_factory(resource):
+    """sqlite3 row factory building dicts keyed by the resource's declared JSON keys."""
+    keys = field_keys(resource)
+    return lambda cursor, row: dict(zip(keys, row))
+
+def json_array_stream(resource, query, params):
+    """Yield a JSON array of rows in fetchmany() batches so memory stays flat."""
+    ensure_schema()
+    conn = _connect()  # Own connection: the generator outlives the request's teardown
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        keys = field_keys(resource)  # Inline dicts: cheaper than a row_factory call per row
+        yield '['
+        separator = ''
+        while True:
+            rows = cursor.fetchmany(STREAM_BATCH_SIZE)
+            if not rows:
+                break
+            # One encoder call per batch; drop the batch's own brackets
+            yield separator + encode_json([dict(zip(keys, row)) for row in rows])[1:-1]
+            separator = ','
+        yield ']'
+    finally:
+        conn.close()
+
+def encode_cursor(order_value, row_id):
+    return base64.urlsafe_b64encode(json.dumps([order_value, row_id]).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    try:
+        order_value, row_id = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        # Bound as a query parameter, so only scalars SQLite accepts
+        if not isinstance(order_value, (str, int, float)):
+            return None
+        return order_value, int(row_id)
+    except (ValueError, TypeError):
+        return None
+
+def list_rows(resource):
+    """JSON response listing a table newest first, with optional keyset pagination and filters.
+
+    Without limit/after/before the whole (filtered) list is streamed as one
+    array. With them, the response is {items, total, next_cursor, prev_cursor},
+    where cursors are (order column, id) keys so each page is an index range scan.
+    """
+    spec = LISTINGS[resource]
+    order = spec['order']
+    args = request.args
+
+    conditions = [spec['where']] if spec.get('where') else []
+    params = []
+    for field in spec['filters']:
+        if args.get(field):
+            conditions.append(f'{field} = ?')
+            params.append(args[field])
+    prefix = args.get('q', '').strip()
+    if prefix:
+        pattern = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        conditions.append('(' + ' OR '.join(f"{col} LIKE ? ESCAPE '\\'" for col in spec['search']) + ')')
+        params.extend([pattern] * len(spec['search']))
+    filtered = len(params) > 0
+
+    select = f"SELECT {select_fields(resource)} FROM {resource}"
+    order_key = next(key for column, key, _ in spec['columns'] if column == order)
+
+    paged = any(name in args for name in ('limit', 'after', 'before'))
+    if not paged:
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        return Response(json_array_stream(resource, f'{select}{where} ORDER BY {order} DESC, id DESC', params),
+                        mimetype='application/json')
+
+    conn = get_conn()
+    cursor = conn.cursor()
+
+    try:
+        limit = max(1, min(int(args.get('limit', PAGE_SIZE)), MAX_PAGE_SIZE))
+    except ValueError:
+        limit = PAGE_SIZE
+
+    page_conditions = list(conditions)
+    page_params = list(params)
+    backwards = False
+    if args.get('after'):
+        key = decode_cursor(args['after'])
+        if key:
+            page_conditions.append(f'({order}, id) < (?, ?)')
+            page_params.extend(key)
+    elif args.get('before'):
+        key = decode_cursor(args['before'])
+        if key:
+            page_conditions.append(f'({order}, id) > (?, ?)')
+            page_params.extend(key)
+            backwards = True
+    where = f" WHERE {' AND '.join(page_conditions)}" if page_conditions else ''
+    direction = 'ASC' if backwards else 'DESC'
+    # Fetch one extra row to learn whether another page exists
+    cursor.row_factory = row_factory(resource)
+    cursor.execute(f'{select}{where} ORDER BY {order} {direction}, id {direction} LIMIT ?', page_params + [limit + 1])
+    rows = cursor.fetchall()
+    cursor.row_factory = None
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+
+    # Unfiltered totals for the big tables come from the live_stats counters
+    if spec.get('stat') and not filtered:
+        cursor.execute('SELECT count FROM live_stats WHERE name = ?', (spec['stat'],))
+        result = cursor.fetchone()
+        total = result[0] if result else 0
+    else:
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        cursor.execute(f'SELECT COUNT(*) FROM {resource}{where}', params)
+        total = cursor.fetchone()[0]
+
+    first = encode_cursor(rows[0][order_key], rows[0]['id']) if rows else None
+    last = encode_cursor(rows[-1][order_key], rows[-1]['id']) if rows else None
+    if backwards:
+        next_cursor, prev_cursor = last, (first if has_more else None)
+    else:
+        next_cursor = last if has_more else None
+        prev_cursor = first if args.get('after') else None
+    return json_response({
+        'items': rows,
+        'total': total,
+        'next_cursor': next_cursor,
+        'prev_cursor': prev_cursor
+    })
+
 @app.route('/admin/documents')
 @login_required
 def get_admin_documents():
-    conn = get_conn()
-    cursor = conn.cursor()
-    cursor.execute('SELECT id, title, description, original_filename, file_type, created_at FROM documents ORDER BY created_at DESC')
-    documents = [{
-        'id': row[0], 'title': row[1], 'description': row[2], 
-        'filename': row[3], 'file_type': row[4], 'created_at': row[5]
-    } for row in cursor.fetchall()]
-    conn.close()
-    return jsonify(documents)
+    return list_rows('documents')
+
 
 @app.route('/admin/delete-document/<int:doc_id>', methods=['DELETE'])
 @login_required
@@ -368,102 +2222,251 @@ def delete_document(doc_id):
     
     if result:
         filename = result[0]
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        # Blobs may be shared and are removed by collect_blobs(); legacy files are per-document
+        if not filename.startswith(BLOB_PREFIX):
+            legacy_storage.delete(filename)
         
         cursor.execute('DELETE FROM documents WHERE id = ?', (doc_id,))
         conn.commit()
+        file_cache.invalidate('documents')
+        collect_blobs()
+        response_cache.invalidate('documents')
     
-    conn.close()
     return jsonify({'success': True})
 
-@app.route('/download/notice/<int:notice_id>')
-def download_notice_file(notice_id):
-    conn = sqlite3.connect('registrations.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT file_path, original_filename FROM notices WHERE id = ?', (notice_id,))
-    result = cursor.fetchone()
-    conn.close()
-    
-    if result and result[0]:
-        file_path, original_filename = result
-        full_path = os.path.join(app.config['UPLOAD_FOLDER'], file_path)
-        if os.path.exists(full_path):
-            from flask import send_file
-            return send_file(full_path, as_attachment=True, download_name=original_filename)
-    
-    return jsonify({'error': 'File not found'}), 404
+# Downloadable files: kind -> (table, stored path column, download name column, public)
+FILE_SOURCES = {
+    'notice': ('notices', 'file_path', 'original_filename', True),
+    'document': ('documents', 'filename', 'original_filename', True),
+    'proposal': ('registrations', 'proposal_file', 'proposal_filename', False),
+    'presentation': ('submissions', 'presentation_file', 'presentation_filename', False),
+}
+# '' serves bytes from Python; 'x-sendfile' (Apache/lighttpd) or 'x-accel' (nginx) hands them to the proxy
+FILE_OFFLOAD = os.environ.get('FILE_OFFLOAD', '')
+X_ACCEL_PREFIX = os.environ.get('X_ACCEL_PREFIX', '/protected-uploads/')
+FILE_MAX_AGE = 365 * 24 * 3600
+# Seconds a worker keeps a file lookup another worker may have made stale (its own deletes apply at once)
+FILE_LOOKUP_TTL = float(os.environ.get('FILE_LOOKUP_TTL', '5'))
+
+StoredFile = namedtuple('StoredFile', 'stored path size mtime download_name etag')
+
+class FileLookupCache:
+    """id -> StoredFile lookups shared by a worker's threads.
+
+    A hit costs no database query. Deletes in this worker drop the table's
+    entries through invalidate(); deletes in other workers are picked up
+    when the entry expires after `ttl` seconds. Rows only gain a file when
+    they are inserted, and misses are not cached, so deletes are the only
+    writes that can make an entry stale.
+    """
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # (kind, id) -> (table, expires, StoredFile)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def put(self, key, table, stored_file):
+        with self._lock:
+            self._entries[key] = (table, time.monotonic() + self.ttl, stored_file)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, *tables):
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if entry[0] in tables]:
+                del self._entries[key]
+
+file_cache = FileLookupCache(1024, FILE_LOOKUP_TTL)
+
+def lookup_file(kind, item_id):
+    table, column, name_column, _ = FILE_SOURCES[kind]
+    cached_file = file_cache.get((kind, item_id))
+    if cached_file is not None:
+        return cached_file
+
+    cursor = get_conn().cursor()
+    cursor.execute(f'SELECT {column}, {name_column} FROM {table} WHERE id = ?', (item_id,))
+    row = cursor.fetchone()
+    if not row or not row[0]:
+        return None
+    stored, download_name = row
+    # Early presentation uploads stored the upload folder as part of the path
+    folder_prefix = app.config['UPLOAD_FOLDER'].rstrip('/') + '/'
+    if stored.startswith(folder_prefix):
+        stored = stored[len(folder_prefix):]
+    storage = storage_for(stored)
+    stat = storage.stat(stored)
+    if stat is None:
+        return None
+    if stored.startswith(BLOB_PREFIX):
+        etag = stored[len(BLOB_PREFIX):]  # Content hash
+    else:
+        etag = f"{stat.size:x}-{int(stat.mtime):x}"
+    # path is None for files in object storage
+    stored_file = StoredFile(stored, storage.local_path(stored), stat.size, stat.mtime,
+                             download_name or os.path.basename(stored), etag)
+    file_cache.put((kind, item_id), table, stored_file)
+    return stored_file
+
+def stream_object(storage, stored_file, mimetype, inline):
+    """Stream an object-storage file through the worker, honouring a single Range."""
+    if stored_file.etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(stored_file.etag)
+        return response
+    start, stop = 0, stored_file.size
+    byte_range = request.range
+    if_range = request.if_range
+    if (byte_range and len(byte_range.ranges) == 1
+            and if_range.etag in (None, stored_file.etag)
+            and (if_range.date is None or if_range.date.timestamp() >= int(stored_file.mtime))):
+        bounds = byte_range.range_for_length(stored_file.size)
+        if bounds is None:
+            response = Response(status=416)
+            response.headers['Content-Range'] = f'bytes */{stored_file.size}'
+            return response
+        start, stop = bounds
+    # direct_passthrough: already-compressed uploads are not run through compress_response
+    response = Response(storage.read(stored_file.stored, start, stop), mimetype=mimetype, direct_passthrough=True)
+    response.content_length = stop - start
+    if (start, stop) != (0, stored_file.size):
+        response.status_code = 206
+        response.headers['Content-Range'] = f'bytes {start}-{stop - 1}/{stored_file.size}'
+    response.accept_ranges = 'bytes'
+    response.last_modified = stored_file.mtime
+    response.set_etag(stored_file.etag)
+    if not inline:
+        response.headers.set('Content-Disposition', 'attachment', filename=stored_file.download_name)
+    return response
+
+def serve_file(kind, item_id, inline=False):
+    """Send an uploaded file with ETag, Range (206) and long-lived caching for blobs."""
+    if kind not in FILE_SOURCES:
+        return jsonify({'error': 'File not found'}), 404
+    if not FILE_SOURCES[kind][3] and 'admin_logged_in' not in session:
+        return redirect(url_for('admin_login'))
+    stored_file = lookup_file(kind, item_id)
+    if stored_file is None:
+        return jsonify({'error': 'File not found'}), 404
+    if inline and not stored_file.download_name.lower().endswith('.pdf'):
+        return jsonify({'error': 'File not found or not viewable'}), 404
+    mimetype = 'application/pdf' if inline else (mimetypes.guess_type(stored_file.download_name)[0] or 'application/octet-stream')
+
+    if stored_file.path is None:
+        storage = storage_for(stored_file.stored)
+        url = storage.presigned_url(stored_file.stored, stored_file.download_name, mimetype, inline)
+        if url:
+            # The bucket serves the bytes (and Range); cache the redirect for less than the URL lives
+            response = redirect(url)
+            response.cache_control.max_age = S3_PRESIGN_EXPIRES // 2
+            if FILE_SOURCES[kind][3]:
+                response.cache_control.public = True
+            else:
+                response.cache_control.private = True
+            return response
+        response = stream_object(storage, stored_file, mimetype, inline)
+    elif FILE_OFFLOAD:
+        # The proxy streams the bytes (and handles Range); we only authorize and label them
+        if stored_file.etag in request.if_none_match:
+            response = Response(status=304)
+        else:
+            response = Response(mimetype=mimetype)
+            if FILE_OFFLOAD == 'x-accel':
+                response.headers['X-Accel-Redirect'] = X_ACCEL_PREFIX + stored_file.stored
+            else:
+                response.headers['X-Sendfile'] = stored_file.path
+            if not inline:
+                response.headers.set('Content-Disposition', 'attachment', filename=stored_file.download_name)
+        response.set_etag(stored_file.etag)
+    else:
+        try:
+            response = send_file(stored_file.path, mimetype=mimetype, as_attachment=not inline,
+                                 download_name=stored_file.download_name, etag=stored_file.etag,
+                                 last_modified=stored_file.mtime, conditional=True)
+        except FileNotFoundError:
+            file_cache.discard((kind, item_id))
+            return jsonify({'error': 'File not found'}), 404
+
+    # Blobs never change under their digest; legacy files are revalidated
+    if stored_file.stored.startswith(BLOB_PREFIX):
+        response.cache_control.no_cache = None  # send_file's default
+        response.cache_control.max_age = FILE_MAX_AGE
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    if FILE_SOURCES[kind][3]:
+        response.cache_control.public = True
+    else:
+        response.cache_control.private = True
+    return response
+
+@app.route('/download/<kind>/<int:item_id>')
+def download_file(kind, item_id):
+    return serve_file(kind, item_id)
+
+@app.route('/view/<kind>/<int:item_id>')
+def view_file(kind, item_id):
+    return serve_file(kind, item_id, inline=True)
 
 @app.route('/notice/<int:notice_id>')
+@page('notices')
 def notice_details(notice_id):
-    conn = sqlite3.connect('registrations.db')
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute('SELECT id, content, file_path, original_filename, created_at FROM notices WHERE id = ? AND is_active = 1', (notice_id,))
+    cursor.row_factory = row_factory('notices')
+    cursor.execute(f"SELECT {select_fields('notices')} FROM notices WHERE id = ? AND is_active = 1", (notice_id,))
     notice = cursor.fetchone()
-    conn.close()
     
     if notice:
-        notice_data = {
-            'id': notice[0],
-            'content': notice[1], 
-            'file_path': notice[2],
-            'original_filename': notice[3],
-            'created_at': notice[4]
-        }
-        return render_template('notice_details.html', notice=notice_data)
+        return render_template('notice_details.html', notice=notice)
     
     return jsonify({'error': 'Notice not found'}), 404
 
-@app.route('/view/notice/<int:notice_id>')
-def view_notice_file(notice_id):
-    conn = sqlite3.connect('registrations.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT file_path, original_filename FROM notices WHERE id = ?', (notice_id,))
-    result = cursor.fetchone()
-    conn.close()
-    
-    if result and result[0]:
-        file_path, original_filename = result
-        full_path = os.path.join(app.config['UPLOAD_FOLDER'], file_path)
-        if os.path.exists(full_path) and original_filename.lower().endswith('.pdf'):
-            from flask import send_file
-            return send_file(full_path, mimetype='application/pdf')
-    
-    return jsonify({'error': 'File not found or not viewable'}), 404
-
 @app.route('/api/documents')
+@conditional('documents')
+@cached('documents')
 def get_public_documents():
-    conn = sqlite3.connect('registrations.db')
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute('SELECT id, title, description, original_filename, file_type, created_at FROM documents ORDER BY created_at DESC')
-    documents = [{
-        'id': row[0], 'title': row[1], 'description': row[2], 
-        'filename': row[3], 'file_type': row[4], 'created_at': row[5]
-    } for row in cursor.fetchall()]
-    conn.close()
-    return jsonify(documents)
+    cursor.row_factory = row_factory('documents')
+    cursor.execute(f"SELECT {select_fields('documents')} FROM documents ORDER BY created_at DESC")
+    return json_response(cursor.fetchall())
 
 @app.route('/api/notices')
+@conditional('notices')
+@cached('notices')
 def get_notices():
-    conn = sqlite3.connect('registrations.db')
+    conn = get_conn()
     cursor = conn.cursor()
     cursor.execute('SELECT content FROM notices WHERE is_active = 1 ORDER BY created_at DESC')
-    notices = [row[0] for row in cursor.fetchall()]
-    conn.close()
-    return jsonify(notices)
+    return json_response([content for content, in cursor.fetchall()])
 
 @app.route('/admin/notices')
 @login_required
 def get_admin_notices():
-    conn = sqlite3.connect('registrations.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT id, content, file_path, original_filename, created_at FROM notices WHERE is_active = 1 ORDER BY created_at DESC')
-    notices = [{'id': row[0], 'content': row[1], 'file_path': row[2], 'original_filename': row[3], 'created_at': row[4]} for row in cursor.fetchall()]
-    conn.close()
-    return jsonify(notices)
+    return list_rows('notices')
+
 
 @app.route('/register', methods=['GET', 'POST'])
+@page()
+@admitted('register')
 def register():
     if request.method == 'GET':
         return render_template('register.html')
@@ -484,9 +2487,6 @@ def register():
         else:
             data = request.get_json()
         
-        conn = get_conn()
-        cursor = conn.cursor()
-        
         # Process team members
         team_members = []
         for i in range(1, 5):
@@ -498,31 +2498,9 @@ def register():
                     'email': data.get(email_key, '')
                 })
         
-        import json
         team_members_json = json.dumps(team_members) if team_members else None
         
-        # Optional proposal file upload
-        saved_proposal = None
-        if is_multipart and 'proposal' in request.files:
-            file = request.files['proposal']
-            if file and file.filename and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                unique_filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-                if not os.path.exists(app.config['UPLOAD_FOLDER']):
-                    os.makedirs(app.config['UPLOAD_FOLDER'])
-                file.save(file_path)
-                saved_proposal = unique_filename
-        
-        # Acquire an IMMEDIATE transaction to reduce contention
-        try:
-            conn.execute('BEGIN IMMEDIATE')
-        except sqlite3.OperationalError:
-            pass
-        execute_with_retry(cursor, '''
-            INSERT INTO registrations (team_name, leader_name, email, phone, university, theme, team_members, github_link, proposal_file)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        values = (
             data['teamName'],
             data['leaderName'],
             data['email'],
@@ -531,11 +2509,21 @@ def register():
             data['theme'],
             team_members_json,
             (data.get('githubLink') if isinstance(data, dict) else ''),
-            saved_proposal
-        ))
+        )
+
+        # Optional proposal file upload
+        staged = None
+        if is_multipart and 'proposal' in request.files:
+            file = request.files['proposal']
+            if file and file.filename and allowed_file(file.filename):
+                staged = stage_upload(file)
         
-        conn.commit()
-        conn.close()
+        # Committed together with other registrations arriving within the batch window
+        write_batcher.submit(lambda cursor, saved_proposal: cursor.execute('''
+                INSERT INTO registrations (team_name, leader_name, email, phone, university, theme, team_members, github_link, proposal_file, proposal_filename)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', values + (saved_proposal, staged.filename if staged else None)), staged)
+        change_feed.poke()
         
         # Email sending removed for Render deployment stability
         
@@ -549,80 +2537,90 @@ def register():
 
 @app.route('/registrations', methods=['GET'])
 @login_required
+@conditional('registrations', private=True)
 def get_registrations():
-    conn = get_conn()
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT id, team_name, leader_name, email, phone, university, theme, team_members, registration_date
-        FROM registrations ORDER BY registration_date DESC
-    ''')
-    registrations = cursor.fetchall()
-    conn.close()
-    
-    return jsonify([{
-        'id': r[0],
-        'team_name': r[1],
-        'leader_name': r[2],
-        'email': r[3],
-        'phone': r[4],
-        'university': r[5],
-        'theme': r[6],
-        'team_members': r[7],
-        'registration_date': r[8]
-    } for r in registrations])
+    return list_rows('registrations')
+
+EXPORT_BATCH_SIZE = 1000
+
+class _LineBuffer:
+    """File-like sink that hands back whatever csv.writer writes to it."""
+
+    def write(self, value):
+        return value
+
+def export_rows(resource, query, params, fmt):
+    """Yield the export body in fetchmany() batches so memory stays flat."""
+    import csv
+    ensure_schema()
+    conn = _connect()  # Own connection: the generator outlives the request's teardown
+    try:
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        names = field_keys(resource)
+        writer = csv.writer(_LineBuffer())
+        if fmt == 'csv':
+            yield writer.writerow(field_headers(resource))
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                break
+            if fmt == 'csv':
+                yield ''.join(writer.writerow(row) for row in rows)
+            else:
+                yield ''.join(encode_json(dict(zip(names, row))) + '\n' for row in rows)
+    finally:
+        conn.close()
+
 
 @app.route('/admin/export')
 @login_required
 def export_registrations():
-    conn = sqlite3.connect('registrations.db')
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT id, team_name, leader_name, email, phone, university, theme, team_members, registration_date
-        FROM registrations ORDER BY registration_date DESC
-    ''')
-    registrations = cursor.fetchall()
-    conn.close()
-    
-    import csv
-    import io
-    from flask import make_response
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['ID', 'Team Name', 'Leader Name', 'Email', 'Phone', 'University', 'Theme', 'Team Members', 'Registration Date'])
-    
-    for reg in registrations:
-        writer.writerow(reg)
-    
-    response = make_response(output.getvalue())
-    response.headers['Content-Type'] = 'text/csv'
-    response.headers['Content-Disposition'] = 'attachment; filename=registrations.csv'
+    resource = request.args.get('resource', 'registrations')
+    fmt = request.args.get('format', 'csv')
+    if not LISTINGS.get(resource, {}).get('export') or fmt not in ('csv', 'ndjson'):
+        return jsonify({'success': False, 'message': 'Unsupported export'}), 400
+    spec = LISTINGS[resource]
+
+    conditions = []
+    params = []
+    for field in spec['filters']:
+        value = request.args.get(field)
+        if value:
+            conditions.append(f'{field} = ?')
+            params.append(value)
+    # Dates are YYYY-MM-DD; 'to' is inclusive
+    if request.args.get('from'):
+        conditions.append(f"{spec['order']} >= date(?)")
+        params.append(request.args['from'])
+    if request.args.get('to'):
+        conditions.append(f"{spec['order']} < date(?, '+1 day')")
+        params.append(request.args['to'])
+
+    query = f"SELECT {select_fields(resource)} FROM {resource}"
+    if conditions:
+        query += ' WHERE ' + ' AND '.join(conditions)
+    query += f" ORDER BY {spec['order']} DESC"
+
+    body = export_rows(resource, query, params, fmt)
+    filename = f"{resource}.{fmt}"
+    mimetype = 'text/csv' if fmt == 'csv' else 'application/x-ndjson'
+    if request.args.get('gzip') in ('1', 'true'):
+        body = _compressed_stream(body, 'gzip')
+        filename += '.gz'
+        mimetype = 'application/gzip'
+
+    response = Response(body, mimetype=mimetype)
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
     return response
 
 @app.route('/submit-project', methods=['POST'])
+@admitted('submit')
 def submit_project():
     try:
         data = request.form
         
-        # Handle file upload
-        presentation_file = None
-        if 'presentation' in request.files:
-            file = request.files['presentation']
-            if file.filename:
-                import os
-                upload_folder = 'uploads'
-                if not os.path.exists(upload_folder):
-                    os.makedirs(upload_folder)
-                presentation_file = f"{upload_folder}/{data['teamName']}_{file.filename}"
-                file.save(presentation_file)
-        
-        conn = sqlite3.connect('registrations.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO submissions (team_name, email, project_title, description, github_url, demo_url, video_url, theme, presentation_file)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        values = (
             data['teamName'],
             data['email'],
             data['projectTitle'],
@@ -631,11 +2629,20 @@ def submit_project():
             data.get('demoUrl', ''),
             data.get('videoUrl', ''),
             data['theme'],
-            presentation_file
-        ))
+        )
         
-        conn.commit()
-        conn.close()
+        # Handle file upload
+        staged = None
+        if 'presentation' in request.files:
+            file = request.files['presentation']
+            if file.filename:
+                staged = stage_upload(file)
+        
+        write_batcher.submit(lambda cursor, presentation_file: cursor.execute('''
+                INSERT INTO submissions (team_name, email, project_title, description, github_url, demo_url, video_url, theme, presentation_file, presentation_filename)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', values + (presentation_file, staged.filename if staged else None)), staged)
+        change_feed.poke()
         
         return jsonify({'success': True, 'message': 'Project submitted successfully!'})
     
@@ -646,89 +2653,265 @@ def submit_project():
 @app.route('/submissions')
 @login_required
 def view_submissions():
-    conn = sqlite3.connect('registrations.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM submissions ORDER BY submission_date DESC')
-    submissions = cursor.fetchall()
-    conn.close()
-    
-    return jsonify([{
-        'id': s[0],
-        'team_name': s[1],
-        'email': s[2],
-        'project_title': s[3],
-        'description': s[4],
-        'github_url': s[5],
-        'demo_url': s[6],
-        'video_url': s[7],
-        'theme': s[8],
-        'presentation_file': s[9],
-        'submission_date': s[10]
-    } for s in submissions])
+    return list_rows('submissions')
+
+
+# Outgoing mail (participant notifications)
+MAIL_SERVER = os.environ.get('MAIL_SERVER', 'smtp.gmail.com')
+MAIL_PORT = int(os.environ.get('MAIL_PORT', '587'))
+MAIL_USE_TLS = os.environ.get('MAIL_USE_TLS', '1') not in ('0', 'false', 'False')
+MAIL_USERNAME = os.environ.get('MAIL_USERNAME', '')
+MAIL_PASSWORD = os.environ.get('MAIL_PASSWORD', '')
+MAIL_SENDER = os.environ.get('MAIL_DEFAULT_SENDER', MAIL_USERNAME)
+MAIL_WORKERS = int(os.environ.get('MAIL_WORKERS', '2'))
+MAIL_RATE = float(os.environ.get('MAIL_RATE', '5'))  # messages per second per process, 0 = unlimited
+MAIL_BATCH_SIZE = int(os.environ.get('MAIL_BATCH_SIZE', '50'))  # messages sent over one SMTP connection
+MAIL_MAX_ATTEMPTS = int(os.environ.get('MAIL_MAX_ATTEMPTS', '5'))
+MAIL_RETRY_DELAY = float(os.environ.get('MAIL_RETRY_DELAY', '30'))  # doubled after every failed attempt
+OUTBOX_POLL_INTERVAL = 5
+OUTBOX_LEASE = 15 * 60  # a 'sending' row older than this was claimed by a worker that died
+
+def build_notification(subject, message, email, name):
+    from email.message import EmailMessage  # Only the mail workers need it
+    msg = EmailMessage()
+    msg['Subject'] = subject
+    msg['From'] = MAIL_SENDER
+    msg['To'] = email
+    msg.set_content(f"Hi {name},\n\n{message}\n\nBest regards,\nNECSprint Team\n")
+    body = html.escape(message).replace('\n', '<br>')
+    msg.add_alternative(f'''
+    <h2>{html.escape(subject)}</h2>
+    <p>Hi {html.escape(name or '')},</p>
+    <p>{body}</p>
+    <p>Best regards,<br>NECSprint Team</p>
+    ''', subtype='html')
+    return msg
+
+class Notifier:
+    """Per-process pool of mail workers draining the outbox table.
+
+    Workers claim due rows in batches (atomically, so several processes can
+    share the outbox), send each batch over one SMTP connection at no more
+    than MAIL_RATE messages per second, and reschedule failures with
+    exponential backoff until MAIL_MAX_ATTEMPTS.
+    """
+
+    def __init__(self, workers, rate):
+        self.workers = workers
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._next_send = 0.0
+        self._pid = None
+        self._resumed_pid = None
+
+    def ensure_started(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # First use in this process (or first use after a fork)
+            self._pid = os.getpid()
+            for i in range(self.workers):
+                threading.Thread(target=self._run, name=f'mail-worker-{i}', daemon=True).start()
+
+    def resume(self):
+        """Start the workers if the outbox still holds mail from an earlier process.
+
+        Checked once per process, so mail queued before a restart (or claimed by a
+        worker that died) is sent without waiting for the next notification.
+        """
+        if self._resumed_pid == os.getpid():
+            return
+        with self._lock:
+            if self._resumed_pid == os.getpid():
+                return
+            self._resumed_pid = os.getpid()
+        # 'sending' rows held by a live process are skipped by _claim until their lease runs out
+        row = get_conn().execute("SELECT 1 FROM outbox WHERE status IN ('pending', 'sending') LIMIT 1").fetchone()
+        if row:
+            self.ensure_started()
+
+    def poke(self):
+        self._wake.set()
+
+    def _throttle(self):
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_send)
+            self._next_send = slot + 1 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _run(self):
+        while True:
+            try:
+                batch = self._claim()
+                if batch:
+                    self._send(batch)
+                    continue
+            except Exception as e:
+                print(f"Mail worker error: {e}")
+            self._wake.wait(OUTBOX_POLL_INTERVAL)
+            self._wake.clear()
+
+    def _claim(self):
+        conn = get_conn()
+        now = time.time()
+        cursor = conn.execute('''
+            UPDATE outbox SET status = 'sending', claimed_at = ?
+            WHERE id IN (
+                SELECT id FROM outbox WHERE status = 'pending' AND next_attempt_at <= ?
+                UNION ALL
+                SELECT id FROM outbox WHERE status = 'sending' AND claimed_at < ?
+                LIMIT ?
+            )
+            RETURNING id, job_id, email, name, attempts
+        ''', (now, now, now - OUTBOX_LEASE, MAIL_BATCH_SIZE))
+        batch = cursor.fetchall()
+        conn.commit()
+        if batch:
+            placeholders = ','.join('?' * len(batch))
+            jobs = {row[0]: row[1:] for row in conn.execute(
+                f'SELECT id, subject, message FROM notification_jobs WHERE id IN ({placeholders})',
+                [row[1] for row in batch])}
+            batch = [(row_id, jobs[job_id], email, name, attempts)
+                     for row_id, job_id, email, name, attempts in batch if job_id in jobs]
+        return batch
+
+    def _send(self, batch):
+        import smtplib  # Deferred: most processes never send mail
+        conn = get_conn()
+        pending = list(batch)
+        try:
+            with smtplib.SMTP(MAIL_SERVER, MAIL_PORT, timeout=30) as smtp:
+                if MAIL_USE_TLS:
+                    smtp.starttls()
+                if MAIL_USERNAME:
+                    smtp.login(MAIL_USERNAME, MAIL_PASSWORD)
+                while pending:
+                    row_id, (subject, message), email, name, attempts = pending[0]
+                    self._throttle()
+                    try:
+                        smtp.send_message(build_notification(subject, message, email, name))
+                    except smtplib.SMTPRecipientsRefused as e:
+                        # Permanent for this address; the connection is still fine
+                        self._fail(conn, row_id, attempts, e, permanent=True)
+                    except (smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                        self._fail(conn, row_id, attempts, e, permanent=e.smtp_code >= 500)
+                    else:
+                        conn.execute("UPDATE outbox SET status = 'sent', sent_at = CURRENT_TIMESTAMP, last_error = NULL WHERE id = ?",
+                                     (row_id,))
+                        conn.commit()
+                    pending.pop(0)
+        except (smtplib.SMTPException, OSError) as e:
+            # Connection-level failure: back off everything this batch had left
+            print(f"SMTP error: {e}")
+            for row_id, _, _, _, attempts in pending:
+                self._fail(conn, row_id, attempts, e)
+
+    def _fail(self, conn, row_id, attempts, error, permanent=False):
+        attempts += 1
+        if permanent or attempts >= MAIL_MAX_ATTEMPTS:
+            conn.execute("UPDATE outbox SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+                         (attempts, str(error)[:500], row_id))
+        else:
+            delay = MAIL_RETRY_DELAY * 2 ** (attempts - 1) * random.uniform(0.8, 1.2)
+            conn.execute("UPDATE outbox SET status = 'pending', attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+                         (attempts, time.time() + delay, str(error)[:500], row_id))
+        conn.commit()
+
+notifier = Notifier(MAIL_WORKERS, MAIL_RATE)
+
+@app.before_request
+def resume_mail():
+    try:
+        notifier.resume()
+    except sqlite3.Error as e:
+        print(f"Error checking the outbox: {e}")
 
 @app.route('/send-notification', methods=['POST'])
 @login_required
 def send_notification():
+    """Queue a notification for every (or every theme's) registration and return its job id."""
     try:
         data = request.get_json()
+        if not MAIL_SENDER:
+            return jsonify({'success': False, 'message': 'Email is not configured (set MAIL_USERNAME or MAIL_DEFAULT_SENDER)'})
         
-        conn = sqlite3.connect('registrations.db')
+        conn = get_conn()
         cursor = conn.cursor()
         
-        # Get recipients based on selection
+        execute_with_retry(cursor, 'BEGIN IMMEDIATE')
+        cursor.execute('INSERT INTO notification_jobs (subject, message, recipients) VALUES (?, ?, ?)',
+                       (data['subject'], data['message'], data['recipients']))
+        job_id = cursor.lastrowid
+        # Recipients based on selection; the theme filter is served by idx_registrations_theme
         if data['recipients'] == 'all':
-            cursor.execute('SELECT email, leader_name FROM registrations')
+            cursor.execute('INSERT INTO outbox (job_id, email, name) SELECT ?, email, leader_name FROM registrations',
+                           (job_id,))
         else:
-            cursor.execute('SELECT email, leader_name FROM registrations WHERE theme = ?', (data['recipients'],))
-        
-        recipients = cursor.fetchall()
-        conn.close()
-        
-        # Send emails
-        sent_count = 0
-        for email, name in recipients:
-            try:
-                msg = Message(
-                    data['subject'],
-                    recipients=[email]
-                )
-                msg.html = f'''
-                <h2>{data['subject']}</h2>
-                <p>Hi {name},</p>
-                <p>{data['message']}</p>
-                <p>Best regards,<br>NECSprint Team</p>
-                '''
-                mail.send(msg)
-                sent_count += 1
-            except Exception as e:
-                print(f"Failed to send email to {email}: {e}")
+            cursor.execute('INSERT INTO outbox (job_id, email, name) SELECT ?, email, leader_name FROM registrations WHERE theme = ?',
+                           (job_id, data['recipients']))
+        total = cursor.rowcount
+        cursor.execute('UPDATE notification_jobs SET total = ? WHERE id = ?', (total, job_id))
+        conn.commit()
         
+        notifier.ensure_started()
+        notifier.poke()
         return jsonify({
-            'success': True, 
-            'message': f'Notification sent to {sent_count} recipients'
-        })
+            'success': True,
+            'job_id': job_id,
+            'total': total,
+            'message': f'Notification queued for {total} recipients'
+        }), 202
     
     except Exception as e:
         print(f"Notification error: {e}")
         return jsonify({'success': False, 'message': 'Failed to send notifications'})
 
+@app.route('/admin/notifications/<int:job_id>')
+@login_required
+def notification_progress(job_id):
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute('SELECT subject, recipients, total, created_at FROM notification_jobs WHERE id = ?', (job_id,))
+    job = cursor.fetchone()
+    if not job:
+        return jsonify({'error': 'Notification not found'}), 404
+    cursor.execute('SELECT status, COUNT(*) FROM outbox WHERE job_id = ? GROUP BY status', (job_id,))
+    counts = dict(cursor.fetchall())
+    cursor.execute("SELECT email, last_error FROM outbox WHERE job_id = ? AND status = 'failed' LIMIT 20", (job_id,))
+    failures = [{'email': row[0], 'error': row[1]} for row in cursor.fetchall()]
+    # Picks up jobs left behind by a restart
+    notifier.ensure_started()
+    progress = {status: counts.get(status, 0) for status in ('pending', 'sending', 'sent', 'failed')}
+    return jsonify({
+        'id': job_id,
+        'subject': job[0],
+        'recipients': job[1],
+        'total': job[2],
+        'created_at': job[3],
+        **progress,
+        'done': progress['pending'] + progress['sending'] == 0,
+        'failures': failures
+    })
+
 @app.route('/admin/delete-registration/<int:registration_id>', methods=['DELETE'])
 @login_required
 def delete_registration(registration_id):
     try:
-        conn = sqlite3.connect('registrations.db')
+        conn = get_conn()
         cursor = conn.cursor()
         
-        # Check if registration exists
-        cursor.execute('SELECT id FROM registrations WHERE id = ?', (registration_id,))
-        if not cursor.fetchone():
-            conn.close()
-            return jsonify({'success': False, 'message': 'Registration not found'})
-        
-        # Delete the registration
         cursor.execute('DELETE FROM registrations WHERE id = ?', (registration_id,))
         conn.commit()
-        conn.close()
+        if not cursor.rowcount:
+            return jsonify({'success': False, 'message': 'Registration not found'})
+        file_cache.invalidate('registrations')
+        collect_blobs()
+        change_feed.poke()
         
         return jsonify({'success': True, 'message': 'Registration deleted successfully'})
     
@@ -736,21 +2919,420 @@ def delete_registration(registration_id):
         print(f"Delete error: {e}")
         return jsonify({'success': False, 'message': 'Failed to delete registration'})
 
+# Bulk admin operations: kind -> (table, response_cache tables, legacy upload column)
+BULK_DELETES = {
+    'registrations': ('registrations', (), None),
+    'submissions': ('submissions', (), None),
+    'notices': ('notices', ('notices',), None),
+    'announcements': ('announcements', ('announcements',), None),
+    'documents': ('documents', ('documents',), 'filename'),
+}
+BULK_CHUNK_SIZE = 500  # ids per DELETE ... IN (...), below SQLite's bound-parameter limit
+IMPORT_CHUNK_SIZE = 1000  # rows per import transaction
+IMPORT_MAX_ERRORS = 1000  # per-row errors listed in the response
+
+# Import column -> registrations column; keys are matched lowercased without spaces or underscores,
+# so the register form (teamName), the DB (team_name) and the export headers (Team Name) all work
+IMPORT_FIELDS = {
+    'teamname': 'team_name', 'leadername': 'leader_name', 'email': 'email', 'phone': 'phone',
+    'university': 'university', 'theme': 'theme', 'teammembers': 'team_members',
+    'githublink': 'github_link',
+}
+IMPORT_REQUIRED = ('team_name', 'leader_name', 'email', 'university', 'theme')
+IMPORT_COLUMNS = IMPORT_REQUIRED + ('phone', 'team_members', 'github_link')
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+@app.route('/admin/bulk-delete/<kind>', methods=['POST'])
+@login_required
+def bulk_delete(kind):
+    """Delete a list of ids in one transaction: {"ids": [1, 2, ...]}."""
+    if kind not in BULK_DELETES:
+        return jsonify({'success': False, 'message': 'Unknown kind'}), 404
+    table, cache_tables, file_column = BULK_DELETES[kind]
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    # type() rather than isinstance(): bools are ints, and a string would be iterated digit by digit
+    if not isinstance(ids, list) or not all(type(i) is int for i in ids):
+        return jsonify({'success': False, 'message': 'ids must be a list of integers'}), 400
+    ids = sorted(set(ids))
+
+    conn = get_conn()
+    cursor = conn.cursor()
+    deleted = []
+    legacy_files = []
+    returning = f'id, {file_column}' if file_column else 'id'
+    try:
+        execute_with_retry(cursor, 'BEGIN IMMEDIATE')
+        for start in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[start:start + BULK_CHUNK_SIZE]
+            cursor.execute(f"DELETE FROM {table} WHERE id IN ({', '.join('?' * len(chunk))}) RETURNING {returning}",
+                           chunk)
+            for row in cursor.fetchall():
+                deleted.append(row[0])
+                if file_column and row[1] and not row[1].startswith(BLOB_PREFIX):
+                    legacy_files.append(row[1])
+        conn.commit()
+    except Exception as e:
+        if conn.in_transaction:
+            conn.rollback()
+        print(f"Bulk delete error: {e}")
+        return jsonify({'success': False, 'message': f'Failed to delete {kind}'})
+
+    for filename in legacy_files:
+        legacy_storage.delete(filename)
+    if deleted:
+        file_cache.invalidate(table)
+        collect_blobs()
+        if cache_tables:
+            response_cache.invalidate(*cache_tables)
+        change_feed.poke()
+    found = set(deleted)
+    return jsonify({'success': True, 'deleted': len(deleted), 'missing': [i for i in ids if i not in found]})
+
+def _import_records(stream, fmt):
+    """Yield (row number, dict or error message) from a CSV, JSON array or NDJSON upload."""
+    import csv
+    import codecs
+    if fmt == 'csv':
+        reader = csv.DictReader(codecs.iterdecode(stream, 'utf-8-sig'))
+        for record in reader:
+            yield reader.line_num, record
+    elif fmt == 'ndjson':
+        for line_no, line in enumerate(codecs.iterdecode(stream, 'utf-8-sig'), 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except ValueError:
+                yield line_no, 'Invalid JSON'
+    else:
+        try:
+            records = json.load(codecs.getreader('utf-8-sig')(stream))
+        except ValueError:
+            yield 0, 'Invalid JSON'
+            return
+        if not isinstance(records, list):
+            yield 0, 'Expected a JSON array of registrations'
+            return
+        yield from enumerate(records, 1)
+
+def _import_values(record):
+    """Validate one imported record; returns (values in IMPORT_COLUMNS order, None) or (None, error)."""
+    if not isinstance(record, dict):
+        return None, record if isinstance(record, str) else 'Expected an object'
+    row = {}
+    for key, value in record.items():
+        column = IMPORT_FIELDS.get(re.sub(r'[\s_]', '', str(key)).lower())
+        if column and value is not None:
+            row[column] = value if column == 'team_members' else str(value).strip()
+    missing = [column for column in IMPORT_REQUIRED if not row.get(column)]
+    if missing:
+        return None, f"Missing {', '.join(missing)}"
+    if not EMAIL_PATTERN.match(row['email']):
+        return None, 'Invalid email'
+    members = row.get('team_members')
+    if isinstance(members, str):
+        members = members.strip()
+        try:
+            members = json.loads(members) if members else None
+        except ValueError:
+            return None, 'team_members must be a JSON list'
+    if members is not None and not isinstance(members, list):
+        return None, 'team_members must be a JSON list'
+    row['team_members'] = json.dumps(members) if members else None
+    return tuple(row.get(column) or None for column in IMPORT_COLUMNS), None
+
+def _import_chunk(conn, valid, errors):
+    """Insert one chunk of validated rows in a transaction; returns how many were inserted."""
+    cursor = conn.cursor()
+    try:
+        execute_with_retry(cursor, 'BEGIN IMMEDIATE')
+        # Checked under the write lock, so no registration can slip in before the insert
+        existing = set()
+        emails = [values[2] for _, values in valid]
+        for start in range(0, len(emails), BULK_CHUNK_SIZE):
+            part = emails[start:start + BULK_CHUNK_SIZE]
+            cursor.execute(f"SELECT email FROM registrations WHERE email IN ({', '.join('?' * len(part))})", part)
+            existing.update(row[0] for row in cursor.fetchall())
+        rows = []
+        for row_no, values in valid:
+            if values[2] in existing:
+                errors.append({'row': row_no, 'message': f'Email already registered: {values[2]}'})
+            else:
+                rows.append(values)
+        cursor.executemany(f'''
+            INSERT INTO registrations ({', '.join(IMPORT_COLUMNS)})
+            VALUES ({', '.join('?' * len(IMPORT_COLUMNS))})
+        ''', rows)
+        conn.commit()
+        return len(rows)
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+
+@app.route('/admin/import/registrations', methods=['POST'])
+@login_required
+def import_registrations():
+    """Import registrations from a CSV, JSON array or NDJSON body or 'file' upload.
+
+    Rows are validated one by one and inserted IMPORT_CHUNK_SIZE at a time,
+    each chunk in its own transaction; rejected rows (bad fields, duplicate
+    emails in the file or the database) are reported and the rest imported.
+    """
+    upload = request.files.get('file')
+    if upload is not None:
+        name = (upload.filename or '').lower()
+        stream = upload.stream
+        fmt = 'csv' if name.endswith('.csv') else 'ndjson' if name.endswith(('.ndjson', '.jsonl')) else 'json'
+    else:
+        stream = request.stream
+        mimetype = request.mimetype
+        fmt = 'csv' if mimetype == 'text/csv' else 'ndjson' if mimetype == 'application/x-ndjson' else 'json'
+
+    import csv
+    conn = get_conn()
+    errors = []
+    seen = set()
+    imported = 0
+    valid = []
+    try:
+        try:
+            for row_no, record in _import_records(stream, fmt):
+                values, error = _import_values(record)
+                if error is None and values[2] in seen:
+                    error = f'Duplicate email in file: {values[2]}'
+                if error:
+                    errors.append({'row': row_no, 'message': error})
+                    continue
+                seen.add(values[2])
+                valid.append((row_no, values))
+                if len(valid) >= IMPORT_CHUNK_SIZE:
+                    imported += _import_chunk(conn, valid, errors)
+                    valid = []
+        except (UnicodeDecodeError, csv.Error) as e:
+            errors.append({'row': 0, 'message': f'Could not parse upload: {e}'})
+        if valid:
+            imported += _import_chunk(conn, valid, errors)
+    except Exception as e:
+        print(f"Import error: {e}")
+        return jsonify({'success': False, 'message': 'Import failed', 'imported': imported})
+    finally:
+        if imported:
+            change_feed.poke()
+
+    errors.sort(key=lambda error: error['row'])
+    return jsonify({'success': True, 'imported': imported, 'failed': len(errors),
+                    'errors': errors[:IMPORT_MAX_ERRORS]})
+
+# Online backups: BACKUP_DIR/snapshot-<UTC time>.db.gz plus a sha256sum-style .sha256 file
+SNAPSHOT_PATTERN = re.compile(r'^snapshot-\d{8}-\d{6}\.db\.gz$')
+BACKUP_COPY_CHUNK = 256 * 1024
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(BACKUP_COPY_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class Backups:
+    """Online snapshots of the database, one at a time across all workers.
+
+    The backup API copies BACKUP_PAGES_PER_STEP pages per step, and every
+    step (and every compressed chunk) is followed by a pause that keeps the
+    backup busy for at most BACKUP_DUTY of the time, so requests keep the
+    CPU and disk. The source connection holds one
+    read transaction for the whole copy: in WAL mode that doesn't block
+    writers, and it stops their commits from restarting the copy (which
+    they otherwise do on every step). The copy is checked, gzipped with a
+    checksum file, and snapshots beyond BACKUP_KEEP are removed. The copy
+    is checked with quick_check on restore.
+    """
+
+    def __init__(self, directory, keep, interval):
+        self.directory = directory
+        self.keep = keep
+        self.interval = interval
+        self.last_error = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _file_lock(self):
+        # Yields False when another worker holds BACKUP_DIR/.lock
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, '.lock'), 'w') as lock_file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    yield False
+                    return
+            yield True
+
+    def running(self):
+        if self._lock.locked():
+            return True
+        with self._file_lock() as acquired:
+            return not acquired
+
+    def list(self):
+        """Snapshots, newest first."""
+        snapshots = []
+        if not os.path.isdir(self.directory):
+            return snapshots
+        for name in sorted(os.listdir(self.directory), reverse=True):
+            if not SNAPSHOT_PATTERN.match(name):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                with open(path + '.sha256') as f:
+                    checksum = f.read().split()[0]
+            except (OSError, IndexError):
+                checksum = None
+            stat = os.stat(path)
+            snapshots.append({'name': name, 'size': stat.st_size, 'sha256': checksum,
+                              'created_at': datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat()})
+        return snapshots
+
+    def snapshot(self):
+        """Take a snapshot now and return its name, or None if one is already being taken."""
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            return self._snapshot()
+        finally:
+            self._lock.release()
+
+    def _snapshot(self):
+        import gzip
+        with self._file_lock() as acquired:
+            if not acquired:
+                return None
+            name = f"snapshot-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}.db.gz"
+            path = os.path.join(self.directory, name)
+            copy_path = path[:-len('.gz')] + '.tmp'
+            started = [time.perf_counter()]
+
+            def pause(*progress):
+                time.sleep((time.perf_counter() - started[0]) * (1 - BACKUP_DUTY) / BACKUP_DUTY)
+                started[0] = time.perf_counter()
+
+            try:
+                ensure_schema()
+                source = _connect()
+                try:
+                    target = sqlite3.connect(copy_path)
+                except sqlite3.Error:
+                    source.close()
+                    raise
+                try:
+                    source.execute('BEGIN')
+                    source.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()  # Starts the read transaction
+                    source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=pause)
+                    source.rollback()
+                    target.execute('PRAGMA journal_mode=DELETE')  # A single self-contained file
+                finally:
+                    target.close()
+                    source.close()
+                with open(copy_path, 'rb') as raw, gzip.open(path + '.tmp', 'wb', compresslevel=6) as out:
+                    started[0] = time.perf_counter()
+                    for chunk in iter(lambda: raw.read(BACKUP_COPY_CHUNK), b''):
+                        out.write(chunk)
+                        pause()
+                with open(path + '.sha256.tmp', 'w') as f:
+                    f.write(f"{file_sha256(path + '.tmp')}  {name}\n")
+                os.replace(path + '.tmp', path)
+                os.replace(path + '.sha256.tmp', path + '.sha256')
+            finally:
+                for leftover in (copy_path, path + '.tmp', path + '.sha256.tmp'):
+                    if os.path.exists(leftover):
+                        os.remove(leftover)
+            for old in self.list()[self.keep:]:
+                for suffix in ('', '.sha256'):
+                    if os.path.exists(os.path.join(self.directory, old['name'] + suffix)):
+                        os.remove(os.path.join(self.directory, old['name'] + suffix))
+            return name
+
+    def _run(self, locked=False):
+        if not locked and not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._snapshot()
+            self.last_error = None
+        except Exception as e:
+            print(f"Backup error: {e}")
+            self.last_error = str(e)
+        finally:
+            self._lock.release()
+
+    def start(self):
+        """Take a snapshot in a background thread; False if one is already running."""
+        if self.running() or not self._lock.acquire(blocking=False):
+            return False
+        threading.Thread(target=self._run, args=(True,), name='backup', daemon=True).start()
+        return True
+
+    def run_schedule(self):
+        # Every worker runs this; BACKUP_DIR/.lock lets only one of them take each snapshot
+        while True:
+            time.sleep(BACKUP_CHECK_INTERVAL)
+            newest = self.list()[:1]
+            if not newest or time.time() - os.path.getmtime(os.path.join(self.directory, newest[0]['name'])) >= self.interval:
+                self._run()
+
+backups = Backups(BACKUP_DIR, BACKUP_KEEP, BACKUP_INTERVAL)
+
+def restore_snapshot(snapshot, target):
+    """Verify a snapshot against its .sha256 file and unpack it as a new database at target."""
+    import gzip
+    import shutil
+    if os.path.exists(target):
+        raise FileExistsError(f'{target} already exists; restore into a fresh DATABASE_PATH')
+    with open(snapshot + '.sha256') as f:
+        expected = f.read().split()[0]
+    if file_sha256(snapshot) != expected:
+        raise ValueError(f'{snapshot} does not match its checksum')
+    temp_path = target + '.restore'
+    try:
+        with gzip.open(snapshot, 'rb') as src, open(temp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, BACKUP_COPY_CHUNK)
+        conn = sqlite3.connect(temp_path)
+        try:
+            if conn.execute('PRAGMA quick_check').fetchone()[0] != 'ok':
+                raise sqlite3.DatabaseError(f'{snapshot} failed quick_check')
+        finally:
+            conn.close()
+        os.replace(temp_path, target)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+@app.route('/admin/backups')
+@login_required
+def list_backups():
+    return jsonify({'running': backups.running(), 'last_error': backups.last_error, 'snapshots': backups.list()})
+
+@app.route('/admin/backups', methods=['POST'])
+@login_required
+def start_backup():
+    if not backups.start():
+        return jsonify({'success': False, 'message': 'A backup is already running'}), 409
+    return jsonify({'success': True, 'message': 'Backup started'}), 202
+
+@app.route('/admin/backups/<name>')
+@login_required
+def download_backup(name):
+    if not SNAPSHOT_PATTERN.match(name) or not os.path.exists(os.path.join(backups.directory, name)):
+        return jsonify({'success': False, 'message': 'Snapshot not found'}), 404
+    return send_file(os.path.join(os.path.abspath(backups.directory), name), as_attachment=True,
+                     mimetype='application/gzip')
+
 @app.route('/admin/announcements')
 @login_required
 def get_announcements():
-    conn = sqlite3.connect('registrations.db')
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM announcements ORDER BY created_at DESC')
-    announcements = cursor.fetchall()
-    conn.close()
-    
-    return jsonify([{
-        'id': a[0],
-        'title': a[1],
-        'content': a[2],
-        'created_at': a[3]
-    } for a in announcements])
+    return list_rows('announcements')
+
 
 @app.route('/admin/add-announcement', methods=['POST'])
 @login_required
@@ -758,7 +3340,7 @@ def add_announcement():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect('registrations.db')
+        conn = get_conn()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -767,7 +3349,8 @@ def add_announcement():
         ''', (data['title'], data['content']))
         
         conn.commit()
-        conn.close()
+        response_cache.invalidate('announcements')
+        change_feed.poke()
         
         return jsonify({'success': True, 'message': 'Announcement added successfully'})
     
@@ -779,12 +3362,13 @@ def add_announcement():
 @login_required
 def delete_announcement(announcement_id):
     try:
-        conn = sqlite3.connect('registrations.db')
+        conn = get_conn()
         cursor = conn.cursor()
         
         cursor.execute('DELETE FROM announcements WHERE id = ?', (announcement_id,))
         conn.commit()
-        conn.close()
+        response_cache.invalidate('announcements')
+        change_feed.poke()
         
         return jsonify({'success': True, 'message': 'Announcement deleted successfully'})
     
@@ -793,21 +3377,351 @@ def delete_announcement(announcement_id):
         return jsonify({'success': False, 'message': 'Failed to delete announcement'})
 
 @app.route('/api/announcements')
+@conditional('announcements')
+@cached('announcements')
 def public_announcements():
-    conn = sqlite3.connect('registrations.db')
+    conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute('SELECT * FROM announcements ORDER BY created_at DESC LIMIT 10')
-    announcements = cursor.fetchall()
-    conn.close()
-    
-    return jsonify([{
-        'id': a[0],
-        'title': a[1],
-        'content': a[2],
-        'created_at': a[3]
-    } for a in announcements])
+    cursor.row_factory = row_factory('announcements')
+    cursor.execute(f"SELECT {select_fields('announcements')} FROM announcements ORDER BY created_at DESC LIMIT 10")
+    return json_response(cursor.fetchall())
+
+SEARCH_PAGE_SIZE = 20
+
+def search_index_query(kinds):
+    """Ranked FTS5 search over the given kinds with highlighted snippets.
+
+    Each word of q is matched as a prefix; all words must match.
+    """
+    terms = re.findall(r'\w+', request.args.get('q', ''))[:10]
+    if request.args.get('kind'):
+        kinds = tuple(kind for kind in kinds if kind == request.args['kind'])
+    if not terms or not kinds:
+        return {'items': [], 'total': 0}
+    match = ' '.join(f'"{term}"*' for term in terms)
+    try:
+        limit = max(1, min(int(request.args.get('limit', SEARCH_PAGE_SIZE)), 100))
+        offset = max(0, int(request.args.get('offset', 0)))
+    except ValueError:
+        limit, offset = SEARCH_PAGE_SIZE, 0
+
+    cursor = get_conn().cursor()
+    kind_filter = ', '.join('?' for _ in kinds)
+    cursor.execute(f"""
+        SELECT rowid >> 2, kind, highlight(search_index, 1, char(2), char(3)),
+               snippet(search_index, 2, char(2), char(3), '…', 16)
+        FROM search_index
+        WHERE search_index MATCH ? AND kind IN ({kind_filter})
+        ORDER BY rank LIMIT ? OFFSET ?
+    """, (match, *kinds, limit, offset))
+    rows = cursor.fetchall()
+    cursor.execute(f'SELECT COUNT(*) FROM search_index WHERE search_index MATCH ? AND kind IN ({kind_filter})',
+                   (match, *kinds))
+    total = cursor.fetchone()[0]
+
+    def mark(text):
+        # Escape the stored text, then turn the match markers into <mark> tags
+        return html.escape(text or '').replace('\x02', '<mark>').replace('\x03', '</mark>')
+
+    return {
+        'items': [{'id': ref_id, 'kind': kind, 'title': mark(title), 'snippet': mark(snippet)}
+                  for ref_id, kind, title, snippet in rows],
+        'total': total
+    }
+
+@app.route('/api/search')
+@conditional(*[SEARCH_SOURCES[kind][0] for kind in PUBLIC_SEARCH_KINDS])
+def public_search():
+    return jsonify(search_index_query(PUBLIC_SEARCH_KINDS))
+
+@app.route('/admin/search')
+@login_required
+def admin_search():
+    return jsonify(search_index_query(tuple(SEARCH_SOURCES)))
+
+@app.route('/admin/metrics')
+def metrics_endpoint():
+    token = request.headers.get('Authorization', '')
+    authorized = METRICS_TOKEN and hmac.compare_digest(token, f'Bearer {METRICS_TOKEN}')
+    if not authorized and 'admin_logged_in' not in session:
+        return redirect(url_for('admin_login'))
+    if not metrics.enabled:
+        return jsonify({'error': 'Metrics are disabled'}), 404
+    return Response(metrics.collect(), mimetype='text/plain; version=0.0.4')
+
+def read_live_stats(cursor):
+    cursor.execute('SELECT name, count, last_at FROM live_stats')
+    stats = {
+        'total_registrations': 0,
+        'themes': {},
+        'last_registration_at': None,
+        'total_submissions': 0,
+        'submission_themes': {},
+        'last_submission_at': None
+    }
+    for name, count, last_at in cursor.fetchall():
+        if name == 'registrations':
+            stats['total_registrations'] = count
+            stats['last_registration_at'] = last_at
+        elif name == 'submissions':
+            stats['total_submissions'] = count
+            stats['last_submission_at'] = last_at
+        elif name.startswith('theme:'):
+            stats['themes'][name[len('theme:'):]] = count
+        elif name.startswith('submission_theme:'):
+            stats['submission_themes'][name[len('submission_theme:'):]] = count
+    return stats
+
+@app.route('/api/live-stats')
+def live_stats():
+    conn = get_conn()
+    return jsonify(read_live_stats(conn.cursor()))
+
+def format_changes(cursor, rows):
+    """Turn change_log rows into (id, event, data) SSE events.
+
+    Registration/submission changes are coalesced into one 'stats' event
+    carrying the current counters, stamped with the batch's last id.
+    """
+    events = []
+    stats_changed = False
+    for change_id, kind, action, payload in rows:
+        if kind == 'stats':
+            stats_changed = True
+            continue
+        events.append((change_id, kind, json.dumps({'action': action, 'data': json.loads(payload)})))
+    if stats_changed:
+        events.append((rows[-1][0], 'stats', json.dumps(read_live_stats(cursor))))
+    return events
+
+class ChangeFeed:
+    """Per-process change detector shared by every /api/events client.
+
+    A single background thread watches PRAGMA data_version on its own
+    connection and only reads change_log when another connection (any
+    thread or worker) has committed, then wakes all waiting streams.
+    """
+
+    def __init__(self, poll_interval, history=512):
+        self.poll_interval = poll_interval
+        self.clients = 0
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self._batches = deque(maxlen=history)  # (after_id, last_id, events)
+        self._last_id = None
+        self._pid = None
+        self._hub_wakers = {}  # gevent hub -> [Event, async watcher], for greenlet waiters
+
+    def ensure_started(self):
+        with self._cond:
+            if self._pid != os.getpid():
+                # First use in this process (or first use after a fork)
+                self._pid = os.getpid()
+                self._batches.clear()
+                self._last_id = None
+                self._hub_wakers = {}
+                threading.Thread(target=self._run, name='change-feed', daemon=True).start()
+            while self._last_id is None and self._pid == os.getpid():
+                self._cond.wait()
+            if self._last_id is None:
+                raise RuntimeError('Change feed failed to start')
+            return self._last_id
+
+    def add_client(self, limit):
+        with self._cond:
+            if self.clients >= limit:
+                return False
+            self.clients += 1
+            return True
+
+    def remove_client(self):
+        with self._cond:
+            self.clients -= 1
+
+    @property
+    def last_id(self):
+        with self._cond:
+            return self._last_id
+
+    def poke(self):
+        # Called after a local commit so this worker's clients don't wait for the next poll
+        self._wake.set()
+
+    def _run(self):
+        try:
+            ensure_schema()
+            conn = _connect()
+            cursor = conn.cursor()
+            cursor.execute('SELECT COALESCE(MAX(id), 0) FROM change_log')
+            last_id = cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"Change feed error: {e}")
+            with self._cond:
+                self._pid = None
+                self._cond.notify_all()
+            return
+        with self._cond:
+            self._last_id = last_id
+            self._cond.notify_all()
+        data_version = None
+        while True:
+            try:
+                cursor.execute('PRAGMA data_version')
+                version = cursor.fetchone()[0]
+                if version != data_version:
+                    data_version = version
+                    cursor.execute('SELECT id, kind, action, payload FROM change_log WHERE id > ? ORDER BY id', (last_id,))
+                    rows = cursor.fetchall()
+                    if rows:
+                        events = format_changes(cursor, rows)
+                        with self._cond:
+                            self._batches.append((last_id, rows[-1][0], events))
+                            self._last_id = last_id = rows[-1][0]
+                            self._cond.notify_all()
+                            for _, watcher in self._hub_wakers.values():
+                                watcher.send()
+            except sqlite3.Error as e:
+                print(f"Change feed error: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _wait_greenlet(self, after_id, timeout):
+        # Block only the calling greenlet: the feed thread wakes its hub through an async watcher
+        import gevent
+        from gevent.event import Event
+        with self._cond:
+            if self._last_id > after_id:
+                return
+            hub = gevent.get_hub()
+            waker = self._hub_wakers.get(hub)
+            if waker is None:
+                waker = self._hub_wakers[hub] = [Event(), hub.loop.async_(ref=False)]
+
+                def wake(waker=waker):
+                    event, waker[0] = waker[0], Event()
+                    event.set()
+                waker[1].start(wake)
+            event = waker[0]
+        event.wait(timeout)
+
+    def wait(self, after_id, timeout, greenlet=False):
+        """Return (events, last_id) newer than after_id, or None if history no longer covers it."""
+        if greenlet:
+            self._wait_greenlet(after_id, timeout)
+            timeout = 0
+        with self._cond:
+            self._cond.wait_for(lambda: self._last_id > after_id, timeout)
+            if self._last_id <= after_id:
+                return [], after_id
+            if not self._batches or self._batches[0][0] > after_id:
+                return None
+            events = [e for batch in self._batches if batch[1] > after_id for e in batch[2] if e[0] > after_id]
+            return events, self._last_id
+
+change_feed = ChangeFeed(CHANGE_POLL_INTERVAL)
+
+def sse_message(event_id, event, data):
+    return f"id: {event_id}\nevent: {event}\ndata: {data}\n\n"
+
+@app.route('/api/events')
+def event_stream():
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('lastEventId')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        last_event_id = None
+
+    # Under gthread every open stream pins a request thread, so streams are off by
+    # default and browsers poll; under the cooperative worker a stream only holds a greenlet
+    greenlet = request.environ.get('cooperative.enabled', False)
+    if not change_feed.add_client(SSE_MAX_GREENLET_CLIENTS if greenlet else SSE_MAX_CLIENTS):
+        response = jsonify({'error': 'Too many live connections, falling back to polling'})
+        response.headers['Retry-After'] = '30'
+        return response, 503
+
+    try:
+        feed_id = change_feed.ensure_started()
+        replay = []
+        if last_event_id is not None and last_event_id < feed_id:
+            # Resume: replay what this client missed straight from the change log
+            cursor = get_conn().cursor()
+            cursor.execute('SELECT MIN(id) FROM change_log')
+            oldest = cursor.fetchone()[0]
+            if oldest is None or oldest > last_event_id + 1:
+                replay = [(feed_id, 'reset', '{}')]
+            else:
+                cursor.execute('SELECT id, kind, action, payload FROM change_log WHERE id > ? AND id <= ? ORDER BY id',
+                               (last_event_id, feed_id))
+                rows = cursor.fetchall()
+                replay = format_changes(cursor, rows) if rows else []
+    except Exception:
+        change_feed.remove_client()
+        raise
+    if greenlet:
+        request.environ['cooperative.greenlet_stream'] = True
+
+    def generate():
+        try:
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+            for event in replay:
+                yield sse_message(*event)
+            cursor_id = feed_id
+            deadline = time.monotonic() + SSE_MAX_DURATION
+            while time.monotonic() < deadline:
+                result = change_feed.wait(cursor_id, SSE_HEARTBEAT, greenlet)
+                if result is None:
+                    # Fell too far behind the in-memory history; tell the client to reload
+                    cursor_id = change_feed.last_id
+                    yield sse_message(cursor_id, 'reset', '{}')
+                    continue
+                events, cursor_id = result
+                if not events:
+                    yield ': keep-alive\n\n'
+                for event in events:
+                    yield sse_message(*event)
+        finally:
+            change_feed.remove_client()
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+# Pages rendered into response_cache when a worker starts
+STATIC_PAGES = ('index', 'register', 'submit_page', 'live_updates', 'live_stream', 'notices_page', 'documents_page')
+
+def warm_pages():
+    with app.test_request_context():
+        urls = [url_for(endpoint) for endpoint in STATIC_PAGES]
+    client = app.test_client()
+    for url in urls:
+        for encoding in PAGE_ENCODINGS + ('identity',):
+            try:
+                client.get(url, headers={'Accept-Encoding': encoding})
+            except Exception as e:
+                print(f"Page warm-up error for {url}: {e}")
+
+if not FAST_START:
+    threading.Thread(target=warm_pages, name='warm-pages', daemon=True).start()
+if BACKUP_INTERVAL > 0:
+    threading.Thread(target=backups.run_schedule, name='backup-schedule', daemon=True).start()
 
 if __name__ == '__main__':
+    import sys
+    if sys.argv[1:2] == ['backup']:
+        # python app.py backup  |  python app.py restore <snapshot.db.gz> <new database path>
+        print(backups.snapshot() or 'A backup is already running')
+        sys.exit(0)
+    if sys.argv[1:2] == ['upload-blobs']:
+        # python app.py upload-blobs: push local uploads to the configured STORAGE_BACKEND
+        print(f'Uploaded {upload_local_blobs()} blobs')
+        sys.exit(0)
+    if sys.argv[1:2] == ['restore'] and len(sys.argv) == 4:
+        restore_snapshot(sys.argv[2], sys.argv[3])
+        print(f'Restored {sys.argv[2]} to {sys.argv[3]}')
+        sys.exit(0)
     init_db()
+    if 'SSE_MAX_CLIENTS' not in os.environ:
+        SSE_MAX_CLIENTS = SSE_MAX_DEV_CLIENTS
     port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Registration latency while an online backup of a large database runs.
+
+Usage: python benchmarks/backup_latency.py [rows] [rate]
+
+Seeds a temp database with `rows` registrations, starts the app in a
+threaded server process and posts registrations at a steady `rate` per
+second. Latency is recorded for SECONDS without a backup (baseline), then
+while POST /admin/backups runs, until the snapshot is done. Reports
+p50/p95/p99/mean for both phases, the relative change, the backup's
+duration and size, and checks the snapshot restores with the seeded rows.
+"""
+import http.cookiejar
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SECONDS = 15
+SEED_BATCH = 10000
+
+SERVER = '''
+import sys; sys.path.insert(0, {root!r})
+from werkzeug.serving import make_server
+import app
+app.init_db()
+server = make_server('127.0.0.1', 0, app.app, threaded=True)
+print(server.server_port, flush=True)
+server.serve_forever()
+'''
+
+
+def seed(db_path, rows):
+    sys.path.insert(0, ROOT)
+    os.environ['DATABASE_PATH'] = db_path
+    import app
+    app.init_db()
+    conn = sqlite3.connect(db_path)
+    members = json.dumps([{'name': f'Member {i}', 'email': f'member{i}@example.com'} for i in range(3)])
+    for start in range(0, rows, SEED_BATCH):
+        conn.executemany(
+            'INSERT INTO registrations (team_name, leader_name, email, phone, university, theme, team_members) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [(f'Team {i}', f'Leader {i}', f'seed{i}@example.com', f'98{i:08d}', 'Pokhara University', 'fintech',
+              members) for i in range(start, min(start + SEED_BATCH, rows))])
+        conn.commit()
+    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    conn.close()
+    return app
+
+
+def load(port, rate, stop, latencies, counter):
+    # Open loop: one request every 1/rate seconds regardless of how long the last one took
+    interval = 1 / rate
+    next_at = time.perf_counter()
+
+    def send(n):
+        body = json.dumps({'teamName': f'Load {n}', 'leaderName': 'Leader', 'email': f'load{n}@example.com',
+                           'university': 'Pokhara University', 'theme': 'fintech'}).encode()
+        req = urllib.request.Request(f'http://127.0.0.1:{port}/register', data=body,
+                                     headers={'Content-Type': 'application/json'})
+        start = time.perf_counter()
+        with urllib.request.urlopen(req, timeout=60) as response:
+            response.read()
+        latencies.append(time.perf_counter() - start)
+
+    while not stop.is_set():
+        counter[0] += 1
+        threading.Thread(target=send, args=(counter[0],)).start()
+        next_at += interval
+        time.sleep(max(0, next_at - time.perf_counter()))
+
+
+def summary(latencies):
+    values = sorted(latencies)
+    pick = lambda q: round(values[min(len(values) - 1, int(len(values) * q))] * 1000, 2)
+    return {'requests': len(values), 'p50_ms': pick(0.5), 'p95_ms': pick(0.95), 'p99_ms': pick(0.99),
+            'mean_ms': round(sum(values) / len(values) * 1000, 2)}
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rate = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+    tmp = tempfile.mkdtemp()
+    db_path = os.path.join(tmp, 'bench.db')
+    start = time.perf_counter()
+    app = seed(db_path, rows)
+    results = {'rows': rows, 'rate': rate, 'db_mb': round(os.path.getsize(db_path) / 2**20, 1),
+               'seed_seconds': round(time.perf_counter() - start, 1)}
+
+    env = dict(os.environ, DATABASE_PATH=db_path, METRICS_DIR=os.path.join(tmp, 'metrics'),
+               BACKUP_DIR=os.path.join(tmp, 'backups'), ADMISSION_ENABLED='0')
+    server = subprocess.Popen([sys.executable, '-c', SERVER.format(root=ROOT)], env=env, cwd=tmp,
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    try:
+        port = int(server.stdout.readline())
+        opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+        opener.open(urllib.request.Request(
+            f'http://127.0.0.1:{port}/admin/login', headers={'Content-Type': 'application/json'},
+            data=json.dumps({'username': app.ADMIN_USERNAME, 'password': app.ADMIN_PASSWORD}).encode())).read()
+        counter = [0]
+        for phase in ('baseline', 'during_backup'):
+            latencies = []
+            stop = threading.Event()
+            loader = threading.Thread(target=load, args=(port, rate, stop, latencies, counter))
+            loader.start()
+            if phase == 'baseline':
+                time.sleep(SECONDS)
+            else:
+                backup_start = time.perf_counter()
+                opener.open(urllib.request.Request(f'http://127.0.0.1:{port}/admin/backups', data=b'')).read()
+                while True:
+                    time.sleep(0.2)
+                    status = json.loads(opener.open(f'http://127.0.0.1:{port}/admin/backups').read())
+                    if not status['running']:
+                        break
+                results['backup_seconds'] = round(time.perf_counter() - backup_start, 1)
+                results['backup_error'] = status['last_error']
+                results['snapshot_mb'] = round(status['snapshots'][0]['size'] / 2**20, 1) if status['snapshots'] else None
+            stop.set()
+            loader.join()
+            time.sleep(1)  # Let in-flight requests finish
+            results[phase] = summary(latencies)
+    finally:
+        server.terminate()
+        server.wait()
+
+    for key in ('p50_ms', 'p99_ms', 'mean_ms'):
+        base = results['baseline'][key]
+        results.setdefault('change_percent', {})[key] = round((results['during_backup'][key] - base) / base * 100, 1)
+
+    if status['snapshots']:
+        snapshot = os.path.join(tmp, 'backups', status['snapshots'][0]['name'])
+        restored = os.path.join(tmp, 'restored.db')
+        app.restore_snapshot(snapshot, restored)
+        conn = sqlite3.connect(restored)
+        results['restored_seed_rows'] = conn.execute(
+            "SELECT COUNT(*) FROM registrations WHERE email LIKE 'seed%'").fetchone()[0]
+        conn.close()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
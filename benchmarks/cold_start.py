@@ -0,0 +1,153 @@
+"""Cold-start cost of the app: import time and first requests in a fresh process.
+
+Usage: python benchmarks/cold_start.py [runs] [--check | --update]
+
+Each run starts a new interpreter with -X importtime, imports api.index
+(the serverless entry point) against a migrated copy of a temp database and
+times the first request to each of URLS through the test client. Three
+configurations are measured, each with an empty writable template cache
+per run:
+- default: as a gunicorn worker boots with nothing compiled (page warm-up
+  thread on, no precompiled templates)
+- serverless: as deployed on Vercel (VERCEL=1, so FAST_START is on and the
+  cache is in the temp dir), loading the committed jinja-precompiled/
+- serverless_uncompiled: the same without jinja-precompiled/, i.e. what a
+  cold instance pays when it is out of date
+
+Reported per configuration: median import ms, median first-request ms per
+URL and their sum (time to first byte of a cold instance), plus the
+packages that cost the most to import (self time, summed per top-level
+package).
+
+importtime_baseline.json holds the top-level packages imported while
+importing api.index and serving those first requests, and the median import
+time, as of its last update. --check
+exits with status 1 when a package outside the baseline is now imported at
+startup (someone added an eager import), the import got more than 50%
+slower or jinja-precompiled/ is out of date with the templates; --update
+rewrites the baseline after an intended change.
+"""
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE = os.path.join(ROOT, 'benchmarks', 'importtime_baseline.json')
+URLS = ('/', '/register', '/api/notices', '/notices')
+MARKER = 'cold-start: importing api.index'
+# Picked up only when installed; their presence is not a regression
+OPTIONAL_PACKAGES = ('brotli', 'zstandard', 'gevent')
+SLOWER_LIMIT = 1.5
+
+CHILD = '''
+import json, sys, time
+sys.path.insert(0, {root!r})
+sys.stderr.write({marker!r} + '\\n')
+sys.stderr.flush()
+start = time.perf_counter()
+from api.index import app
+result = {{'import_ms': (time.perf_counter() - start) * 1000, 'first_request_ms': {{}}}}
+client = app.test_client()
+for url in {urls!r}:
+    start = time.perf_counter()
+    client.get(url)
+    result['first_request_ms'][url] = (time.perf_counter() - start) * 1000
+print(json.dumps(result))
+'''
+
+
+def parse_importtime(stderr):
+    """Module name -> self microseconds for imports after MARKER."""
+    modules = {}
+    for line in stderr.split(MARKER, 1)[-1].splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(self_us)
+    return modules
+
+
+def run_once(env):
+    child = CHILD.format(root=ROOT, marker=MARKER, urls=URLS)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', child], env=env,
+                          cwd=os.path.dirname(env['DATABASE_PATH']),
+                          capture_output=True, text=True, check=True)
+    result = json.loads(proc.stdout.splitlines()[-1])
+    result['modules'] = parse_importtime(proc.stderr)
+    return result
+
+
+def measure(env, runs):
+    results = []
+    for _ in range(runs):
+        shutil.rmtree(env['JINJA_CACHE_DIR'], ignore_errors=True)
+        results.append(run_once(env))
+    first = {url: round(statistics.median(r['first_request_ms'][url] for r in results), 1) for url in URLS}
+    packages = {}
+    for name, self_us in results[-1]['modules'].items():
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return {
+        'import_ms': round(statistics.median(r['import_ms'] for r in results), 1),
+        'first_request_ms': first,
+        'first_requests_total_ms': round(sum(first.values()), 1),
+        'slowest_packages_ms': {name: round(us / 1000, 1) for name, us in
+                                sorted(packages.items(), key=lambda item: -item[1])[:12]},
+        'packages': sorted(packages),
+    }
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    runs = int(args[0]) if args else 7
+    tmp = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp, 'cold.db')
+        env = {name: value for name, value in os.environ.items()
+               if name not in ('FAST_START', 'VERCEL', 'JINJA_PRECOMPILED_DIR')}
+        base_env = dict(env, DATABASE_PATH=db_path, METRICS_DIR=os.path.join(tmp, 'metrics'), FAST_START='0',
+                        JINJA_CACHE_DIR=os.path.join(tmp, 'jinja'), JINJA_PRECOMPILED_DIR='')
+        # Migrate once up front: a deployed database is already at the latest schema version
+        subprocess.run([sys.executable, '-c', f'import sys; sys.path.insert(0, {ROOT!r}); import app; app.init_db()'],
+                       env=base_env, cwd=tmp, check=True, capture_output=True)
+        serverless_env = dict(env, DATABASE_PATH=db_path, METRICS_DIR=os.path.join(tmp, 'metrics'), VERCEL='1',
+                              JINJA_CACHE_DIR=os.path.join(tmp, 'jinja'))
+        precompiled = subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', 'compile-templates', '--check'],
+                                     env=serverless_env, cwd=ROOT, capture_output=True, text=True)
+
+        results = {'runs': runs}
+        results['default'] = measure(base_env, runs)
+        results['serverless'] = measure(serverless_env, runs)
+        results['serverless_uncompiled'] = measure(dict(serverless_env, JINJA_PRECOMPILED_DIR=''), runs)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    packages = results['serverless'].pop('packages')
+    results['default'].pop('packages')
+    results['serverless_uncompiled'].pop('packages')
+    if '--update' in sys.argv:
+        with open(BASELINE, 'w') as f:
+            json.dump({'import_ms': results['serverless']['import_ms'], 'packages': packages}, f, indent=2)
+            f.write('\n')
+    print(json.dumps(results, indent=2))
+    if '--check' in sys.argv:
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+        added = sorted(set(packages) - set(baseline['packages']) - set(OPTIONAL_PACKAGES))
+        slower = results['serverless']['import_ms'] > baseline['import_ms'] * SLOWER_LIMIT
+        if added:
+            print(f'New packages imported at startup: {", ".join(added)}')
+        if slower:
+            print(f"Import took {results['serverless']['import_ms']} ms, baseline {baseline['import_ms']} ms")
+        if precompiled.returncode:
+            print(precompiled.stdout.strip())
+        if added or slower or precompiled.returncode:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
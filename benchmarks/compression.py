@@ -0,0 +1,95 @@
+"""CPU cost versus bytes saved by response compression, per encoding and level.
+
+Usage: python benchmarks/compression.py [rows]
+
+Seeds a temp database with `rows` registrations (team_members filled in
+like real sign-ups), fetches representative bodies uncompressed through the
+test client, then times compress_body for every available encoding at a
+few levels (best of ROUNDS). Also reports the end-to-end cost of
+compress_response on the admin registrations page.
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUNDS = 5
+LEVELS = {'gzip': ('GZIP_LEVEL', (1, 4, 6, 9)), 'br': ('BROTLI_QUALITY', (1, 4, 5, 9, 11)),
+          'zstd': ('ZSTD_LEVEL', (1, 3, 9, 19))}
+PAYLOADS = {
+    'registrations_json': '/registrations?limit=500',
+    'submissions_json': '/submissions',
+    'export_csv': '/admin/export?format=csv',
+    'index_html': '/',
+}
+
+
+def best_time(run, repeat):
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            run()
+        elapsed = (time.perf_counter() - start) / repeat
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tmp = tempfile.mkdtemp()
+    os.environ.update(DATABASE_PATH=os.path.join(tmp, 'bench.db'), METRICS_DIR=os.path.join(tmp, 'metrics'))
+    os.chdir(tmp)
+    sys.path.insert(0, ROOT)
+    import app
+    app.init_db()
+    conn = app._connect()
+    members = json.dumps([{'name': f'Member {i}', 'email': f'member{i}@example.com', 'role': 'Developer'}
+                          for i in range(3)])
+    conn.executemany(
+        'INSERT INTO registrations (team_name, leader_name, email, phone, university, theme, team_members) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f'Team {i}', f'Leader {i}', f'leader{i}@example.com', f'98{i:08d}', 'Pokhara University',
+          ('fintech', 'health', 'education', 'agriculture')[i % 4], members) for i in range(rows)])
+    conn.executemany(
+        'INSERT INTO submissions (team_name, email, project_title, description, github_url, theme) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        [(f'Team {i}', f'leader{i}@example.com', f'Project {i}', 'A short description of the project. ' * 5,
+          f'https://github.com/team{i}/project', 'fintech') for i in range(rows // 4)])
+    conn.commit()
+    client = app.app.test_client()
+    client.post('/admin/login', json={'username': app.ADMIN_USERNAME, 'password': app.ADMIN_PASSWORD})
+
+    results = {'rows': rows, 'encodings': list(app.ENCODERS), 'payloads': {}}
+    for name, url in PAYLOADS.items():
+        body = client.get(url, headers={'Accept-Encoding': 'identity'}).data
+        repeat = max(1, 2_000_000 // max(len(body), 1))
+        entry = results['payloads'][name] = {'url': url, 'bytes': len(body), 'levels': {}}
+        for encoding in app.ENCODERS:
+            setting, levels = LEVELS[encoding]
+            default = getattr(app, setting)
+            for level in levels:
+                setattr(app, setting, level)
+                size = len(app.compress_body(body, encoding))
+                seconds = best_time(lambda: app.compress_body(body, encoding), min(repeat, 50))
+                entry['levels'][f'{encoding}-{level}'] = {
+                    'bytes': size,
+                    'ratio': round(len(body) / size, 1),
+                    'cpu_ms': round(seconds * 1000, 3),
+                    'kb_saved_per_cpu_ms': round((len(body) - size) / 1024 / max(seconds * 1000, 1e-6), 1),
+                }
+            setattr(app, setting, default)
+
+    url = PAYLOADS['registrations_json']
+    timings = {}
+    for label, accept in (('identity', 'identity'), ('compressed', ', '.join(app.ENCODERS))):
+        timings[label] = round(best_time(lambda: client.get(url, headers={'Accept-Encoding': accept}), 20) * 1000, 3)
+    timings['overhead_ms'] = round(timings['compressed'] - timings['identity'], 3)
+    results['request_ms'] = {url: timings}
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
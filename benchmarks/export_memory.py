@@ -0,0 +1,77 @@
+"""Peak RSS of /admin/export: the old fetchall() + StringIO export vs the streaming one.
+
+Usage: python benchmarks/export_memory.py [rows]
+
+Each measurement runs in a fresh interpreter so ru_maxrss reflects only that mode.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(db_path, rows):
+    env = dict(os.environ, DATABASE_PATH=db_path)
+    subprocess.run([sys.executable, '-c', f'''
+import sys; sys.path.insert(0, {ROOT!r})
+import app, sqlite3
+app.init_db()
+conn = sqlite3.connect({db_path!r})
+members = '[{{"name": "Member Name", "email": "member@example.com"}}]'
+conn.executemany(
+    "INSERT INTO registrations (team_name, leader_name, email, phone, university, theme, team_members) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    ((f"Team {{i}}", f"Leader {{i}}", f"leader{{i}}@example.com", "9800000000", "Pokhara University",
+      ("fintech", "aiml")[i % 2], members) for i in range({rows})))
+conn.commit()
+'''], env=env, check=True, cwd=tempfile.gettempdir())
+
+
+def measure(db_path, mode):
+    env = dict(os.environ, DATABASE_PATH=db_path)
+    out = subprocess.run([sys.executable, '-c', f'''
+import sys, resource, time, json
+sys.path.insert(0, {ROOT!r})
+import app
+client = app.app.test_client()
+client.post('/admin/login', json={{'username': app.ADMIN_USERNAME, 'password': app.ADMIN_PASSWORD}})
+base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+size = 0
+if {mode!r} == 'legacy':
+    import csv, io
+    cursor = app.get_conn().cursor()
+    cursor.execute("SELECT id, team_name, leader_name, email, phone, university, theme, team_members, registration_date FROM registrations ORDER BY registration_date DESC")
+    rows = cursor.fetchall()
+    output = io.StringIO()
+    writer = csv.writer(output)
+    for row in rows:
+        writer.writerow(row)
+    size = len(app.app.make_response(output.getvalue()).get_data())
+else:
+    response = client.get('/admin/export' + {mode!r}, buffered=False)
+    for chunk in response.response:
+        size += len(chunk)
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'bytes': size, 'seconds': round(elapsed, 3), 'rss_growth_kb': peak - base}}))
+'''], env=env, check=True, capture_output=True, text=True, cwd=tempfile.gettempdir())
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        seed(db_path, rows)
+        results = {'rows': rows}
+        for label, mode in (('legacy', 'legacy'), ('stream_csv', '?format=csv'),
+                            ('stream_ndjson', '?format=ndjson'), ('stream_csv_gzip', '?format=csv&gzip=1')):
+            results[label] = measure(db_path, mode)
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,567 @@
+"""Event-day load test: replays the traffic we expect against a local server on a temp database.
+
+Usage: python benchmarks/loadtest.py [--scenarios a,b] [--scale 1.0] [--server gunicorn|werkzeug]
+                                     [--workers 2] [--threads 16] [--output results.json]
+                                     [--baseline baseline.json] [--save-baseline]
+
+Scenarios:
+  registration_burst  concurrent /register posts, half JSON and half multipart with a proposal PDF
+  live_polling        thousands of live-page clients polling /api/announcements and /api/live-stats
+                      every 5 s (open loop: latency is measured from the scheduled send time)
+  admin_reads         /registrations keyset pages and full /admin/export runs over 50k seeded rows
+  large_files         concurrent ~15 MB document uploads alongside PDF downloads
+
+Each scenario reports throughput, p50/p95/p99 latency, error rate, the
+requests turned away on purpose by admission control (429 rate limited,
+503 queue full; counted apart from errors and left out of throughput and
+latency), the "database is locked" errors and lock retries counted by
+/admin/metrics, and peak RSS per server process. The server trusts one
+X-Forwarded-For hop, as in production, and each simulated registrant sends
+its own address so the per-client rate limit sees distinct clients. Results are written as JSON. With --baseline, a
+scenario that got slower, less reliable or heavier than the tolerances in REGRESSION_LIMITS
+is reported and the exit status is 1. --save-baseline stores this run as
+benchmarks/baseline.json. Compare runs from the same machine only.
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import queue
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+BASELINE = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+SEED_ROWS = 50_000
+THEMES = ('fintech', 'aiml')
+REJECTED = (429, 503)  # Admission control turning a request away, not a failure
+
+# Relative change that counts as a regression against the baseline
+REGRESSION_LIMITS = {
+    'throughput_rps': -0.15,  # 15% fewer requests per second
+    'p99_ms': 0.25,           # 25% slower tail
+    'error_rate': 0.01,       # one more failed request in a hundred (absolute)
+    'rejected_rate': 0.01,    # one more 429/503 in a hundred (absolute)
+    'peak_rss_mb': 0.20,      # 20% more memory in the largest worker
+}
+
+WERKZEUG_SERVER = '''
+import sys; sys.path.insert(0, {root!r})
+from werkzeug.serving import ThreadedWSGIServer, make_server
+import app
+ThreadedWSGIServer.request_queue_size = 1024
+make_server('127.0.0.1', {port}, app.app, threaded=True).serve_forever()
+'''
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def multipart(fields, files):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+    for name, (filename, data, content_type) in files.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                     f'Content-Type: {content_type}\r\n\r\n'.encode() + data + b'\r\n')
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def fake_pdf(size):
+    return b'%PDF-1.4\n' + os.urandom(max(0, size - 9))
+
+
+class Client:
+    """One keep-alive connection, like a single browser tab."""
+
+    def __init__(self, port, cookie=None):
+        self.port = port
+        self.cookie = cookie
+        self.conn = None
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {})
+        if self.cookie:
+            headers['Cookie'] = self.cookie
+        for attempt in range(2):
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=300)
+            try:
+                self.conn.request(method, path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                data = response.read()
+                return response.status, data, response
+            except (http.client.HTTPException, ConnectionError):
+                # The server closed an idle keep-alive connection; retry once on a fresh one
+                self.conn.close()
+                self.conn = None
+                if attempt:
+                    raise
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+class Recorder:
+    """Latencies and outcomes for the requests of one scenario, per endpoint label."""
+
+    def __init__(self):
+        self.samples = {}  # label -> [(latency seconds, ok)]
+        self._lock = threading.Lock()
+
+    def timed(self, label, send, check):
+        start = time.perf_counter()
+        status = None
+        try:
+            result = send()
+            status = result[0]
+            ok = check(*result)
+        except Exception:
+            # Connection failures and unexpected bodies both count as errors
+            ok = False
+        self.add(label, time.perf_counter() - start, ok, status)
+
+    def add(self, label, latency, ok, status=None):
+        with self._lock:
+            self.samples.setdefault(label, []).append((latency, ok, status))
+
+    def summary(self, seconds):
+        def summarize(samples):
+            served = [(latency, ok) for latency, ok, status in samples if status not in REJECTED]
+            latencies = sorted(latency for latency, _ in served)
+            errors = sum(1 for _, ok in served if not ok)
+            ms = lambda value: round(value * 1000, 1) if value is not None else None
+            return {
+                'requests': len(samples),
+                'throughput_rps': round(len(served) / seconds, 1),
+                'p50_ms': ms(percentile(latencies, 0.50)),
+                'p95_ms': ms(percentile(latencies, 0.95)),
+                'p99_ms': ms(percentile(latencies, 0.99)),
+                'error_rate': round(errors / len(samples), 4),
+                'rejected_429': sum(1 for _, _, status in samples if status == 429),
+                'rejected_503': sum(1 for _, _, status in samples if status == 503),
+                'rejected_rate': round((len(samples) - len(served)) / len(samples), 4),
+            }
+        everything = [sample for samples in self.samples.values() for sample in samples]
+        result = summarize(everything) if everything else {'requests': 0}
+        result['seconds'] = round(seconds, 2)
+        result['endpoints'] = {label: summarize(samples) for label, samples in sorted(self.samples.items())}
+        return result
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def json_success(status, body, _):
+    return status == 200 and json.loads(body).get('success') is True
+
+
+def registration_burst(server, scale):
+    """Everyone registers the minute registration opens."""
+    total = int(600 * scale)
+    concurrency = min(total, int(150 * scale) or 1)
+    proposal = fake_pdf(200 * 1024)
+    counter = iter(range(total))
+    counter_lock = threading.Lock()
+    recorder = Recorder()
+
+    def worker(_):
+        client = Client(server.port)
+        while True:
+            with counter_lock:
+                i = next(counter, None)
+            if i is None:
+                break
+            fields = {'teamName': f'Burst Team {i}', 'leaderName': f'Leader {i}', 'email': f'burst{i}@example.com',
+                      'phone': '9800000000', 'university': 'Pokhara University', 'theme': THEMES[i % 2]}
+            if i % 2:
+                body, content_type = multipart(fields, {'proposal': ('proposal.pdf', proposal, 'application/pdf')})
+                label = 'register_multipart'
+            else:
+                body, content_type = json.dumps(fields).encode(), 'application/json'
+                label = 'register_json'
+            # One address per team, so only the global bucket sees the whole burst
+            headers = {'Content-Type': content_type, 'X-Forwarded-For': f'10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}'}
+            recorder.timed(label, lambda: client.request('POST', '/register', body, headers), json_success)
+        client.close()
+
+    return recorder, lambda: run_threads(concurrency, worker)
+
+
+def live_polling(server, scale):
+    """Live-page tabs polling announcements and stats with If-None-Match, as live.js does."""
+    clients = int(2000 * scale)
+    interval, duration = 5.0, 15.0
+    senders = 64
+    urls = ('/api/announcements', '/api/live-stats')
+    jobs = queue.Queue()
+    for k in range(int(duration / interval)):
+        for client in range(clients):
+            jobs.put((k * interval + client * interval / clients, client, urls[(client + k) % 2]))
+    etags = {}
+    recorder = Recorder()
+    start = time.perf_counter() + 0.5
+
+    def sender(_):
+        connection = Client(server.port)
+        while True:
+            try:
+                due, client, url = jobs.get_nowait()
+            except queue.Empty:
+                break
+            scheduled = start + due
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            headers = {'If-None-Match': etags[client, url]} if (client, url) in etags else {}
+            status = None
+            try:
+                status, _, response = connection.request('GET', url, headers=headers)
+                ok = status in (200, 304)
+                if response.getheader('ETag'):
+                    etags[client, url] = response.getheader('ETag')
+            except (OSError, http.client.HTTPException):
+                ok = False
+            # Open loop: a backed-up server shows as latency instead of fewer requests
+            recorder.add(url, time.perf_counter() - scheduled, ok, status)
+        connection.close()
+
+    return recorder, lambda: run_threads(senders, sender)
+
+
+def admin_reads(server, scale):
+    """Organizers paging through registrations and exporting them during the event."""
+    admins = max(1, int(4 * scale))
+    pages, exports = 20, 2
+    recorder = Recorder()
+
+    def worker(_):
+        client = Client(server.port, server.admin_cookie)
+        for _ in range(exports):
+            cursor = [None]
+
+            def next_page(status, body, _):
+                cursor[0] = json.loads(body).get('next_cursor') if status == 200 else None
+                return status == 200
+
+            for _ in range(pages):
+                path = '/registrations?limit=50' + (f'&after={cursor[0]}' if cursor[0] else '')
+                recorder.timed('registrations_page', lambda: client.request('GET', path), next_page)
+                if not cursor[0]:
+                    break
+            recorder.timed('admin_export', lambda: client.request('GET', '/admin/export?format=csv'),
+                           lambda status, body, _: status == 200 and body.count(b'\n') > SEED_ROWS)
+        client.close()
+
+    return recorder, lambda: run_threads(admins, worker)
+
+
+def large_files(server, scale):
+    """Teams uploading big decks while others download the rules PDF."""
+    uploads = max(1, int(8 * scale))
+    downloads = max(1, int(32 * scale))
+    document = fake_pdf(15 * 1024 * 1024)
+    recorder = Recorder()
+
+    def uploader(i):
+        client = Client(server.port, server.admin_cookie)
+        body, content_type = multipart({'title': f'Deck {i}', 'description': 'load test'},
+                                       {'file': (f'deck{i}.pdf', document[:-8] + os.urandom(8), 'application/pdf')})
+        recorder.timed('upload_document', lambda: client.request('POST', '/admin/upload-document', body,
+                                                                {'Content-Type': content_type}), json_success)
+        client.close()
+
+    def downloader(i):
+        client = Client(server.port)
+        for _ in range(4):
+            recorder.timed('download_notice_pdf', lambda: client.request('GET', f'/download/notice/{server.notice_id}'),
+                           lambda status, body, _: status == 200 and len(body) == server.notice_size)
+        client.close()
+
+    def run():
+        run_threads(uploads + downloads, lambda i: uploader(i) if i < uploads else downloader(i))
+
+    return recorder, run
+
+
+SCENARIOS = {
+    'registration_burst': registration_burst,
+    'live_polling': live_polling,
+    'admin_reads': admin_reads,
+    'large_files': large_files,
+}
+
+
+class Server:
+    """The app on a temp database and upload folder, under gunicorn (like the Procfile) or werkzeug."""
+
+    def __init__(self, kind, workers, threads):
+        self.kind = kind
+        self.workers = workers
+        self.threads = threads
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, 'loadtest.db')
+        self.env = dict(os.environ, DATABASE_PATH=self.db_path, METRICS_DIR=os.path.join(self.tmp.name, 'metrics'),
+                        PYTHONUNBUFFERED='1', TRUSTED_PROXIES='1')
+        self.process = None
+        self.port = None
+        self.admin_cookie = None
+
+    def seed(self):
+        subprocess.run([sys.executable, '-c', f'''
+import sys; sys.path.insert(0, {ROOT!r})
+import app, sqlite3
+app.init_db()
+conn = sqlite3.connect({self.db_path!r})
+members = '[{{"name": "Member Name", "email": "member@example.com"}}]'
+conn.executemany(
+    "INSERT INTO registrations (team_name, leader_name, email, phone, university, theme, team_members) VALUES (?, ?, ?, ?, ?, ?, ?)",
+    ((f"Team {{i}}", f"Leader {{i}}", f"seed{{i}}@example.com", "9800000000", "Pokhara University",
+      {THEMES!r}[i % 2], members) for i in range({SEED_ROWS})))
+conn.executemany("INSERT INTO announcements (title, content) VALUES (?, ?)",
+                 ((f"Announcement {{i}}", "Check-in opens at 9am in the main hall.") for i in range(20)))
+conn.commit()
+'''], env=self.env, check=True, cwd=self.tmp.name)
+
+    def start(self):
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            self.port = probe.getsockname()[1]
+        if self.kind == 'gunicorn':
+            command = [sys.executable, '-m', 'gunicorn', 'app:app', '--pythonpath', ROOT,
+                       '-k', 'cooperative.CooperativeWorker', '--worker-connections', '2000',
+                       '--workers', str(self.workers), '--threads', str(self.threads), '--timeout', '120',
+                       '--bind', f'127.0.0.1:{self.port}']
+        else:
+            command = [sys.executable, '-c', WERKZEUG_SERVER.format(root=ROOT, port=self.port)]
+        self.process = subprocess.Popen(command, env=self.env, cwd=self.tmp.name,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                status, _, _ = Client(self.port).request('GET', '/')
+                if status == 200:
+                    break
+            except OSError:
+                pass
+            if time.monotonic() > deadline or self.process.poll() is not None:
+                raise RuntimeError(f'{self.kind} server did not start')
+            time.sleep(0.2)
+        self.login()
+        self.add_notice()
+
+    def login(self):
+        client = Client(self.port)
+        status, body, response = client.request('POST', '/admin/login', json.dumps(
+            {'username': self.env.get('ADMIN_USERNAME', 'admin'), 'password': self.env.get('ADMIN_PASSWORD', 'necsprint2024')}),
+            {'Content-Type': 'application/json'})
+        if not json.loads(body).get('success'):
+            raise RuntimeError('Admin login failed (set ADMIN_USERNAME/ADMIN_PASSWORD)')
+        self.admin_cookie = response.getheader('Set-Cookie').split(';', 1)[0]
+
+    def add_notice(self):
+        rules = fake_pdf(2 * 1024 * 1024)
+        body, content_type = multipart({'content': 'Hackathon rules'}, {'file': ('rules.pdf', rules, 'application/pdf')})
+        Client(self.port, self.admin_cookie).request('POST', '/admin/add-notice', body, {'Content-Type': content_type})
+        self.notice_id, self.notice_size = 1, len(rules)
+
+    def pids(self):
+        if self.kind != 'gunicorn':
+            return [self.process.pid]
+        workers = []
+        for entry in os.listdir('/proc'):
+            if entry.isdigit():
+                try:
+                    with open(f'/proc/{entry}/stat') as f:
+                        if int(f.read().rsplit(')', 1)[1].split()[1]) == self.process.pid:
+                            workers.append(int(entry))
+                except (OSError, IndexError, ValueError):
+                    continue
+        return sorted(workers)
+
+    def metric_totals(self):
+        status, body, _ = Client(self.port, self.admin_cookie).request('GET', '/admin/metrics')
+        totals = {}
+        if status == 200:
+            for line in body.decode().splitlines():
+                match = re.match(r'^(db_locked_errors_total|db_lock_retries_total)(?:\{.*\})? (\S+)$', line)
+                if match:
+                    totals[match.group(1)] = totals.get(match.group(1), 0) + float(match.group(2))
+        return totals
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait(timeout=30)
+        self.tmp.cleanup()
+
+
+class RSSSampler(threading.Thread):
+    """Peak resident memory of each server process while a scenario runs (Linux /proc)."""
+
+    def __init__(self, server):
+        super().__init__(daemon=True)
+        self.server = server
+        self.peaks = {}
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(0.1):
+            for pid in self.server.pids():
+                try:
+                    with open(f'/proc/{pid}/status') as f:
+                        rss_kb = int(next(line for line in f if line.startswith('VmRSS:')).split()[1])
+                except (OSError, StopIteration, ValueError):
+                    continue
+                self.peaks[pid] = max(self.peaks.get(pid, 0), rss_kb)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+        return {f'worker-{i}': round(kb / 1024, 1) for i, (_, kb) in enumerate(sorted(self.peaks.items()))}
+
+
+def run_scenario(server, name, scale):
+    recorder, run = SCENARIOS[name](server, scale)
+    before = server.metric_totals()
+    sampler = RSSSampler(server)
+    sampler.start()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    peak_rss = sampler.stop()
+    # Let every worker flush its metrics snapshot before reading the deltas
+    time.sleep(float(server.env.get('METRICS_FLUSH_INTERVAL', '5')) + 0.5)
+    after = server.metric_totals()
+    result = recorder.summary(seconds)
+    result['db_locked_errors'] = int(after.get('db_locked_errors_total', 0) - before.get('db_locked_errors_total', 0))
+    result['db_lock_retries'] = int(after.get('db_lock_retries_total', 0) - before.get('db_lock_retries_total', 0))
+    result['locked_rate'] = round(result['db_locked_errors'] / result['requests'], 4) if result['requests'] else 0
+    result['peak_rss_mb'] = peak_rss
+    return result
+
+
+def compare(results, baseline):
+    """Regressions of this run against a stored one, as readable lines."""
+    problems = []
+    for name, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        for label, now, then in [(name, current, previous)] + [
+                (f'{name} {endpoint}', current['endpoints'][endpoint], previous['endpoints'][endpoint])
+                for endpoint in current.get('endpoints', {}) if endpoint in previous.get('endpoints', {})]:
+            if then.get('throughput_rps') and now.get('throughput_rps') is not None:
+                change = now['throughput_rps'] / then['throughput_rps'] - 1
+                if change < REGRESSION_LIMITS['throughput_rps']:
+                    problems.append(f"{label}: throughput {then['throughput_rps']} -> {now['throughput_rps']} req/s ({change:+.0%})")
+            if then.get('p99_ms') and now.get('p99_ms') is not None:
+                change = now['p99_ms'] / then['p99_ms'] - 1
+                if change > REGRESSION_LIMITS['p99_ms']:
+                    problems.append(f"{label}: p99 {then['p99_ms']} -> {now['p99_ms']} ms ({change:+.0%})")
+            if now.get('error_rate', 0) - then.get('error_rate', 0) > REGRESSION_LIMITS['error_rate']:
+                problems.append(f"{label}: error rate {then['error_rate']} -> {now['error_rate']}")
+            if now.get('rejected_rate', 0) - then.get('rejected_rate', 0) > REGRESSION_LIMITS['rejected_rate']:
+                problems.append(f"{label}: rejected (429/503) {then.get('rejected_rate', 0)} -> {now['rejected_rate']}")
+        peak_now = max(current.get('peak_rss_mb', {}).values(), default=0)
+        peak_then = max(previous.get('peak_rss_mb', {}).values(), default=0)
+        if peak_then and peak_now / peak_then - 1 > REGRESSION_LIMITS['peak_rss_mb']:
+            problems.append(f"{name}: peak worker RSS {peak_then} -> {peak_now} MB")
+    return problems
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', 1)[0])
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--scale', type=float, default=1.0, help='multiplies clients and requests per scenario')
+    try:
+        import gunicorn  # noqa: F401
+        default_server = 'gunicorn'
+    except ImportError:
+        default_server = 'werkzeug'
+    parser.add_argument('--server', choices=('gunicorn', 'werkzeug'), default=default_server)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--output')
+    parser.add_argument('--baseline')
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    server = Server(args.server, args.workers, args.threads)
+    results = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'commit': git_commit(),
+            'server': args.server if args.server == 'werkzeug' else f'gunicorn {args.workers}x{args.threads}',
+            'scale': args.scale,
+            'seed_rows': SEED_ROWS,
+            'python': platform.python_version(),
+            'cpus': os.cpu_count(),
+        },
+        'scenarios': {},
+    }
+    try:
+        server.seed()
+        server.start()
+        for name in names:
+            print(f'Running {name}...', file=sys.stderr)
+            results['scenarios'][name] = run_scenario(server, name, args.scale)
+    finally:
+        server.stop()
+
+    output = args.output or os.path.join(RESULTS_DIR, results['meta']['timestamp'].replace(':', '') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(BASELINE, 'w') as f:
+            json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+    print(f'Saved {output}', file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            problems = compare(results, json.load(f))
+        for problem in problems:
+            print(f'REGRESSION {problem}', file=sys.stderr)
+        if problems:
+            sys.exit(1)
+        print('No regressions against the baseline', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
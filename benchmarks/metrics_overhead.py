@@ -0,0 +1,88 @@
+"""Cost of the metrics hooks and of metered SQLite connections.
+
+Usage: python benchmarks/metrics_overhead.py [rounds]
+
+Both parts interleave on/off rounds in one process and keep the best round
+of each, so machine noise doesn't swamp a difference of a few microseconds:
+- per request: the same requests with metrics.enabled toggled, plus the
+  RequestMetrics middleware alone around a no-op WSGI app
+- per statement: a point SELECT on a plain vs a MeteredConnection
+"""
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+URLS = ('/api/live-stats', '/api/notices', '/')
+REQUESTS_PER_ROUND = 500
+STATEMENTS_PER_ROUND = 20000
+
+
+def best_of(rounds, variants):
+    best = {name: None for name in variants}
+    for _ in range(rounds):
+        for name, run in variants.items():
+            start = time.perf_counter()
+            count = run()
+            elapsed = (time.perf_counter() - start) / count * 1e6
+            best[name] = elapsed if best[name] is None else min(best[name], elapsed)
+    return {name: round(value, 2) for name, value in best.items()}
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    tmp = tempfile.mkdtemp()
+    os.environ.update(DATABASE_PATH=os.path.join(tmp, 'bench.db'), METRICS_DIR=os.path.join(tmp, 'metrics'))
+    os.chdir(tmp)
+    sys.path.insert(0, ROOT)
+    import app
+    app.init_db()
+    client = app.app.test_client()
+    results = {'rounds': rounds, 'us_per_request': {}}
+
+    for url in URLS:
+        def requests(enabled):
+            def run():
+                app.metrics.enabled = enabled
+                for _ in range(REQUESTS_PER_ROUND):
+                    client.get(url)
+                return REQUESTS_PER_ROUND
+            return run
+        requests(True)()
+        timings = best_of(rounds, {'off': requests(False), 'on': requests(True)})
+        timings['overhead'] = round(timings['on'] - timings['off'], 2)
+        results['us_per_request'][url] = timings
+    app.metrics.enabled = True
+
+    def noop_app(environ, start_response):
+        start_response('200 OK', [])
+        return [b'']
+    environ = {'REQUEST_METHOD': 'GET'}
+    def wsgi(wsgi_app):
+        def run():
+            for _ in range(STATEMENTS_PER_ROUND):
+                wsgi_app(environ, lambda *args: None)
+            return STATEMENTS_PER_ROUND
+        return run
+    timings = best_of(rounds, {'bare': wsgi(noop_app), 'wrapped': wsgi(app.RequestMetrics(noop_app))})
+    timings['overhead'] = round(timings['wrapped'] - timings['bare'], 2)
+    results['us_per_request_middleware'] = timings
+
+    def statements(factory):
+        conn = sqlite3.connect(app.DB_PATH, factory=factory)
+        def run():
+            for _ in range(STATEMENTS_PER_ROUND):
+                conn.execute('SELECT version FROM table_versions WHERE name = ?', ('notices',)).fetchone()
+            return STATEMENTS_PER_ROUND
+        return run
+    timings = best_of(rounds, {'plain': statements(sqlite3.Connection), 'metered': statements(app.MeteredConnection)})
+    timings['overhead'] = round(timings['metered'] - timings['plain'], 2)
+    results['us_per_statement'] = timings
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
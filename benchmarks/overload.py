@@ -0,0 +1,158 @@
+"""Latency of admitted registrations when /register is offered more than it can take.
+
+Usage: python benchmarks/overload.py [clients] [seconds]
+
+Runs gunicorn (cooperative worker, 2 workers x 16 threads, like the Procfile) on an empty
+database twice: with admission control off and on. Each time `clients`
+threads post registrations back to back for `seconds`, each thread with its
+own X-Forwarded-For address (TRUSTED_PROXIES=1), so the per-client buckets
+see many clients and the global bucket and admission queue carry the load.
+Meanwhile a separate connection holds the write lock for STALL_MS out of
+every STALL_PERIOD_MS (standing in for a bulk import, a backup or a slow
+disk), and a prober reads /api/live-stats once every 100 ms.
+
+Reported per mode: registrations committed, their p50/p99/max latency,
+requests turned away with 429/503 and how fast that happened, timeouts
+and the p99 of the read probe. With admission on, admitted writes wait at
+most ADMISSION_MAX_WAIT for a slot and reads keep a free thread.
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLIENT_TIMEOUT = 30
+STALL_MS = 150
+STALL_PERIOD_MS = 300
+MODES = {
+    'unprotected': {'ADMISSION_ENABLED': '0'},
+    'admission': {'ADMISSION_ENABLED': '1'},
+}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * fraction))] * 1000, 1)
+
+
+def client(port, number, deadline, results):
+    i = 0
+    while time.monotonic() < deadline:
+        i += 1
+        body = json.dumps({'teamName': f'Team {number}-{i}', 'leaderName': 'Leader', 'university': 'Pokhara University',
+                           'email': f'c{number}-{i}@example.com', 'theme': 'fintech'}).encode()
+        req = urllib.request.Request(f'http://127.0.0.1:{port}/register', data=body, headers={
+            'Content-Type': 'application/json', 'X-Forwarded-For': f'10.{number // 250}.{number % 250}.{i % 250}'})
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=CLIENT_TIMEOUT) as response:
+                ok = json.loads(response.read()).get('success')
+            results.append(('ok' if ok else 'failed', time.perf_counter() - start))
+        except urllib.error.HTTPError as e:
+            results.append((str(e.code), time.perf_counter() - start))
+            if e.code in (429, 503):
+                time.sleep(0.05)  # A real client would honour Retry-After; keep the pressure on instead
+        except OSError:
+            results.append(('timeout', time.perf_counter() - start))
+
+
+def stall_writes(db_path, deadline):
+    import sqlite3
+    while not os.path.exists(db_path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    conn = sqlite3.connect(db_path, isolation_level=None, timeout=30)
+    while time.monotonic() < deadline:
+        conn.execute('BEGIN IMMEDIATE')
+        time.sleep(STALL_MS / 1000)
+        conn.execute('COMMIT')
+        time.sleep((STALL_PERIOD_MS - STALL_MS) / 1000)
+    conn.close()
+
+
+def probe_reads(port, deadline, latencies):
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/api/live-stats', timeout=CLIENT_TIMEOUT).close()
+            latencies.append(time.perf_counter() - start)
+        except OSError:
+            latencies.append(CLIENT_TIMEOUT)
+        time.sleep(0.1)
+
+
+def measure(env_overrides, clients, seconds):
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_PATH=os.path.join(tmp, 'bench.db'), METRICS_DIR=os.path.join(tmp, 'metrics'),
+                   TRUSTED_PROXIES='1', **env_overrides)
+        server = subprocess.Popen(
+            ['gunicorn', '--chdir', ROOT, 'app:app', '-k', 'cooperative.CooperativeWorker', '--worker-connections', '2000',
+             '--workers', '2', '--threads', '16', '--backlog', '2048',
+             '--timeout', '120', '--bind', f'127.0.0.1:{port}'],
+            env=env, cwd=tmp, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            for _ in range(100):
+                try:
+                    urllib.request.urlopen(f'http://127.0.0.1:{port}/api/live-stats', timeout=2).close()
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            results = []
+            reads = []
+            deadline = time.monotonic() + seconds
+            threads = [threading.Thread(target=client, args=(port, n, deadline, results)) for n in range(clients)]
+            threads.append(threading.Thread(target=stall_writes, args=(env['DATABASE_PATH'], deadline)))
+            threads.append(threading.Thread(target=probe_reads, args=(port, deadline, reads)))
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            server.terminate()
+            server.wait()
+    by_outcome = {}
+    for outcome, latency in results:
+        by_outcome.setdefault(outcome, []).append(latency)
+    admitted = by_outcome.get('ok', [])
+    rejected = by_outcome.get('429', []) + by_outcome.get('503', [])
+    return {
+        'committed': len(admitted),
+        'committed_per_second': round(len(admitted) / seconds, 1),
+        'admitted_p50_ms': percentile(admitted, 0.5),
+        'admitted_p99_ms': percentile(admitted, 0.99),
+        'admitted_max_ms': percentile(admitted, 1),
+        'rejected_429': len(by_outcome.get('429', [])),
+        'rejected_503': len(by_outcome.get('503', [])),
+        'rejected_p99_ms': percentile(rejected, 0.99),
+        'read_probe_p99_ms': percentile(reads, 0.99),
+        'other': {outcome: len(latencies) for outcome, latencies in by_outcome.items()
+                  if outcome not in ('ok', '429', '503')},
+    }
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 20
+    results = {'clients': clients, 'seconds': seconds}
+    for name, overrides in MODES.items():
+        results[name] = measure(overrides, clients, seconds)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
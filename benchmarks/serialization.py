@@ -0,0 +1,87 @@
+"""Rows/sec and peak memory of list serialization: jsonify of a built list vs streamed JSON arrays.
+
+Usage: python benchmarks/serialization.py [rows]
+
+Seeds a temp database with `rows` registrations and serializes the
+unpaged /registrations listing three ways inside a request context:
+- jsonify: the previous approach, fetchall(), a dict per row, then
+  jsonify() of the whole list (Flask's provider, sorted keys)
+- encode_json: the same materialized list through the compact encode_json
+  path, to separate encoder cost from memory
+- streamed: list_rows() as served now, a JSON array yielded in
+  STREAM_BATCH_SIZE-row chunks from fetchmany() and discarded as it goes
+
+Reported per variant: best-of-ROUNDS rows/sec, body size, and peak Python
+heap while serializing (tracemalloc, measured in a separate pass; SQLite's
+own page cache is not included).
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUNDS = 5
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    tmp = tempfile.mkdtemp()
+    os.environ.update(DATABASE_PATH=os.path.join(tmp, 'bench.db'), METRICS_DIR=os.path.join(tmp, 'metrics'),
+                      METRICS_ENABLED='0')
+    os.chdir(tmp)
+    sys.path.insert(0, ROOT)
+    import app
+    from flask import jsonify
+    app.init_db()
+    conn = app._connect()
+    members = json.dumps([{'name': f'Member {i}', 'email': f'member{i}@example.com'} for i in range(3)])
+    conn.executemany(
+        'INSERT INTO registrations (team_name, leader_name, email, phone, university, theme, team_members) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f'Team {i}', f'Leader {i}', f'leader{i}@example.com', f'98{i:08d}', 'Pokhara University',
+          ('fintech', 'health', 'education', 'agriculture')[i % 4], members) for i in range(rows)])
+    conn.commit()
+    conn.close()
+
+    query = f"SELECT {app.select_fields('registrations')} FROM registrations ORDER BY registration_date DESC, id DESC"
+    keys = app.field_keys('registrations')
+
+    def jsonify_list():
+        cursor = app.get_conn().cursor()
+        cursor.execute(query)
+        return len(jsonify([dict(zip(keys, row)) for row in cursor.fetchall()]).get_data())
+
+    def encode_list():
+        cursor = app.get_conn().cursor()
+        cursor.execute(query)
+        return len(app.json_response([dict(zip(keys, row)) for row in cursor.fetchall()]).get_data())
+
+    def streamed():
+        size = 0
+        for chunk in app.list_rows('registrations').response:
+            size += len(chunk)
+        return size
+
+    results = {'rows': rows}
+    for name, run in (('jsonify', jsonify_list), ('encode_json', encode_list), ('streamed', streamed)):
+        with app.app.test_request_context('/registrations'):
+            best = None
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                size = run()
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            tracemalloc.start()
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        results[name] = {'rows_per_second': round(rows / best), 'ms': round(best * 1000, 1),
+                         'body_mb': round(size / 2**20, 2), 'peak_heap_mb': round(peak / 2**20, 2)}
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
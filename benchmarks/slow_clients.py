@@ -0,0 +1,167 @@
+"""Latency of normal requests while thousands of slow clients hold connections open.
+
+Usage: python benchmarks/slow_clients.py [idle_connections] [slow_uploads]
+
+For each worker class a single gunicorn worker with 4 threads is started on
+an empty database, then:
+- idle_connections clients send half a request line and never finish it
+- slow_uploads clients start a 256 KB multipart registration and trickle
+  it at 1 KB/s
+- while those are open, PROBES ordinary GET /api/notices requests are made
+  one after another, each with a PROBE_TIMEOUT second timeout
+
+Reported per mode: probe successes, p50/p99 latency, how many of the slow
+connections the worker kept open, and the worker's RSS. Under gthread the
+first few slow clients pin every thread and the probes time out; under
+cooperative.CooperativeWorker they are greenlets and the probes are served.
+"""
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBES = 50
+PROBE_TIMEOUT = 5
+UPLOAD_SIZE = 256 * 1024
+TRICKLE = 1024
+MODES = {
+    'gthread': ['-k', 'gthread'],
+    'cooperative': ['-k', 'cooperative.CooperativeWorker'],
+}
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(port):
+    for _ in range(100):
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/api/notices', timeout=2):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError('server did not start')
+
+
+def worker_rss_kb(master_pid):
+    total = 0
+    for pid in filter(str.isdigit, os.listdir('/proc')):
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                if int(f.read().rsplit(')', 1)[1].split()[1]) != master_pid:
+                    continue
+            with open(f'/proc/{pid}/status') as f:
+                total += next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+        except (OSError, StopIteration, ValueError):
+            continue
+    return total
+
+
+def open_idle(port):
+    sock = socket.create_connection(('127.0.0.1', port))
+    sock.sendall(b'GET /api/notices HTTP/1.1\r\nHost: localhost\r\n')
+    return sock
+
+
+def open_upload(port):
+    sock = socket.create_connection(('127.0.0.1', port))
+    sock.sendall(b'POST /register HTTP/1.1\r\nHost: localhost\r\n'
+                 b'Content-Type: multipart/form-data; boundary=x\r\n'
+                 + f'Content-Length: {UPLOAD_SIZE}\r\n\r\n'.encode()
+                 + b'--x\r\nContent-Disposition: form-data; name="teamName"\r\n\r\n')
+    return sock
+
+
+def still_open(sock):
+    # Open means nothing readable yet: no response and no FIN from the server
+    sock.setblocking(False)
+    try:
+        sock.recv(1)
+    except BlockingIOError:
+        return True
+    except OSError:
+        pass
+    return False
+
+
+def probe(port):
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/api/notices', timeout=PROBE_TIMEOUT) as response:
+            response.read()
+        return time.perf_counter() - start
+    except OSError:
+        return None
+
+
+def measure(args, idle, uploads):
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_PATH=os.path.join(tmp, 'bench.db'), METRICS_DIR=os.path.join(tmp, 'metrics'))
+        server = subprocess.Popen(
+            ['gunicorn', '--chdir', ROOT, 'app:app', *args, '--workers', '1', '--threads', '4',
+             '--worker-connections', str(idle + uploads + 100), '--backlog', '4096',
+             '--timeout', '120', '--bind', f'127.0.0.1:{port}'],
+            env=env, cwd=tmp, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        slow = []
+        try:
+            wait_ready(port)
+            rss_before = worker_rss_kb(server.pid)
+            for _ in range(idle):
+                slow.append(open_idle(port))
+            sent = 0
+            for _ in range(uploads):
+                slow.append(open_upload(port))
+            time.sleep(1)
+
+            latencies = []
+            next_trickle = time.monotonic()
+            for _ in range(PROBES):
+                if time.monotonic() >= next_trickle and sent + TRICKLE < UPLOAD_SIZE // 2:
+                    for sock in slow[idle:]:
+                        try:
+                            sock.sendall(b'a' * TRICKLE)
+                        except OSError:
+                            pass
+                    sent += TRICKLE
+                    next_trickle = time.monotonic() + 1
+                latencies.append(probe(port))
+            served = sorted(latency for latency in latencies if latency is not None)
+            return {
+                'probes_ok': len(served),
+                'probes_failed': len(latencies) - len(served),
+                'p50_ms': round(served[len(served) // 2] * 1000, 1) if served else None,
+                'p99_ms': round(served[max(int(len(served) * 0.99) - 1, 0)] * 1000, 1) if served else None,
+                'slow_connections_open': sum(1 for sock in slow if still_open(sock)),
+                'worker_rss_mb': {'before': round(rss_before / 1024, 1),
+                                  'loaded': round(worker_rss_kb(server.pid) / 1024, 1)},
+            }
+        finally:
+            for sock in slow:
+                sock.close()
+            server.terminate()
+            server.wait()
+
+
+def main():
+    idle = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    uploads = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, max(soft, 2 * (idle + uploads) + 1024)), hard))
+    results = {'idle_connections': idle, 'slow_uploads': uploads, 'probes': PROBES}
+    for name, args in MODES.items():
+        results[name] = measure(args, idle, uploads)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
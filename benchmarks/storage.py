@@ -0,0 +1,99 @@
+"""Upload and download cost per storage backend.
+
+Usage: python benchmarks/storage.py [size_mb] [files]
+
+Uploads `files` documents of `size_mb` MB through POST /admin/upload-document
+on the test client and downloads each one back, with the local backend and,
+when S3_ENDPOINT_URL or S3_BUCKET is set, the S3 backend (run a stand-in
+with `moto_server -p 5055` or MinIO and export S3_ENDPOINT_URL, S3_BUCKET,
+AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY; the bucket is created if
+missing). Each backend runs in its own process. S3 downloads are measured
+twice: streamed through the worker (S3_PRESIGN_EXPIRES=0) and as the
+pre-signed redirect alone, which is all the worker does in production.
+
+Reported per backend: mean upload/download ms, and the peak Python heap
+(tracemalloc) during an upload, which stays far below the file size
+because uploads are streamed from a temp file in parts.
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from werkzeug.test import EnvironBuilder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(size_mb, files):
+    tmp = tempfile.mkdtemp()
+    os.environ.update(DATABASE_PATH=os.path.join(tmp, 'bench.db'), METRICS_DIR=os.path.join(tmp, 'metrics'))
+    os.chdir(tmp)
+    sys.path.insert(0, ROOT)
+    import app
+    if app.STORAGE_BACKEND == 's3':
+        try:
+            app.blob_storage.client.create_bucket(Bucket=app.S3_BUCKET)
+        except app.blob_storage._client_error:
+            pass  # Already there
+    app.init_db()
+    client = app.app.test_client()
+    client.post('/admin/login', json={'username': app.ADMIN_USERNAME, 'password': app.ADMIN_PASSWORD})
+
+    uploads, downloads, redirects, peaks = [], [], [], []
+    for i in range(files):
+        data = os.urandom(size_mb * 1024 * 1024)
+        # Encode the request body before tracing so only what the app allocates is counted
+        builder = EnvironBuilder(path='/admin/upload-document', method='POST',
+                                 data={'title': f'Doc {i}', 'file': (io.BytesIO(data), f'doc{i}.pdf')})
+        environ = builder.get_environ()
+        builder.close()
+        tracemalloc.start()
+        start = time.perf_counter()
+        client.open(environ)
+        uploads.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        doc_id = app._connect().execute('SELECT MAX(id) FROM documents').fetchone()[0]
+
+        start = time.perf_counter()
+        response = client.get(f'/download/document/{doc_id}')
+        if response.status_code == 302:
+            redirects.append(time.perf_counter() - start)
+            app.S3_PRESIGN_EXPIRES, expires = 0, app.S3_PRESIGN_EXPIRES
+            start = time.perf_counter()
+            response = client.get(f'/download/document/{doc_id}')
+            app.S3_PRESIGN_EXPIRES = expires
+        assert response.data == data
+        downloads.append(time.perf_counter() - start)
+
+    mean_ms = lambda values: round(sum(values) / len(values) * 1000, 1) if values else None
+    return {'upload_ms': mean_ms(uploads), 'download_streamed_ms': mean_ms(downloads),
+            'download_redirect_ms': mean_ms(redirects),
+            'upload_peak_heap_mb': round(max(peaks) / 2**20, 2)}
+
+
+def main():
+    if sys.argv[1:2] == ['--child']:
+        print(json.dumps(run(int(sys.argv[2]), int(sys.argv[3]))))
+        return
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    results = {'size_mb': size_mb, 'files': files}
+    backends = ['local']
+    if os.environ.get('S3_ENDPOINT_URL') or os.environ.get('S3_BUCKET'):
+        backends.append('s3')
+    for backend in backends:
+        env = dict(os.environ, STORAGE_BACKEND=backend, S3_BUCKET=os.environ.get('S3_BUCKET', 'bench'))
+        output = subprocess.run([sys.executable, __file__, '--child', str(size_mb), str(files)], env=env,
+                                check=True, capture_output=True, text=True).stdout
+        results[backend] = json.loads(output.splitlines()[-1])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Throughput and latency of a registration burst, with and without group commit.
+
+Usage: python benchmarks/write_burst.py [requests] [concurrency]
+
+Each mode runs the app in a fresh threaded server process on an empty
+database and fires the burst at it over HTTP. A few duplicate emails are
+mixed in to check they are still reported to the right request.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+DUPLICATES = 10
+
+SERVER = '''
+import sys; sys.path.insert(0, {root!r})
+from werkzeug.serving import ThreadedWSGIServer, make_server
+import app
+app.init_db()
+ThreadedWSGIServer.request_queue_size = 1024  # Keep the burst from overflowing the listen backlog
+server = make_server('127.0.0.1', 0, app.app, threaded=True)
+print(server.server_port, flush=True)
+server.serve_forever()
+'''
+
+
+def register(port, i):
+    # The last DUPLICATES requests reuse earlier emails
+    email = f'leader{i % (REQUESTS - DUPLICATES)}@example.com'
+    body = json.dumps({'teamName': f'Team {i}', 'leaderName': f'Leader {i}', 'email': email,
+                       'university': 'Pokhara University', 'theme': 'fintech'}).encode()
+    req = urllib.request.Request(f'http://127.0.0.1:{port}/register', data=body,
+                                 headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=60) as response:
+        result = json.loads(response.read())
+    return time.perf_counter() - start, result['success']
+
+
+def measure(window_ms, requests, concurrency):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, DATABASE_PATH=os.path.join(tmp, 'bench.db'), WRITE_BATCH_WINDOW_MS=str(window_ms))
+        server = subprocess.Popen([sys.executable, '-c', SERVER.format(root=ROOT)], env=env, cwd=tmp,
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        try:
+            port = int(server.stdout.readline())
+            start_gate = threading.Barrier(concurrency)
+
+            def task(i):
+                if i < concurrency:
+                    start_gate.wait()
+                return register(port, i)
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(concurrency) as pool:
+                results = list(pool.map(task, range(requests)))
+            elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+    latencies = sorted(latency for latency, _ in results)
+    return {
+        'ok': sum(1 for _, success in results if success),
+        'rejected': sum(1 for _, success in results if not success),
+        'seconds': round(elapsed, 3),
+        'requests_per_second': round(requests / elapsed, 1),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 1),
+        'p99_ms': round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 1),
+    }
+
+
+def main():
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    results = {'requests': REQUESTS, 'concurrency': concurrency, 'duplicate_emails': DUPLICATES}
+    for label, window_ms in (('per_request', 0), ('group_commit', 2)):
+        results[label] = measure(window_ms, REQUESTS, concurrency)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""Build fingerprinted, minified and precompressed copies of the files in static/.
+
+Usage: python build_assets.py [--check]
+
+Writes static/dist/<name>.<hash>.<ext>, a .gz sibling for text assets (and
+a .br one when the brotli package is installed) and static/dist/manifest.json.
+app.py resolves url_for('static', ...) through the manifest and serves the
+hashed files with year-long immutable caching. --check exits with status 1
+when static/dist is out of date with the sources.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST = os.path.join(DIST_DIR, 'manifest.json')
+COMPRESSIBLE = ('.css', '.js', '.svg', '.json', '.txt')
+
+CSS_STRING = re.compile(r'''("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')''')
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+
+
+def minify_css(text):
+    # Split out string literals so only the code between them is touched
+    parts = CSS_STRING.split(text)
+    for i in range(0, len(parts), 2):
+        code = CSS_COMMENT.sub('', parts[i])
+        code = re.sub(r'\s+', ' ', code)
+        code = re.sub(r' ?([{};,>]) ?', r'\1', code)
+        code = re.sub(r': ', ':', code)
+        parts[i] = code.replace(';}', '}')
+    return ''.join(parts).strip()
+
+
+def minify_js(text):
+    # Line-preserving on purpose: no tokenizer here, so never join lines
+    # (automatic semicolon insertion) or touch anything inside a line.
+    lines = []
+    in_comment = False
+    for line in text.splitlines():
+        line = line.strip()
+        if in_comment:
+            in_comment = '*/' not in line
+            continue
+        if line.startswith('/*'):
+            in_comment = '*/' not in line
+            continue
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def sources():
+    for name in sorted(os.listdir(STATIC_DIR)):
+        if os.path.isfile(os.path.join(STATIC_DIR, name)) and not name.startswith('.'):
+            yield name
+
+
+def build(write=True):
+    """Return the manifest for the current sources, writing static/dist when asked."""
+    manifest = {}
+    if write:
+        os.makedirs(DIST_DIR, exist_ok=True)
+    for name in sources():
+        with open(os.path.join(STATIC_DIR, name), 'rb') as f:
+            source = f.read()
+        stem, ext = os.path.splitext(name)
+        output = source
+        if ext in MINIFIERS:
+            output = MINIFIERS[ext](source.decode('utf-8')).encode('utf-8')
+        built = f"{stem}.{hashlib.sha256(output).hexdigest()[:10]}{ext}"
+        variants = {'': output}
+        if ext in COMPRESSIBLE:
+            variants['.gz'] = gzip.compress(output, compresslevel=9, mtime=0)
+            if brotli is not None:
+                variants['.br'] = brotli.compress(output, quality=11)
+        encodings = []
+        for suffix, data in variants.items():
+            if suffix and len(data) >= len(output):
+                continue
+            if suffix:
+                encodings.append({'.gz': 'gzip', '.br': 'br'}[suffix])
+            if write:
+                with open(os.path.join(DIST_DIR, built + suffix), 'wb') as f:
+                    f.write(data)
+        manifest[name] = {
+            'path': 'dist/' + built,
+            'source': hashlib.sha256(source).hexdigest(),
+            'encodings': encodings,
+            'size': len(source),
+            'built_size': len(output),
+        }
+    if write:
+        keep = {'manifest.json'}
+        for entry in manifest.values():
+            built = entry['path'][len('dist/'):]
+            keep.add(built)
+            keep.update(built + {'gzip': '.gz', 'br': '.br'}[encoding] for encoding in entry['encodings'])
+        for name in os.listdir(DIST_DIR):
+            if name not in keep:
+                os.remove(os.path.join(DIST_DIR, name))
+        with open(MANIFEST, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write('\n')
+    return manifest
+
+
+def main():
+    if '--check' in sys.argv[1:]:
+        try:
+            with open(MANIFEST) as f:
+                current = json.load(f)
+        except (OSError, ValueError):
+            current = {}
+        expected = build(write=False)
+        stale = sorted(name for name in expected.keys() | current.keys()
+                       if expected.get(name, {}).get('path') != current.get(name, {}).get('path'))
+        if stale:
+            print('static/dist is out of date: ' + ', '.join(stale) + ' (run python build_assets.py)')
+            sys.exit(1)
+        print('static/dist is up to date')
+        return
+    manifest = build()
+    for name, entry in manifest.items():
+        print(f"{name} -> {entry['path']} ({entry['size']} -> {entry['built_size']} bytes"
+              + (f", {'/'.join(entry['encodings'])}" if entry['encodings'] else '') + ')')
+
+
+if __name__ == '__main__':
+    main()
@@ -57,6 +57,14 @@ else
     echo "  ⚠️  Might not use PORT env"
 fi
 
+echo ""
+echo "🎨 Static Assets:"
+if python3 build_assets.py --check > /dev/null 2>&1; then
+    echo "  ✅ static/dist matches static/"
+else
+    echo "  ⚠️  static/dist is stale - run: python build_assets.py"
+fi
+
 echo ""
 echo "📞 Phone Field Check:"
 if grep -q "phone" app.py; then
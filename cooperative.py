@@ -0,0 +1,164 @@
+"""Cooperative gunicorn worker: a greenlet per connection, a bounded thread pool for the app.
+
+Usage:
+    gunicorn app:app -k cooperative.CooperativeWorker --workers 2 --threads 16 \
+        --worker-connections 2000 --timeout 120 --bind 0.0.0.0:$PORT
+
+With the default gthread worker every connection that is still sending
+headers or a body, or still receiving a download, holds one of the
+worker's threads, so a handful of slow phones can take the site down.
+Here each connection is a greenlet that costs a few KB while it waits:
+
+- the request body is read by the greenlet into a SpooledTemporaryFile
+  (memory up to SPOOL_MAX_MEMORY, then disk) before any thread is taken,
+  so a slow upload never pins a handler thread;
+- the Flask app (SQLite, file reads, the write batcher) then runs on one
+  of --threads real threads, exactly as under gthread;
+- the response body is pulled from the app on the pool in chunks of up to
+  OFFLOAD_CHUNK bytes and written to the client by the greenlet, so a slow
+  download holds a thread only while a chunk is being read.
+
+Views that stream for a long time without touching SQLite (/api/events)
+set environ['cooperative.greenlet_stream'] so their body is iterated by
+the greenlet and the stream holds no thread at all. Views can check
+environ['cooperative.enabled'] to know they are running under this worker.
+
+Only sockets, select, time and friends are monkey-patched; threading is
+left alone so the app's background threads and locks stay native.
+"""
+import os
+import tempfile
+
+from gevent import monkey, socket
+from gevent.threadpool import ThreadPool
+from gunicorn.workers.ggevent import GeventWorker
+
+SPOOL_MAX_MEMORY = int(os.environ.get('SPOOL_MAX_MEMORY', str(256 * 1024)))
+OFFLOAD_CHUNK = 64 * 1024
+READ_SIZE = 64 * 1024
+
+
+def _plain_response(start_response, status, message):
+    body = message.encode('utf-8')
+    start_response(status, [('Content-Type', 'text/plain; charset=utf-8'),
+                            ('Content-Length', str(len(body))), ('Connection', 'close')])
+    return [body]
+
+
+def _take(chunks):
+    """Pull chunks until OFFLOAD_CHUNK bytes are buffered; return (batch, exhausted)."""
+    batch, size = [], 0
+    for chunk in chunks:
+        batch.append(chunk)
+        size += len(chunk)
+        if size >= OFFLOAD_CHUNK:
+            return batch, False
+    return batch, True
+
+
+class OffloadMiddleware:
+    """Spool the request body in the greenlet, run the app on a bounded thread pool."""
+
+    def __init__(self, app, threads, max_body=None):
+        self.app = app
+        self.max_body = max_body
+        self.pool = ThreadPool(threads)
+
+    def _spool(self, environ):
+        # Returns an error (status, message) or None once wsgi.input is a local file
+        length = environ.get('CONTENT_LENGTH')
+        chunked = 'chunked' in environ.get('HTTP_TRANSFER_ENCODING', '').lower()
+        try:
+            length = int(length) if length else 0
+        except ValueError:
+            return '400 Bad Request', 'Invalid Content-Length'
+        if not length and not chunked:
+            return None
+        if self.max_body is not None and length > self.max_body:
+            return '413 Request Entity Too Large', 'Request body too large'
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+        stream = environ['wsgi.input']
+        received = 0
+        while True:
+            data = stream.read(READ_SIZE)
+            if not data:
+                break
+            received += len(data)
+            if self.max_body is not None and received > self.max_body:
+                spool.close()
+                return '413 Request Entity Too Large', 'Request body too large'
+            spool.write(data)
+        spool.seek(0)
+        environ['wsgi.input'] = spool
+        environ['wsgi.input_terminated'] = True
+        environ['CONTENT_LENGTH'] = str(received)
+        environ.pop('HTTP_TRANSFER_ENCODING', None)
+        return None
+
+    def _start(self, environ):
+        # Runs on the pool: call the app and, unless it asked to stream from the greenlet, pull the first chunk
+        started = []
+        written = []
+
+        def start_response(status, headers, exc_info=None):
+            started[:] = [status, headers]
+            return written.append
+
+        result = self.app(environ, start_response)
+        if environ.get('cooperative.greenlet_stream'):
+            return result, started, written, False
+        try:
+            batch, exhausted = _take(iter(result))
+        except BaseException:
+            if hasattr(result, 'close'):
+                result.close()
+            raise
+        if exhausted and hasattr(result, 'close'):
+            result.close()
+        return result, started, written + batch, exhausted
+
+    def __call__(self, environ, start_response):
+        environ['cooperative.enabled'] = True
+        error = self._spool(environ)
+        if error:
+            return _plain_response(start_response, *error)
+        try:
+            result, started, batch, exhausted = self.pool.apply(self._start, (environ,))
+        finally:
+            if hasattr(environ['wsgi.input'], 'rollover'):
+                # The app has parsed the form by now; drop the spool as early as possible
+                environ['wsgi.input'].close()
+        start_response(*started)
+        if exhausted:
+            return batch
+        if environ.get('cooperative.greenlet_stream'):
+            return result
+        return self._drain(result, batch)
+
+    def _drain(self, result, batch):
+        chunks = iter(result)
+        try:
+            exhausted = False
+            while True:
+                yield from batch
+                if exhausted:
+                    break
+                batch, exhausted = self.pool.apply(_take, (chunks,))
+        finally:
+            if hasattr(result, 'close'):
+                self.pool.apply(result.close)
+
+
+class CooperativeWorker(GeventWorker):
+    """GeventWorker that keeps native threads and hands requests to OffloadMiddleware."""
+
+    def patch(self):
+        # thread=False: the handler pool and the app's background threads stay real threads
+        monkey.patch_all(thread=False)
+        self.sockets = [socket.socket(s.FAMILY, socket.SOCK_STREAM, fileno=s.sock.detach())
+                        for s in self.sockets]
+
+    def load_wsgi(self):
+        super().load_wsgi()
+        config = getattr(self.wsgi, 'config', {})
+        self.wsgi = OffloadMiddleware(self.wsgi, max(self.cfg.threads, 1), config.get('MAX_CONTENT_LENGTH'))
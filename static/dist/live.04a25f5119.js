@@ -0,0 +1,88 @@
+async function updateLiveStats() {
+try {
+const response = await fetch('/api/live-stats');
+renderStats(await response.json());
+} catch (error) {
+console.error('Failed to update stats:', error);
+}
+}
+function renderStats(stats) {
+document.getElementById('liveRegistrations').textContent = stats.total_registrations;
+const statusElement = document.getElementById('eventStatus');
+if (stats.total_registrations > 50) {
+statusElement.textContent = 'Almost Full!';
+statusElement.style.color = '#f59e0b';
+}
+}
+function updateCountdown() {
+const eventDate = new Date('2024-12-31T18:00:00').getTime();
+const now = new Date().getTime();
+const timeLeft = eventDate - now;
+if (timeLeft > 0) {
+const days = Math.floor(timeLeft / (1000 * 60 * 60 * 24));
+const hours = Math.floor((timeLeft % (1000 * 60 * 60 * 24)) / (1000 * 60 * 60));
+const minutes = Math.floor((timeLeft % (1000 * 60 * 60)) / (1000 * 60));
+const seconds = Math.floor((timeLeft % (1000 * 60)) / 1000);
+document.getElementById('days').textContent = days;
+document.getElementById('hours').textContent = hours.toString().padStart(2, '0');
+document.getElementById('minutes').textContent = minutes.toString().padStart(2, '0');
+document.getElementById('seconds').textContent = seconds.toString().padStart(2, '0');
+} else {
+document.getElementById('timeRemaining').textContent = 'Event Started!';
+document.getElementById('countdown').style.display = 'none';
+document.getElementById('eventStatus').textContent = 'In Progress';
+document.getElementById('eventStatus').style.color = '#10b981';
+}
+}
+async function loadAnnouncements() {
+try {
+const response = await fetch('/api/announcements');
+const announcements = await response.json();
+const container = document.getElementById('announcements');
+container.innerHTML = '';
+announcements.forEach(announcement => {
+const announcementElement = document.createElement('div');
+announcementElement.className = 'announcement';
+announcementElement.innerHTML = `
+<div class="announcement-time">
+<i class="far fa-clock"></i>
+${new Date(announcement.created_at).toLocaleString()}
+</div>
+<div class="announcement-content">
+<h3>${announcement.title}</h3>
+<p>${announcement.content}</p>
+</div>
+`;
+container.appendChild(announcementElement);
+});
+} catch (error) {
+console.error('Failed to load announcements:', error);
+}
+}
+let pollTimers = [];
+function startPolling() {
+if (pollTimers.length) return;
+pollTimers.push(setInterval(updateLiveStats, 30000));
+pollTimers.push(setInterval(loadAnnouncements, 60000)); // Refresh announcements every minute
+}
+function connectLiveEvents() {
+if (!window.EventSource) {
+startPolling();
+return;
+}
+const source = new EventSource('/api/events');
+source.addEventListener('announcement', loadAnnouncements);
+source.addEventListener('stats', event => renderStats(JSON.parse(event.data)));
+source.addEventListener('reset', () => {
+loadAnnouncements();
+updateLiveStats();
+});
+source.onerror = () => {
+if (source.readyState === EventSource.CLOSED) startPolling();
+};
+}
+setInterval(updateCountdown, 1000);
+updateLiveStats();
+updateCountdown();
+loadAnnouncements();
+connectLiveEvents();
@@ -0,0 +1,55 @@
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+anchor.addEventListener('click', function (e) {
+e.preventDefault();
+const targetId = this.getAttribute('href');
+if(targetId === '#') return;
+const targetElement = document.querySelector(targetId);
+if(targetElement) {
+window.scrollTo({
+top: targetElement.offsetTop - 80,
+behavior: 'smooth'
+});
+}
+});
+});
+const observerOptions = {
+root: null,
+rootMargin: '0px',
+threshold: 0.1
+};
+const observer = new IntersectionObserver((entries) => {
+entries.forEach(entry => {
+if (entry.isIntersecting) {
+entry.target.classList.add('animate-in');
+}
+});
+}, observerOptions);
+document.querySelectorAll('section').forEach(section => {
+observer.observe(section);
+});
+function updateCountdown() {
+const nowDate = new Date();
+const currentYear = nowDate.getFullYear();
+const jan15ThisYear = new Date(currentYear, 0, 15, 9, 0, 0); // Month is 0-indexed (0 = January)
+const eventDateObj = (nowDate <= jan15ThisYear) ? jan15ThisYear : new Date(currentYear + 1, 0, 15, 9, 0, 0);
+const eventDate = eventDateObj.getTime();
+const now = nowDate.getTime();
+const timeLeft = eventDate - now;
+if (timeLeft > 0) {
+const days = Math.floor(timeLeft / (1000 * 60 * 60 * 24));
+const hours = Math.floor((timeLeft % (1000 * 60 * 60 * 24)) / (1000 * 60 * 60));
+const minutes = Math.floor((timeLeft % (1000 * 60 * 60)) / (1000 * 60));
+const seconds = Math.floor((timeLeft % (1000 * 60)) / 1000);
+document.getElementById('days').textContent = days.toString().padStart(2, '0');
+document.getElementById('hours').textContent = hours.toString().padStart(2, '0');
+document.getElementById('minutes').textContent = minutes.toString().padStart(2, '0');
+document.getElementById('seconds').textContent = seconds.toString().padStart(2, '0');
+} else {
+document.getElementById('days').textContent = '00';
+document.getElementById('hours').textContent = '00';
+document.getElementById('minutes').textContent = '00';
+document.getElementById('seconds').textContent = '00';
+}
+}
+setInterval(updateCountdown, 1000);
+updateCountdown();
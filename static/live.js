@@ -1,20 +1,23 @@
 async function updateLiveStats() {
     try {
-        const response = await fetch('/registrations');
-        const registrations = await response.json();
-        document.getElementById('liveRegistrations').textContent = registrations.length;
-        
-        // Update event status based on registrations
-        const statusElement = document.getElementById('eventStatus');
-        if (registrations.length > 50) {
-            statusElement.textContent = 'Almost Full!';
-            statusElement.style.color = '#f59e0b';
-        }
+        const response = await fetch('/api/live-stats');
+        renderStats(await response.json());
     } catch (error) {
         console.error('Failed to update stats:', error);
     }
 }
 
+function renderStats(stats) {
+    document.getElementById('liveRegistrations').textContent = stats.total_registrations;
+    
+    // Update event status based on registrations
+    const statusElement = document.getElementById('eventStatus');
+    if (stats.total_registrations > 50) {
+        statusElement.textContent = 'Almost Full!';
+        statusElement.style.color = '#f59e0b';
+    }
+}
+
 function updateCountdown() {
     const eventDate = new Date('2024-12-31T18:00:00').getTime();
     const now = new Date().getTime();
@@ -66,12 +69,37 @@ async function loadAnnouncements() {
     }
 }
 
-// Update stats every 30 seconds
-setInterval(updateLiveStats, 30000);
+// Push updates over Server-Sent Events; fall back to polling if the stream is unavailable
+let pollTimers = [];
+
+function startPolling() {
+    if (pollTimers.length) return;
+    pollTimers.push(setInterval(updateLiveStats, 30000));
+    pollTimers.push(setInterval(loadAnnouncements, 60000)); // Refresh announcements every minute
+}
+
+function connectLiveEvents() {
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    const source = new EventSource('/api/events');
+    source.addEventListener('announcement', loadAnnouncements);
+    source.addEventListener('stats', event => renderStats(JSON.parse(event.data)));
+    source.addEventListener('reset', () => {
+        loadAnnouncements();
+        updateLiveStats();
+    });
+    source.onerror = () => {
+        // EventSource reconnects by itself (sending Last-Event-ID) unless the server refused it
+        if (source.readyState === EventSource.CLOSED) startPolling();
+    };
+}
+
 setInterval(updateCountdown, 1000);
-setInterval(loadAnnouncements, 60000); // Refresh announcements every minute
 
 // Initial load
 updateLiveStats();
 updateCountdown();
-loadAnnouncements();
\ No newline at end of file
+loadAnnouncements();
+connectLiveEvents();
@@ -0,0 +1,47 @@
+"""POST /admin/bulk-delete/<kind> accepts only a JSON list of integer ids."""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_PATH', str(tmp_path / 'test.db'))
+    monkeypatch.setenv('METRICS_DIR', str(tmp_path / 'metrics'))
+    monkeypatch.setenv('FAST_START', '1')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(ROOT)
+    sys.modules.pop('app', None)
+    import app
+    app.init_db()
+    conn = app._connect()
+    conn.executemany('INSERT INTO registrations (team_name, leader_name, email, university, theme) VALUES (?, ?, ?, ?, ?)',
+                     [(f'Team {i}', 'Leader', f'leader{i}@example.com', 'PU', 'fintech') for i in range(1, 9)])
+    conn.commit()
+    conn.close()
+    client = app.app.test_client()
+    client.post('/admin/login', json={'username': app.ADMIN_USERNAME, 'password': app.ADMIN_PASSWORD})
+    client.remaining = lambda: [row[0] for row in app._connect().execute('SELECT id FROM registrations ORDER BY id')]
+    return client
+
+
+def test_deletes_listed_ids(client):
+    response = client.post('/admin/bulk-delete/registrations', json={'ids': [2, 3, 3]})
+    assert response.status_code == 200
+    assert client.remaining() == [1, 4, 5, 6, 7, 8]
+
+
+@pytest.mark.parametrize('ids', ['4567', [True], [1, '2'], [1.0], {'1': 1}, None])
+def test_rejects_anything_but_a_list_of_integers(client, ids):
+    response = client.post('/admin/bulk-delete/registrations', json={'ids': ids})
+    assert response.status_code == 400
+    assert client.remaining() == list(range(1, 9))
+
+
+def test_rejects_a_body_that_is_not_an_object(client):
+    response = client.post('/admin/bulk-delete/registrations', json=[1, 2])
+    assert response.status_code == 400
+    assert client.remaining() == list(range(1, 9))